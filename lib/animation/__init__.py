@@ -1,9 +1,11 @@
 from .enums import *
 from .manager import *
+from .bbox import *
 from .base import *
 from .base_easing import *
 from .base_figure import *
 from .base_linear import *
+from .batch import *
 from .line import *
 from .parallel import *
 from .rectangle import *
@@ -1,7 +1,9 @@
 import numpy as np
 from abc import ABC, abstractmethod
+from typing import Callable, Optional, Sequence
 
 from .enums import State, RepeatMode
+from .bbox import FULL_BBOX, bbox_union
 
 
 class BaseAnimation(ABC):
@@ -23,7 +25,8 @@ class BaseAnimation(ABC):
 
     Implementing abstract methods `_draw` and `_phi` allows creating
     nearly any desired animation. Then `advance` method can be used
-    to display animation frame by frame.
+    to display animation frame by frame. Overriding `_bbox` allows
+    the animation manager to redraw only the changed image regions.
 
         (*)  See details in `_phi` method docstring.
         (**) See details in `_draw` method docstring.
@@ -59,7 +62,10 @@ class BaseAnimation(ABC):
         self._state = State.READY
         self._start_time = None
         self._time = None
+        self._frame_phi = None  # Phi value of the last advanced frame
+        self._prev_phi = None   # Phi value of the frame advanced before the last one
         self._reversed = False
+        self._callback = None
 
     @abstractmethod
     def _draw(self, phi: float, img: np.ndarray):
@@ -104,6 +110,61 @@ class BaseAnimation(ABC):
         """
         pass
 
+    def _bbox(self, phi: float) -> Optional[tuple]:
+        """
+        Bounding box of the frame generated from phi value.
+
+        The default implementation covers the whole image.
+
+        Args:
+            phi (float): Phi value.
+                0 corresponds to animation start.
+                1 corresponds to animation finish.
+
+        Returns:
+            :obj:`tuple`, optional: (x_from, y_from, x_to, y_to) bounding box,
+                `to` coordinates are exclusive. None if nothing is drawn.
+
+        """
+        return FULL_BBOX
+
+    def _draw_regions(self, phi: float, img: np.ndarray, regions: Sequence[tuple]):
+        """
+        Generate frame from phi value, only the pixels inside
+        the regions have to be correct.
+
+        The default implementation draws the whole frame.
+
+        Args:
+            phi (float): Phi value.
+                0 corresponds to animation start.
+                1 corresponds to animation finish.
+            img (np.ndarray): Image to draw on.
+            regions (:obj:`Sequence` of :obj:`tuple`): Non-empty
+                (x_from, y_from, x_to, y_to) bounding boxes.
+
+        """
+        self._draw(phi, img)
+
+    def _changed_bbox(self, phi_from: Optional[float], phi_to: float) -> Optional[tuple]:
+        """
+        Bounding box of the pixels that differ between two frames.
+
+        The default implementation is the union of the frame bounding boxes.
+
+        Args:
+            phi_from (:obj:`float`, optional): Phi value of the first frame,
+                None if nothing was drawn.
+            phi_to (float): Phi value of the second frame.
+
+        Returns:
+            :obj:`tuple`, optional: (x_from, y_from, x_to, y_to) bounding box,
+                `to` coordinates are exclusive. None if nothing has changed.
+
+        """
+        return bbox_union(None if phi_from is None else self._bbox(phi_from),
+                          self._bbox(phi_to))
+
     def _theta(self, dt: int) -> int:
         """
         Process time according to repeat mode.
@@ -142,7 +203,7 @@ class BaseAnimation(ABC):
                 dt = dt * 2
             else:
                 dt = (self._duration - dt) * 2
-        return np.clip(dt, a_min=0, a_max=self._duration).item()
+        return min(max(dt, 0), self._duration)
 
     def draw(self, dt: int, img: np.ndarray):
         """
@@ -162,14 +223,41 @@ class BaseAnimation(ABC):
             return
 
         self._draw(self._phi(self._theta(dt)), img)  # Main function A(dt)
+        self._update_state(dt)
+
+    def bbox(self, dt: int) -> Optional[tuple]:
+        """
+        Bounding box of the frame drawn by `draw`.
+
+        Args:
+            dt (int): Time since the animation start.
+                0 corresponds to start time.
+
+        Returns:
+            :obj:`tuple`, optional: (x_from, y_from, x_to, y_to) bounding box,
+                `to` coordinates are exclusive. None if nothing is drawn.
+
+        """
+        if self.disabled:
+            return None
+        return self._bbox(self._phi(self._theta(dt)))
+
+    def _update_state(self, dt: int):
+        """
+        Handle repeat modes that change the state.
+
+        Args:
+            dt (int): Time since the animation start.
+                0 corresponds to start time.
 
-        if dt > self._duration:  # Handle repeat modes that change the state
+        """
+        if dt > self._duration:
             if self._repeat == RepeatMode.ONEOFF:
-                self._state = State.DISABLED
+                self._set_state(State.DISABLED)
             elif (self._repeat == RepeatMode.RETURN or
                   self._repeat == RepeatMode.STICK or
                   self._repeat == RepeatMode.SWING):
-                self._state = State.FINISHED
+                self._set_state(State.FINISHED)
 
     def pending_advance(self, time: int) -> bool:
         """
@@ -185,13 +273,30 @@ class BaseAnimation(ABC):
         return (self._state == State.READY or
                 (self._state == State.ACTIVE and time - self._time >= self._step))
 
-    def advance(self, time: int, img: np.ndarray):
+    def next_frame_time(self) -> Optional[int]:
+        """
+        Absolute time when the next frame is ready to be displayed.
+
+        Returns:
+            :obj:`int`, optional: Absolute time, 0 if the animation has not
+                started yet, None if no more frames are expected.
+
+        """
+        if self._state == State.READY:
+            return 0
+        if self._state == State.ACTIVE:
+            return self._time + self._step
+        return None
+
+    def advance(self, time: int, img: np.ndarray = None):
         """
         Update absolute time value and redraw animation.
 
         Args:
             time (int): Absolute time.
-            img (np.ndarray): Image to draw on.
+            img (np.ndarray): Image to draw on. Defaults to None.
+                If set to None only the time is updated, use `redraw`
+                to draw the new frame.
 
         """
         if self.disabled:
@@ -199,14 +304,67 @@ class BaseAnimation(ABC):
 
         # Activate new animation
         if self._state == State.READY:
-            self._state = State.ACTIVE
+            self._set_state(State.ACTIVE)
             self._start_time = time
 
         # Update absolute time
         self._time = self._start_time + (time - self._start_time) // self._step * self._step
+        dt = time - self._start_time
+        self._prev_phi = self._frame_phi
+        self._frame_phi = self._phi(self._theta(dt))
 
         # Redraw animation
-        self.draw(time - self._start_time, img)
+        if img is None:
+            self._update_state(dt)
+        else:
+            self.draw(dt, img)
+
+    def redraw(self, img: np.ndarray, regions: Optional[Sequence[tuple]] = None):
+        """
+        Draw the last advanced frame again.
+
+        The final frame of an animation disabled by its repeat mode
+        is drawn as well.
+
+        Args:
+            img (np.ndarray): Image to draw on.
+            regions (:obj:`Sequence` of :obj:`tuple`, optional): Bounding boxes
+                of the image regions to draw. Defaults to None. If set,
+                pixels outside the regions may be left incomplete.
+
+        """
+        if self._frame_phi is None:
+            return
+        if regions is None:
+            self._draw(self._frame_phi, img)
+        else:
+            self._draw_regions(self._frame_phi, img, regions)
+
+    def frame_bbox(self) -> Optional[tuple]:
+        """
+        Bounding box of the last advanced frame.
+
+        Returns:
+            :obj:`tuple`, optional: (x_from, y_from, x_to, y_to) bounding box,
+                `to` coordinates are exclusive. None if nothing is drawn.
+
+        """
+        if self._frame_phi is None:
+            return None
+        return self._bbox(self._frame_phi)
+
+    def changed_bbox(self) -> Optional[tuple]:
+        """
+        Bounding box of the pixels changed by the last `advance`.
+
+        Returns:
+            :obj:`tuple`, optional: (x_from, y_from, x_to, y_to) bounding box,
+                `to` coordinates are exclusive. None if nothing has changed.
+
+        """
+        if self._frame_phi is None:
+            return None
+        return self._changed_bbox(self._prev_phi, self._frame_phi)
 
     def reverse(self):
         """
@@ -221,7 +379,7 @@ class BaseAnimation(ABC):
             # Change start time to match the progress of active animation
             self._start_time = self._time * 2 - self._duration - self._start_time
         else:
-            self._state = State.READY
+            self._set_state(State.READY)
 
     def reset(self):
         """
@@ -234,7 +392,7 @@ class BaseAnimation(ABC):
             return
 
         self._reversed = False
-        self._state = State.READY
+        self._set_state(State.READY)
 
     def skip(self):
         """
@@ -257,7 +415,27 @@ class BaseAnimation(ABC):
         Disable animation.
 
         """
-        self._state = State.DISABLED
+        self._frame_phi = None
+        self._prev_phi = None
+        self._set_state(State.DISABLED)
+
+    def watch(self, callback: Optional[Callable]):
+        """
+        Set a function to call on animation state changes.
+
+        Args:
+            callback (:obj:`Callable`, optional): Function called with
+                the animation as an argument. None removes the callback.
+
+        """
+        self._callback = callback
+
+    def _set_state(self, state: State):
+        if state == self._state:
+            return
+        self._state = state
+        if self._callback is not None:
+            self._callback(self)
 
     @property
     def duration(self) -> int:
@@ -305,6 +483,14 @@ class BaseAnimation(ABC):
     def repeat(self, value: RepeatMode):
         self._repeat = value
 
+    @property
+    def state(self) -> State:
+        """
+        Animation state.
+
+        """
+        return self._state
+
     @property
     def disabled(self) -> bool:
         """
@@ -1,4 +1,4 @@
-import numpy as np
+from typing import Optional
 
 from .enums import RepeatMode, EasingFunc
 from .base_easing import BaseEasingAnimation
@@ -30,10 +30,26 @@ class BaseFigureAnimation(BaseEasingAnimation):
                  duration: int, step: int = None, fps: int = None,
                  repeat = RepeatMode.ONEOFF, easing = EasingFunc.LINEAR):
         super(BaseFigureAnimation, self).__init__(duration, step, fps, repeat, easing)
-        self._from = start
-        self._to = finish
 
-    def _inter(self, phi: float) -> dict:
+        # Starting params and deltas to the final ones, deltas are None for constant params
+        p1, p2 = start["position"]
+        self._position = (p1.x, p1.y, p2.x, p2.y)
+        self._d_position = None
+        if "position" in finish:
+            q1, q2 = finish["position"]
+            self._d_position = (q1.x - p1.x, q1.y - p1.y, q2.x - p2.x, q2.y - p2.y)
+        self._color = tuple(start["color"])
+        self._d_color = None
+        if "color" in finish:
+            self._d_color = tuple(c_to - c for c, c_to in zip(start["color"], finish["color"]))
+        self._thickness = start["thickness"]
+        self._d_thickness = finish["thickness"] - start["thickness"] if "thickness" in finish else None
+
+        # The last interpolated params, static frames are drawn without recomputation
+        self._inter_phi = None
+        self._inter_params = ((p1.x, p1.y), (p2.x, p2.y), self._color, self._thickness)
+
+    def _inter(self, phi: float) -> tuple:
         """
         Interpolate between starting and final parameters.
 
@@ -45,27 +61,29 @@ class BaseFigureAnimation(BaseEasingAnimation):
                 1 corresponds to animation finish.
 
         Returns:
-            dict: Interpolated params.
+            tuple: Interpolated (p1, p2, color, thickness), where p1, p2 are
+                (x, y) tuples and color is a BGR tuple.
 
         """
-        inter = dict()
-        if "position" in self._to:
-            pos_from = self._from["position"]
-            pos_to = self._to["position"]
-            inter["position"] = ((pos_from[0] + (pos_to[0] - pos_from[0]) * phi + 0.5).int(),
-                                 (pos_from[1] + (pos_to[1] - pos_from[1]) * phi + 0.5).int())
-        elif "position" in self._from:
-            inter["position"] = self._from["position"]
-        if "color" in self._to:
-            col_from = np.array(self._from["color"])
-            col_to = np.array(self._to["color"])
-            inter["color"] = (col_from + (col_to - col_from) * phi + 0.5).astype(int).tolist()
-        elif "color" in self._from:
-            inter["color"] = self._from["color"]
-        if "thickness" in self._to:
-            thc_from = self._from["thickness"]
-            thc_to = self._to["thickness"]
-            inter["thickness"] = int(thc_from + (thc_to - thc_from) * phi + 0.5)
-        elif "thickness" in self._from:
-            inter["thickness"] = self._from["thickness"]
-        return inter
+        if phi == self._inter_phi:
+            return self._inter_params
+        p1, p2, color, thickness = self._inter_params
+        if self._d_position is not None:
+            x1, y1, x2, y2 = self._position
+            dx1, dy1, dx2, dy2 = self._d_position
+            p1 = (int(x1 + dx1 * phi + 0.5), int(y1 + dy1 * phi + 0.5))
+            p2 = (int(x2 + dx2 * phi + 0.5), int(y2 + dy2 * phi + 0.5))
+        if self._d_color is not None:
+            color = tuple(int(c + dc * phi + 0.5) for c, dc in zip(self._color, self._d_color))
+        if self._d_thickness is not None:
+            thickness = int(self._thickness + self._d_thickness * phi + 0.5)
+        self._inter_phi = phi
+        self._inter_params = (p1, p2, color, thickness)
+        return self._inter_params
+
+    def _bbox(self, phi: float) -> Optional[tuple]:
+        (x1, y1), (x2, y2), _, thickness = self._inter(phi)
+        # Half of the thickness plus anti-aliasing and rounding margin
+        margin = max(thickness, 1) // 2 + 2
+        return (min(x1, x2) - margin, min(y1, y2) - margin,
+                max(x1, x2) + margin + 1, max(y1, y2) + margin + 1)
@@ -1,5 +1,3 @@
-import numpy as np
-
 from .enums import RepeatMode
 from .base import BaseAnimation
 
@@ -27,4 +25,4 @@ class BaseLinearAnimation(BaseAnimation):
         super(BaseLinearAnimation, self).__init__(duration, step, fps, repeat)
 
     def _phi(self, dt: int) -> float:
-        return np.clip(dt / self._duration, a_min=0, a_max=1).item()
+        return min(max(dt / self._duration, 0), 1)
@@ -0,0 +1,364 @@
+import cv2
+import numpy as np
+
+from abc import abstractmethod
+from typing import Optional, Sequence
+
+from .bbox import bbox_union
+from .enums import State, RepeatMode, EasingFunc
+from .base_easing import BaseEasingAnimation, easing_table
+
+
+class BaseBatchAnimation(BaseEasingAnimation):
+    """
+    Abstract base class for animations of many OpenCV figures.
+
+    Figures share duration, repeat mode and easing, their params are stored
+    in NumPy arrays and interpolated for all figures at once. Params are
+    the same as in `BaseFigureAnimation`, each value is either an array
+    with one row per figure or a single value shared by all figures:
+        - position: (N, 2, 2) array of 2 points per figure.
+        - color: (N, 3) array or a single BGR color.
+        - thickness: (N,) array or a single thickness.
+
+    Every figure has its own start delay, so a figure can be restarted
+    with `restart` while the others keep playing. Phi is an array
+    of per-figure phi values.
+
+    Only the figures with changed phi are reported as changed, and only
+    the figures intersecting the requested regions are redrawn, so
+    the cost of a frame depends on the figures around the changes.
+    Subclasses implement `_draw_figures` instead of `_draw`.
+
+    Args:
+        start (dict): Starting params dictionary.
+        finish (dict): Final params dictionary.
+        duration (int): Animation duration in milliseconds.
+        step (int): Time interval between frames in milliseconds.
+            Defaults to None.
+        fps (int): Animation frame rate. Can be specified instead of `step`.
+            Defaults to None.
+        repeat (RepeatMode): Animation repeat mode.
+            Defaults to RepeatMode.ONEOFF. See enum class for details.
+        easing (EasingFunc): Easing function.
+            Defaults to EasingFunc.LINEAR. See enum class for details.
+
+    Raises:
+        ValueError: If `step` and `fps` are set simultaneously.
+
+    """
+
+    def __init__(self, start: dict, finish: dict,
+                 duration: int, step: int = None, fps: int = None,
+                 repeat = RepeatMode.ONEOFF, easing = EasingFunc.LINEAR):
+        super(BaseBatchAnimation, self).__init__(duration, step, fps, repeat, easing)
+        n = len(start["position"])
+        self._from = {key: _broadcast(key, value, n) for key, value in start.items()}
+        self._to = {key: _broadcast(key, value, n) for key, value in finish.items()}
+        self._delays = np.zeros(n, dtype=np.int64)  # Start delays of figures in ms
+        self._restarted = []                         # Figures to restart on the next advance
+
+        self._phi_table = easing_table(easing, self._duration).array
+
+    def __len__(self) -> int:
+        return len(self._delays)
+
+    def _theta(self, dt: int) -> np.ndarray:
+        dt = int(dt) - self._delays
+        if self._reversed:
+            dt = self._duration - dt
+
+        if self._repeat == RepeatMode.RETURN or self._repeat == RepeatMode.SWING:
+            dt = np.where(dt > self._duration, 0, dt)
+        if self._repeat == RepeatMode.STICK:
+            dt = np.where(dt < 0, self._duration, dt)
+        elif self._repeat == RepeatMode.REPEAT:
+            dt = dt % self._duration
+        elif self._repeat == RepeatMode.SWING:
+            dt = np.where(dt < self._duration / 2, dt * 2, (self._duration - dt) * 2)
+        elif self._repeat == RepeatMode.CYCLE:
+            dt = dt % self._duration
+            dt = np.where(dt < self._duration / 2, dt * 2, (self._duration - dt) * 2)
+        return np.clip(dt, 0, self._duration)
+
+    def _phi(self, dt: np.ndarray) -> np.ndarray:
+        return self._phi_table[dt]
+
+    def _update_state(self, dt: int):
+        # The animation lasts until the most delayed figure finishes
+        super(BaseBatchAnimation, self)._update_state(dt - self._delays.max(initial=0))
+
+    def _inter(self, phi: np.ndarray) -> dict:
+        """
+        Interpolate between starting and final parameters of all figures.
+
+        Use starting values for params with no final value present.
+
+        Args:
+            phi (np.ndarray): Phi values of figures.
+
+        Returns:
+            dict: Interpolated params arrays.
+
+        """
+        inter = dict()
+        for key, value in self._from.items():
+            if key in self._to:
+                shape = (-1,) + (1,) * (value.ndim - 1)
+                value = (value + (self._to[key] - value) * phi.reshape(shape) + 0.5).astype(int)
+            inter[key] = value
+        return inter
+
+    def _draw(self, phi: np.ndarray, img: np.ndarray):
+        self._draw_figures(self._inter(phi), img)
+
+    def _draw_regions(self, phi: np.ndarray, img: np.ndarray, regions: Sequence[tuple]):
+        # Figures outside the regions do not change their pixels
+        inter = self._inter(phi)
+        bboxes = self._figure_bboxes(inter)[:, None]
+        regions = np.array(regions, dtype=np.int64)
+        intersect = ((bboxes[..., 0] < regions[:, 2]) & (bboxes[..., 2] > regions[:, 0]) &
+                     (bboxes[..., 1] < regions[:, 3]) & (bboxes[..., 3] > regions[:, 1])).any(axis=1)
+        self._draw_figures({key: value[intersect] for key, value in inter.items()}, img)
+
+    @abstractmethod
+    def _draw_figures(self, inter: dict, img: np.ndarray):
+        """
+        Draw figures in the figure order.
+
+        Args:
+            inter (dict): Interpolated params of the figures to draw.
+            img (np.ndarray): Image to draw on.
+
+        """
+        pass
+
+    def _figure_bboxes(self, inter: dict) -> np.ndarray:
+        """
+        Bounding boxes of figures.
+
+        Args:
+            inter (dict): Interpolated params.
+
+        Returns:
+            np.ndarray: (N, 4) array of (x_from, y_from, x_to, y_to)
+                bounding boxes, `to` coordinates are exclusive.
+
+        """
+        position = inter["position"]
+        # Half of the thickness plus anti-aliasing and rounding margin
+        margin = np.maximum(inter["thickness"], 1) // 2 + 2
+        return np.stack((position[:, :, 0].min(axis=1) - margin,
+                         position[:, :, 1].min(axis=1) - margin,
+                         position[:, :, 0].max(axis=1) + margin + 1,
+                         position[:, :, 1].max(axis=1) + margin + 1), axis=1)
+
+    def _bbox(self, phi: np.ndarray) -> Optional[tuple]:
+        if len(self) == 0:
+            return None
+        return _bbox_union_all(self._figure_bboxes(self._inter(phi)))
+
+    def _changed_bbox(self, phi_from: Optional[np.ndarray], phi_to: np.ndarray) -> Optional[tuple]:
+        if phi_from is None:
+            return self._bbox(phi_to)
+
+        # Figures with the same phi are drawn the same
+        changed = np.flatnonzero(phi_from != phi_to)
+        if len(changed) == 0:
+            return None
+        bbox = None
+        for phi in phi_from, phi_to:
+            inter = {key: value[changed] for key, value in self._inter(phi).items()}
+            bbox = bbox_union(bbox, _bbox_union_all(self._figure_bboxes(inter)))
+        return bbox
+
+    def _styles(self, inter: dict) -> list:
+        """
+        Group figures by color and thickness.
+
+        Args:
+            inter (dict): Interpolated params.
+
+        Returns:
+            :obj:`list` of :obj:`tuple`: (color, thickness, indices) for
+                every style in the order of the first figure of the style.
+                Figure indices are sorted.
+
+        """
+        color = inter["color"]
+        thickness = inter["thickness"]
+        _, first, inverse = np.unique(self._style_keys(inter), return_index=True,
+                                      return_inverse=True)
+        styles = []
+        for style in np.argsort(first).tolist():
+            indices = np.flatnonzero(inverse == style)
+            styles.append((color[indices[0]].tolist(), thickness[indices[0]].item(), indices))
+        return styles
+
+    def _style_keys(self, inter: dict) -> np.ndarray:
+        """
+        Pack color and thickness of every figure into an integer key.
+
+        Args:
+            inter (dict): Interpolated params.
+
+        Returns:
+            np.ndarray: Style keys of figures, equal for the same style.
+
+        """
+        color = inter["color"]
+        return (((color[:, 0] * 256 + color[:, 1]) * 256 + color[:, 2]) * 65536 +
+                inter["thickness"] + 32768)
+
+    def advance(self, time: int, img: np.ndarray = None):
+        if len(self._restarted) > 0 and self._state != State.READY:
+            self._delays[self._restarted] = time - self._start_time
+        self._restarted = []
+        super(BaseBatchAnimation, self).advance(time, img)
+
+    def restart(self, indices: Sequence[int]):
+        """
+        Restart some of the figures, the others continue playing.
+
+        Figures are restarted on the next `advance`.
+
+        Args:
+            indices (:obj:`Sequence` of :obj:`int`): Indices of figures.
+
+        """
+        if self.disabled or self._state == State.READY:
+            return
+
+        self._restarted.extend(indices)
+        self._set_state(State.ACTIVE)
+
+    def reverse(self):
+        if self.disabled:
+            return
+
+        if self._state == State.ACTIVE:
+            self._delays = -self._delays  # Preserve progress of delayed figures
+        else:
+            self._delays.fill(0)
+        super(BaseBatchAnimation, self).reverse()
+
+    def reset(self):
+        self._delays.fill(0)
+        self._restarted = []
+        super(BaseBatchAnimation, self).reset()
+
+    def skip(self):
+        self._delays.fill(0)
+        super(BaseBatchAnimation, self).skip()
+
+
+class BatchRectangleAnimation(BaseBatchAnimation):
+    """
+    Many OpenCV rectangles animation.
+
+    Rectangles are drawn in the figure order, so overlapping rectangles
+    look the same as separate rectangle animations added in that order.
+    Consecutive outlines of the same style are drawn with a single
+    `cv2.polylines` call. Filled rectangles are drawn one by one, since
+    `cv2.fillPoly` leaves holes where polygons overlap.
+
+    Args:
+        start (dict): Starting params dictionary.
+        finish (dict): Final params dictionary.
+        duration (int): Animation duration in milliseconds.
+        step (int): Time interval between frames in milliseconds.
+            Defaults to None.
+        fps (int): Animation frame rate. Can be specified instead of `step`.
+            Defaults to None.
+        repeat (RepeatMode): Animation repeat mode.
+            Defaults to RepeatMode.ONEOFF. See enum class for details.
+        easing (EasingFunc): Easing function.
+            Defaults to EasingFunc.LINEAR. See enum class for details.
+
+    Raises:
+        ValueError: If `step` and `fps` are set simultaneously.
+
+    """
+
+    def __init__(self, start: dict, finish: dict,
+                 duration: int, step: int = None, fps: int = None,
+                 repeat = RepeatMode.ONEOFF, easing = EasingFunc.LINEAR):
+        super(BatchRectangleAnimation, self).__init__(start, finish, duration, step, fps, repeat, easing)
+
+    def _draw_figures(self, inter: dict, img: np.ndarray):
+        if len(inter["position"]) == 0:
+            return
+        position = inter["position"]
+        # Runs of consecutive figures of the same style
+        keys = self._style_keys(inter)
+        bounds = [0] + (np.flatnonzero(np.diff(keys)) + 1).tolist() + [len(keys)]
+        colors = inter["color"].tolist()
+        thicknesses = inter["thickness"].tolist()
+        rectangles = position.reshape(-1, 4).tolist()
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            color = colors[start]
+            thickness = thicknesses[start]
+            if thickness < 0 or stop - start == 1:
+                for x1, y1, x2, y2 in rectangles[start:stop]:
+                    cv2.rectangle(img, (x1, y1), (x2, y2), color=color, thickness=thickness)
+            else:
+                p1 = position[start:stop, 0]
+                p2 = position[start:stop, 1]
+                corners = np.stack((p1, np.stack((p2[:, 0], p1[:, 1]), axis=1),
+                                    p2, np.stack((p1[:, 0], p2[:, 1]), axis=1)), axis=1)
+                cv2.polylines(img, corners.astype(np.int32), isClosed=True,
+                              color=color, thickness=thickness)
+
+
+class BatchLineAnimation(BaseBatchAnimation):
+    """
+    Many OpenCV lines animation.
+
+    Lines of the same style are drawn with a single `cv2.polylines` call.
+    Styles are drawn in the order of their first lines.
+
+    Args:
+        start (dict): Starting params dictionary.
+        finish (dict): Final params dictionary.
+        duration (int): Animation duration in milliseconds.
+        step (int): Time interval between frames in milliseconds.
+            Defaults to None.
+        fps (int): Animation frame rate. Can be specified instead of `step`.
+            Defaults to None.
+        repeat (RepeatMode): Animation repeat mode.
+            Defaults to RepeatMode.ONEOFF. See enum class for details.
+        easing (EasingFunc): Easing function.
+            Defaults to EasingFunc.LINEAR. See enum class for details.
+        line_type (int): OpenCV line renderer. Defaults to cv2.LINE_AA.
+
+    Raises:
+        ValueError: If `step` and `fps` are set simultaneously.
+
+    """
+
+    def __init__(self, start: dict, finish: dict,
+                 duration: int, step: int = None, fps: int = None,
+                 repeat = RepeatMode.ONEOFF, easing = EasingFunc.LINEAR,
+                 line_type: int = cv2.LINE_AA):
+        super(BatchLineAnimation, self).__init__(start, finish, duration, step, fps, repeat, easing)
+        self._line_type = line_type
+
+    def _draw_figures(self, inter: dict, img: np.ndarray):
+        position = inter["position"].astype(np.int32)
+        for color, thickness, indices in self._styles(inter):
+            cv2.polylines(img, position[indices], isClosed=False,
+                          color=color, thickness=thickness, lineType=self._line_type)
+
+
+def _bbox_union_all(bboxes: np.ndarray) -> tuple:
+    # Bounding box of a non-empty (N, 4) array of bounding boxes
+    return tuple(bboxes[:, :2].min(axis=0).tolist() + bboxes[:, 2:].max(axis=0).tolist())
+
+
+def _broadcast(key: str, value, n: int) -> np.ndarray:
+    # Param array with one row per figure
+    ndim = {"position": 3, "color": 2, "thickness": 1}[key]
+    value = np.asarray(value, dtype=int)
+    if value.ndim < ndim:
+        value = np.broadcast_to(value, (n,) + value.shape)
+    return value
@@ -0,0 +1,77 @@
+from typing import Optional, Sequence
+
+
+#: Bounding box covering any image, used when the drawing area is unknown.
+FULL_BBOX = (-2 ** 31, -2 ** 31, 2 ** 31 - 1, 2 ** 31 - 1)
+
+
+def bbox_union(bbox1: Optional[tuple], bbox2: Optional[tuple]) -> Optional[tuple]:
+    """
+    Smallest bounding box containing both boxes.
+
+    Bounding boxes are (x_from, y_from, x_to, y_to) tuples,
+    `to` coordinates are exclusive. None stands for an empty box.
+
+    Args:
+        bbox1 (:obj:`tuple`, optional): First bounding box.
+        bbox2 (:obj:`tuple`, optional): Second bounding box.
+
+    Returns:
+        :obj:`tuple`, optional: Bounding box union.
+
+    """
+    if bbox1 is None:
+        return bbox2
+    if bbox2 is None:
+        return bbox1
+    return (min(bbox1[0], bbox2[0]), min(bbox1[1], bbox2[1]),
+            max(bbox1[2], bbox2[2]), max(bbox1[3], bbox2[3]))
+
+
+def bbox_clip(bbox: Optional[tuple], width: int, height: int) -> Optional[tuple]:
+    """
+    Clip bounding box to image borders.
+
+    Args:
+        bbox (:obj:`tuple`, optional): Bounding box.
+        width (int): Image width.
+        height (int): Image height.
+
+    Returns:
+        :obj:`tuple`, optional: Clipped bounding box, None if it is empty.
+
+    """
+    if bbox is None:
+        return None
+    bbox = (max(bbox[0], 0), max(bbox[1], 0),
+            min(bbox[2], width), min(bbox[3], height))
+    if bbox[0] >= bbox[2] or bbox[1] >= bbox[3]:
+        return None
+    return bbox
+
+
+def bbox_merge(bboxes: Sequence[tuple]) -> list:
+    """
+    Merge overlapping bounding boxes.
+
+    Args:
+        bboxes (:obj:`Sequence` of :obj:`tuple`): Non-empty bounding boxes.
+
+    Returns:
+        :obj:`list` of :obj:`tuple`: Bounding boxes that do not overlap.
+            Their union contains all the original boxes.
+
+    """
+    merged = []
+    for bbox in sorted(bboxes):
+        i = 0
+        while i < len(merged):
+            other = merged[i]
+            if (bbox[0] < other[2] and other[0] < bbox[2] and
+                    bbox[1] < other[3] and other[1] < bbox[3]):
+                bbox = bbox_union(bbox, merged.pop(i))
+                i = 0  # The grown box may overlap the boxes checked before
+            else:
+                i += 1
+        merged.append(bbox)
+    return merged
@@ -36,10 +36,8 @@ class LineAnimation(BaseFigureAnimation):
         self._line_type = line_type
 
     def _draw(self, phi: float, img: np.ndarray):
-        inter = self._inter(phi)
-        cv2.line(img, inter["position"][0].tuple, inter["position"][1].tuple,
-                 color=inter["color"], thickness=inter["thickness"],
-                 lineType=self._line_type)
+        p1, p2, color, thickness = self._inter(phi)
+        cv2.line(img, p1, p2, color=color, thickness=thickness, lineType=self._line_type)
 
 
 class LinePositionAnimation(LineAnimation):
@@ -1 +1,3 @@
+from .clock import *
 from .manager import *
+from .sink import *
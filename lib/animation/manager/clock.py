@@ -0,0 +1,54 @@
+from time import perf_counter_ns
+
+
+class Clock:
+    """
+    Real time clock in milliseconds.
+
+    """
+
+    def __call__(self) -> int:
+        """
+        Current absolute time.
+
+        Returns:
+            int: Time in ms.
+
+        """
+        return perf_counter_ns() // 1000000
+
+
+class VirtualClock(Clock):
+    """
+    Manually advanced clock.
+
+    Allows rendering animations faster or slower than real time,
+    e.g. at a fixed frame rate.
+
+    Args:
+        step (int): Default time increment in ms. Defaults to 16 ms.
+        start (int): Initial time in ms. Defaults to 0.
+
+    """
+
+    def __init__(self, step: int = 16, start: int = 0):
+        self._step = step
+        self._time = start
+
+    def __call__(self) -> int:
+        return self._time
+
+    def tick(self, dt: int = None) -> int:
+        """
+        Advance the clock.
+
+        Args:
+            dt (int): Time increment in ms. Defaults to None.
+                If set to None `step` is used.
+
+        Returns:
+            int: New time in ms.
+
+        """
+        self._time += self._step if dt is None else dt
+        return self._time
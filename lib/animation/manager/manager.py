@@ -1,39 +1,192 @@
-import cv2
 import numpy as np
-from time import perf_counter_ns
+from functools import partial
 from collections import defaultdict
+from typing import Hashable, Optional
+
+from .clock import Clock
+from .sink import BaseSink, WindowSink
+from ..enums import State
+from ..bbox import bbox_clip, bbox_merge
 
 
 class AnimationManager(dict):
     """
-    Manage animations inside OpenCV window.
+    Manage animations inside OpenCV window or another render sink.
+
+    The displayed frame is kept between refreshes and updated
+    incrementally: only the regions changed by the last advance of every
+    animation (see `BaseAnimation.changed_bbox`) are restored from
+    the background and redrawn. Animations intersecting these regions
+    are drawn once into a scratch canvas with the regions passed to their
+    `redraw`, then only the regions are copied to the frame.
+
+    Finished animations display a constant frame, so they are baked
+    into a cached static layer: the background with these animations
+    drawn on top. Dirty regions are restored from the static layer and
+    only the animations that are not baked are redrawn. An animation is
+    baked if its z-index is not greater than the z-index of any active
+    animation, so that static layer stays below all of them. Baked
+    animations above a newly active one are moved out of the layer.
+    Within one z-index baked animations are displayed below the active ones.
+    The layer is rebuilt when a baked animation is reset, reversed,
+    disabled, replaced or moved to another z-index.
+
+    Keys can be any hashable values, e.g. strings or tuples of ints.
+    Animations can be put into named groups to disable or iterate over
+    all animations of a group at once.
 
     Args:
-        window (str): OpenCV window name.
+        window (:obj:`str`, optional): OpenCV window name.
         img (np.ndarray): Background image.
+        sink (BaseSink): Render sink to pass frames to. Defaults to None.
+            If set to None frames are displayed in the `window`.
+        clock (Clock): Clock to measure animation time with.
+            Defaults to None. If set to None the real time is used.
 
     """
 
-    def __init__(self, window: str, img: np.ndarray):
+    def __init__(self, window: Optional[str], img: np.ndarray,
+                 sink: BaseSink = None, clock: Clock = None):
         super(AnimationManager, self).__init__()
-        self._window = window
         self._img = img
+        self._sink = WindowSink(window) if sink is None else sink
+        self._clock = Clock() if clock is None else clock
 
-        # Bidirectional dict for zindex management
+        # Bidirectional dict for zindex management,
+        # keys of the same z-index are drawn in the insertion order
         self._key2zindex = dict()
-        self._zindex2key = defaultdict(set)
+        self._zindex2key = defaultdict(dict)
+
+        # Bidirectional dict for group management
+        self._key2group = dict()
+        self._group2key = defaultdict(dict)
+
+        self._frame = None     # Displayed image
+        self._canvas = None    # Scratch image to draw dirty regions on
+        self._bboxes = dict()  # Bounding boxes of the displayed animation frames
+        self._dirty = []       # Regions to redraw on the next refresh
 
-    def __setitem__(self, key: str, animation):
+        # Static layer
+        self._static = None             # Background with baked animations
+        self._static_valid = False      # False if the layer must be rebuilt
+        self._active = defaultdict(dict)  # Keys of animations that are not baked by z-index
+        self._baked = dict()            # Keys of baked animations
+        self._baked_last = None         # Drawing order of the topmost baked animation
+        self._order = dict()            # Drawing order of animations within z-index
+        self._counter = 0               # Next drawing order value
+        self._finished = set()          # Keys of finished animations to bake
+        self._restack = False           # True if an animation may be active below baked ones
+        self._disabled = set()          # Keys of animations to remove
+
+    def __setitem__(self, key: Hashable, animation):
         """
-        Add or set animation with a given id. Z-index is set to 0.
+        Add or set animation with a given id. Z-index is set to 0,
+        the animation is removed from its group.
 
         Args:
-            key (str): Animation name used in manager.
+            key (Hashable): Animation name used in manager.
             animation (animation.BaseAnimation): Animation object.
 
         """
-        self.set_zindex(key, 0)
+        self.add(key, animation)
+
+    def add(self, key: Hashable, animation, zindex: int = 0, group: Hashable = None):
+        """
+        Add or set animation with a given id.
+
+        Args:
+            key (Hashable): Animation name used in manager.
+            animation (animation.BaseAnimation): Animation object.
+            zindex (int): Animation z-index. Defaults to 0.
+            group (Hashable): Animation group. Defaults to None.
+                If set to None the animation is not in any group.
+
+        """
+        if key in self:
+            self[key].watch(None)
+            self._unbake(key)
+            self._finished.discard(key)
+        self._dirty.append(self._bboxes.pop(key, None))
+        self.set_zindex(key, zindex)
+        self.set_group(key, group)
         super(AnimationManager, self).__setitem__(key, animation)
+        animation.watch(partial(self._state_changed, key))
+        self._state_changed(key, animation)
+
+    def _state_changed(self, key: Hashable, animation):
+        """
+        Track animation state changes.
+
+        Args:
+            key (Hashable): Animation name.
+            animation (animation.BaseAnimation): Animation object.
+
+        """
+        self._unbake(key)
+        if animation.state == State.FINISHED:
+            self._finished.add(key)
+        else:
+            self._finished.discard(key)
+            self._restack = True
+            if animation.state == State.DISABLED:
+                self._disabled.add(key)
+
+    def _unbake(self, key: Hashable):
+        """
+        Remove animation from the static layer.
+
+        Args:
+            key (Hashable): Animation name.
+
+        """
+        if key not in self._baked:
+            return
+        del self._baked[key]
+        self._active[self._key2zindex[key]][key] = None
+        self._static_valid = False
+        self._dirty.append(self._bboxes.get(key))
+        if len(self._baked) == 0:
+            self._baked_last = None
+
+    def _bake(self):
+        """
+        Add finished animations to the static layer.
+
+        Baked animations above the lowest active z-index are moved
+        out of the layer first.
+
+        """
+        self._restack = False
+        zindex_active = min((zindex for zindex, keys in self._active.items()
+                             if any(key not in self._finished for key in keys)),
+                            default=None)
+
+        # Static layer must stay below active animations
+        if (zindex_active is not None and self._baked_last is not None and
+                self._baked_last[0] > zindex_active):
+            for key in [key for key in self._baked if self._key2zindex[key] > zindex_active]:
+                self._unbake(key)
+                self._finished.add(key)
+            self._baked_last = max((self._drawing_order(key) for key in self._baked),
+                                   default=None)
+
+        keys = sorted((key for key in self._finished
+                       if zindex_active is None or self._key2zindex[key] <= zindex_active),
+                      key=self._drawing_order)
+        for key in keys:
+            order = self._drawing_order(key)
+            if self._baked_last is not None and order < self._baked_last:
+                self._static_valid = False  # Cannot draw below baked animations
+            elif self._static_valid:
+                self[key].redraw(self._static)
+            self._finished.remove(key)
+            self._dirty.append(self._bboxes.get(key))  # Now displayed below active animations
+            del self._active[order[0]][key]
+            self._baked[key] = None
+            self._baked_last = order if self._baked_last is None else max(self._baked_last, order)
+
+    def _drawing_order(self, key: Hashable) -> tuple:
+        return self._key2zindex[key], self._order[key]
 
     def _clean(self) -> bool:
         """
@@ -43,59 +196,192 @@ class AnimationManager(dict):
             bool: If any animations were removed.
 
         """
-        keys_to_remove = [key for key, animation in self.items()
-                          if animation.disabled]
+        keys_to_remove = [key for key in self._disabled
+                          if key in self and self[key].disabled]
+        self._disabled.clear()
         for key in keys_to_remove:
+            self[key].watch(None)
             del self[key]
 
             # Bidirectional remove
-            self._zindex2key[self._key2zindex[key]].remove(key)
+            del self._zindex2key[self._key2zindex[key]][key]
+            del self._active[self._key2zindex[key]][key]
             del self._key2zindex[key]
+            del self._order[key]
+            self.set_group(key, None)
+            self._dirty.append(self._bboxes.pop(key, None))
         return len(keys_to_remove) > 0
 
-    def refresh(self):
+    def refresh(self) -> bool:
         """
         Redraw animations if needed.
 
         Common usage is to refresh continuously in a loop.
 
+        Returns:
+            bool: True if a new frame was passed to the sink.
+
         """
-        time = perf_counter_ns() // 1000000
+        time = self._clock()
+        self._clean()
+        height, width = self._img.shape[:2]
 
-        # Redraw needed if some animations were removed
-        if not self._clean():
-            for animation in self.values():
-                # Redraw needed if some animations can be advanced
+        # Advance animations with pending frames, mark their changed areas dirty
+        for keys in self._active.values():
+            for key in keys:
+                animation = self[key]
                 if animation.pending_advance(time):
-                    break
-            else:
-                return
+                    animation.advance(time)
+                    self._dirty.append(animation.changed_bbox())
+                    self._bboxes[key] = animation.frame_bbox()
+
+        if self._frame is None:
+            self._frame = self._img.copy()
+            self._canvas = self._img.copy()
+            self._dirty = [(0, 0, width, height)]
+
+        # Update static layer
+        if len(self._finished) > 0 or self._restack:
+            self._bake()
+        if not self._static_valid:
+            self._static = self._img.copy()
+            for zindex in sorted(self._zindex2key.keys()):
+                for key in self._zindex2key[zindex]:
+                    if key in self._baked:
+                        self[key].redraw(self._static)
+            self._static_valid = True
+
+        dirty = [bbox for bbox in (bbox_clip(bbox, width, height) for bbox in self._dirty)
+                 if bbox is not None]
+        self._dirty = []
+        if len(dirty) == 0:
+            return False
+
+        # Animations that are not baked in z-order with their bounding boxes
+        keys = sorted((key for keys in self._active.values() for key in keys),
+                      key=self._drawing_order)
+        bboxes = np.array([self._bboxes.get(key) or (0, 0, 0, 0) for key in keys],
+                          dtype=np.int64).reshape(-1, 4)
 
-        # Redraw animations in z-order
-        img_show = self._img.copy()
-        for zindex in sorted(self._zindex2key.keys()):
-            for key in self._zindex2key[zindex]:
-                self[key].advance(time, img_show)
+        # Restore static layer in dirty regions and find intersecting animations
+        dirty = bbox_merge(dirty)
+        intersect = np.zeros(len(keys), dtype=bool)
+        for x_from, y_from, x_to, y_to in dirty:
+            self._canvas[y_from:y_to, x_from:x_to] = self._static[y_from:y_to, x_from:x_to]
+            intersect |= ((bboxes[:, 0] < x_to) & (bboxes[:, 2] > x_from) &
+                          (bboxes[:, 1] < y_to) & (bboxes[:, 3] > y_from))
 
-        # Display new image in the OpenCV window
-        cv2.imshow(self._window, img_show)
+        # Every animation is drawn at most once, the canvas outside dirty regions is not used
+        for i in np.flatnonzero(intersect).tolist():
+            self[keys[i]].redraw(self._canvas, dirty)
+        for x_from, y_from, x_to, y_to in dirty:
+            self._frame[y_from:y_to, x_from:x_to] = self._canvas[y_from:y_to, x_from:x_to]
+
+        # Display new image
+        self._sink.show(self._frame, time)
+        return True
+
+    def next_frame_time(self) -> Optional[int]:
+        """
+        Absolute time when `refresh` has a new frame to display.
+
+        Lets the caller sleep until the deadline instead of refreshing
+        continuously.
+
+        Returns:
+            :obj:`int`, optional: Absolute time in ms, 0 if a frame
+                is already pending, None if nothing is animating.
 
-    def clear(self):
         """
-        Disable all animations.
+        if self._frame is None or len(self._dirty) > 0 or len(self._disabled) > 0:
+            return 0
+        times = [self[key].next_frame_time() for keys in self._active.values() for key in keys]
+        return min((time for time in times if time is not None), default=None)
+
+    @property
+    def frame(self) -> Optional[np.ndarray]:
+        """
+        The last displayed image, None before the first refresh.
+
+        """
+        return self._frame
+
+    @property
+    def clock(self) -> Clock:
+        """
+        Clock measuring animation time.
+
+        """
+        return self._clock
+
+    def clear(self, group: Hashable = None):
+        """
+        Disable all animations or all animations of a group.
 
         Animations will be removed from manager during the next refresh.
 
+        Args:
+            group (Hashable): Group to disable. Defaults to None.
+                If set to None all animations are disabled.
+
         """
-        for animation in self.values():
-            animation.disable()
+        keys = self.keys() if group is None else self._group2key.get(group, ())
+        for key in keys:
+            self[key].disable()
+
+    def group(self, group: Hashable) -> list:
+        """
+        Keys of the animations in a group.
+
+        Args:
+            group (Hashable): Group name.
+
+        Returns:
+            list: Animation names in the order of addition to the group.
+
+        """
+        return list(self._group2key.get(group, ()))
+
+    def get_group(self, key: Hashable) -> Optional[Hashable]:
+        """
+        Get group of an animation.
+
+        Args:
+            key (Hashable): Animation name.
+
+        Returns:
+            :obj:`Hashable`, optional: Animation group, None if
+                the animation is not in any group.
+
+        """
+        return self._key2group.get(key)
+
+    def set_group(self, key: Hashable, group: Optional[Hashable]):
+        """
+        Set group of an animation.
+
+        Args:
+            key (Hashable): Animation name.
+            group (:obj:`Hashable`, optional): Animation group.
+                None removes the animation from its group.
+
+        """
+        # Bidirectional set
+        if key in self._key2group:
+            old = self._key2group.pop(key)
+            del self._group2key[old][key]
+            if len(self._group2key[old]) == 0:
+                del self._group2key[old]
+        if group is not None:
+            self._key2group[key] = group
+            self._group2key[group][key] = None
 
-    def get_zindex(self, key: str) -> int:
+    def get_zindex(self, key: Hashable) -> int:
         """
         Get z-index of an animation.
 
         Args:
-            key (str): Animation name.
+            key (Hashable): Animation name.
 
         Returns:
             int: Animation z-index.
@@ -103,17 +389,24 @@ class AnimationManager(dict):
         """
         return self._key2zindex[key]
 
-    def set_zindex(self, key: str, zindex: int):
+    def set_zindex(self, key: Hashable, zindex: int):
         """
         Set z-index of an animation.
 
         Args:
-            key (str): Animation name.
+            key (Hashable): Animation name.
             zindex (int): Animation z-index.
 
         """
         # Bidirectional set
         if key in self._key2zindex:
-            self._zindex2key[self._key2zindex[key]].remove(key)
+            self._unbake(key)
+            del self._zindex2key[self._key2zindex[key]][key]
+            del self._active[self._key2zindex[key]][key]
+            self._dirty.append(self._bboxes.get(key))  # Drawing order changes
         self._key2zindex[key] = zindex
-        self._zindex2key[zindex].add(key)
+        self._zindex2key[zindex][key] = None
+        self._active[zindex][key] = None
+        self._order[key] = self._counter
+        self._counter += 1
+        self._restack = True
@@ -0,0 +1,78 @@
+import cv2
+import numpy as np
+
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Callable, Optional
+
+
+class BaseSink(ABC):
+    """
+    Base class for render sinks receiving frames from `AnimationManager`.
+
+    """
+
+    @abstractmethod
+    def show(self, frame: np.ndarray, time: int):
+        """
+        Receive a new frame.
+
+        The frame is reused by the manager, copy it to keep it.
+
+        Args:
+            frame (np.ndarray): Rendered image.
+            time (int): Absolute time of the frame in ms.
+
+        """
+        pass
+
+
+class WindowSink(BaseSink):
+    """
+    Display frames in an OpenCV window.
+
+    Args:
+        window (str): OpenCV window name.
+
+    """
+
+    def __init__(self, window: str):
+        self._window = window
+
+    def show(self, frame: np.ndarray, time: int):
+        cv2.imshow(self._window, frame)
+
+
+class OffscreenSink(BaseSink):
+    """
+    Collect frames without a display.
+
+    Frames are passed to a callback and/or stored in a ring buffer
+    of a limited size together with their time.
+
+    Args:
+        callback (:obj:`Callable`, optional): Function called with
+            a frame and its time. Defaults to None.
+        maxlen (:obj:`int`, optional): Ring buffer size. Defaults to 0,
+            frames are not stored. If set to None the buffer is unlimited.
+
+    """
+
+    def __init__(self, callback: Optional[Callable] = None,
+                 maxlen: Optional[int] = 0):
+        self._callback = callback
+        self._frames = deque(maxlen=maxlen)
+
+    def show(self, frame: np.ndarray, time: int):
+        if self._frames.maxlen != 0:
+            self._frames.append((time, frame.copy()))
+        if self._callback is not None:
+            self._callback(frame, time)
+
+    @property
+    def frames(self) -> deque:
+        """
+        Ring buffer of (time, frame) tuples, the oldest frames first.
+
+        """
+        return self._frames
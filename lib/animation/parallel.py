@@ -1,9 +1,10 @@
 import numpy as np
 
-from typing import Sequence
+from typing import Optional, Sequence
 
 from .enums import RepeatMode
 from .base import BaseAnimation
+from .bbox import bbox_union
 from .base_linear import BaseLinearAnimation
 
 
@@ -40,3 +41,10 @@ class ParallelAnimation(BaseLinearAnimation):
         dt = int(phi * self._duration)
         for animation in self._animations:
             animation.draw(dt, img)
+
+    def _bbox(self, phi: float) -> Optional[tuple]:
+        dt = int(phi * self._duration)
+        bbox = None
+        for animation in self._animations:
+            bbox = bbox_union(bbox, animation.bbox(dt))
+        return bbox
@@ -33,9 +33,8 @@ class RectangleAnimation(BaseFigureAnimation):
         super(RectangleAnimation, self).__init__(start, finish, duration, step, fps, repeat, easing)
 
     def _draw(self, phi: float, img: np.ndarray):
-        inter = self._inter(phi)
-        cv2.rectangle(img, inter["position"][0].tuple, inter["position"][1].tuple,
-                      color=inter["color"], thickness=inter["thickness"])
+        p1, p2, color, thickness = self._inter(phi)
+        cv2.rectangle(img, p1, p2, color=color, thickness=thickness)
 
 
 class RectanglePositionAnimation(RectangleAnimation):
@@ -1,9 +1,11 @@
 import numpy as np
 
-from typing import Sequence
+from bisect import bisect_left, bisect_right
+from typing import Optional, Sequence
 
 from .enums import RepeatMode
 from .base import BaseAnimation
+from .bbox import bbox_union
 from .base_linear import BaseLinearAnimation
 
 
@@ -13,6 +15,16 @@ class SequenceAnimation(BaseLinearAnimation):
 
     Internal animation frame rates are ignored and can be not set.
 
+    Animations are kept sorted by their start times and drawn in this
+    order, the started ones are found with binary search. An animation
+    is complete when its duration has passed and its repeat mode shows
+    a constant frame afterwards, complete animations with
+    RepeatMode.ONEOFF show nothing. Complete animations that precede all
+    the incomplete ones form a completed prefix. It is drawn once into
+    a cached raster together with the image below it, so redrawing image
+    regions only copies the raster, unless the pixels below have changed.
+    Only the incomplete animations are marked changed.
+
     Args:
         sequence (:obj:`Sequence` of :obj:`BaseAnimation`):
             Animations to display.
@@ -36,15 +48,153 @@ class SequenceAnimation(BaseLinearAnimation):
                  repeat = RepeatMode.ONEOFF):
         durations = [animation.duration for animation in sequence]
         if timestamps is None:  # Play one by one
-            timestamps = [0] + np.cumsum(durations[:-1])
+            timestamps = np.concatenate(([0], np.cumsum(durations[:-1]))).tolist()
         duration = np.max([t + d for t, d in zip(timestamps, durations)])
         super(SequenceAnimation, self).__init__(duration, step, fps, repeat)
-        self._sequence = sequence
-        self._timestamps = timestamps
+
+        order = sorted(range(len(sequence)), key=lambda i: timestamps[i])
+        self._sequence = [sequence[i] for i in order]
+        self._timestamps = [timestamps[i] for i in order]
+
+        # Latest finish time among the first i + 1 animations, infinite for never ending ones
+        self._prefix_finish = []
+        finish = -np.inf
+        for timestamp, animation in zip(self._timestamps, self._sequence):
+            if animation.repeat == RepeatMode.REPEAT or animation.repeat == RepeatMode.CYCLE:
+                finish = np.inf
+            finish = max(finish, timestamp + animation.duration)
+            self._prefix_finish.append(finish)
+
+        # Final bounding boxes of the completed prefix and their running unions
+        self._final_bboxes = np.zeros((len(sequence), 4), dtype=np.int64)
+        self._prefix_bboxes = [None]
+
+        # Completed prefix drawn over the image below it
+        self._raster = None
+        self._raster_below = None
+        self._raster_count = 0  # Number of animations drawn into the raster
+
+    def _window(self, time: int) -> tuple:
+        """
+        Find animations that are started and not in the completed prefix.
+
+        Args:
+            time (int): Time since the sequence start.
+
+        Returns:
+            int: Length of the completed prefix.
+            int: Number of started animations.
+
+        """
+        n_complete = bisect_left(self._prefix_finish, time)
+        n_started = bisect_right(self._timestamps, time)
+
+        # Cache bounding boxes of the newly completed animations
+        for i in range(len(self._prefix_bboxes) - 1, n_complete):
+            bbox = self._sequence[i].bbox(time - self._timestamps[i])
+            if bbox is not None:
+                self._final_bboxes[i] = bbox
+            self._prefix_bboxes.append(bbox_union(self._prefix_bboxes[-1], bbox))
+        return n_complete, n_started
+
+    def _draw_complete(self, i: int, time: int, img: np.ndarray):
+        """
+        Draw the constant frame of a complete animation.
+
+        Args:
+            i (int): Animation index.
+            time (int): Time since the sequence start.
+            img (np.ndarray): Image to draw on.
+
+        """
+        animation = self._sequence[i]
+        if animation.repeat != RepeatMode.ONEOFF:
+            animation.draw(time - self._timestamps[i], img)
+
+    def _update_raster(self, time: int, img: np.ndarray, n_complete: int):
+        """
+        Draw the newly completed animations into the raster.
+
+        The raster is created again if it does not match the image
+        or if the completed prefix has shrunk.
+
+        Args:
+            time (int): Time since the sequence start.
+            img (np.ndarray): Image to draw on.
+            n_complete (int): Length of the completed prefix.
+
+        """
+        if (self._raster is None or self._raster.shape != img.shape or
+                n_complete < self._raster_count):
+            self._raster_below = img.copy()
+            self._raster = img.copy()
+            self._raster_count = 0
+        for i in range(self._raster_count, n_complete):
+            self._draw_complete(i, time, self._raster)
+        self._raster_count = n_complete
 
     def _draw(self, phi: float, img: np.ndarray):
         time = int(phi * self._duration)
-        for timestamp, animation in zip(self._timestamps, self._sequence):
-            dt = time - timestamp
-            if dt >= 0:
-                animation.draw(dt, img)
+        n_complete, n_started = self._window(time)
+        for i in range(n_complete):
+            self._draw_complete(i, time, img)
+        for i in range(n_complete, n_started):
+            self._sequence[i].draw(time - self._timestamps[i], img)
+
+    def _draw_regions(self, phi: float, img: np.ndarray, regions: Sequence[tuple]):
+        time = int(phi * self._duration)
+        n_complete, n_started = self._window(time)
+        self._update_raster(time, img, n_complete)
+
+        # Drawing is pixelwise, so the raster stays valid where the pixels below are the same
+        stale = []
+        for x_from, y_from, x_to, y_to in regions:
+            changed = np.any(img[y_from:y_to, x_from:x_to] !=
+                             self._raster_below[y_from:y_to, x_from:x_to], axis=2)
+            rows = np.flatnonzero(changed.any(axis=1))
+            if len(rows) > 0:
+                cols = np.flatnonzero(changed.any(axis=0))
+                stale.append((x_from + int(cols[0]), y_from + int(rows[0]),
+                              x_from + int(cols[-1]) + 1, y_from + int(rows[-1]) + 1))
+
+        # Redraw the completed prefix over the changed pixels and update the raster
+        if len(stale) > 0:
+            for x_from, y_from, x_to, y_to in stale:
+                self._raster_below[y_from:y_to, x_from:x_to] = img[y_from:y_to, x_from:x_to]
+            bboxes = self._final_bboxes[:n_complete, None]
+            stale_array = np.array(stale, dtype=np.int64)
+            intersect = ((bboxes[..., 0] < stale_array[:, 2]) & (bboxes[..., 2] > stale_array[:, 0]) &
+                         (bboxes[..., 1] < stale_array[:, 3]) & (bboxes[..., 3] > stale_array[:, 1]))
+            for i in np.flatnonzero(intersect.any(axis=1)).tolist():
+                self._draw_complete(i, time, img)
+            for x_from, y_from, x_to, y_to in stale:
+                self._raster[y_from:y_to, x_from:x_to] = img[y_from:y_to, x_from:x_to]
+
+        for x_from, y_from, x_to, y_to in regions:
+            img[y_from:y_to, x_from:x_to] = self._raster[y_from:y_to, x_from:x_to]
+        for i in range(n_complete, n_started):
+            self._sequence[i].draw(time - self._timestamps[i], img)
+
+    def _bbox(self, phi: float) -> Optional[tuple]:
+        time = int(phi * self._duration)
+        n_complete, n_started = self._window(time)
+        bbox = self._prefix_bboxes[n_complete]
+        for i in range(n_complete, n_started):
+            bbox = bbox_union(bbox, self._sequence[i].bbox(time - self._timestamps[i]))
+        return bbox
+
+    def _changed_bbox(self, phi_from: Optional[float], phi_to: float) -> Optional[tuple]:
+        if phi_from is None or phi_to < phi_from:
+            return super(SequenceAnimation, self)._changed_bbox(phi_from, phi_to)
+
+        # Animations completed before the first frame are not changed
+        time_from = int(phi_from * self._duration)
+        time_to = int(phi_to * self._duration)
+        n_complete, _ = self._window(time_from)
+        bbox = None
+        for i in range(n_complete, bisect_right(self._timestamps, time_to)):
+            animation = self._sequence[i]
+            if time_from >= self._timestamps[i]:
+                bbox = bbox_union(bbox, animation.bbox(time_from - self._timestamps[i]))
+            bbox = bbox_union(bbox, animation.bbox(time_to - self._timestamps[i]))
+        return bbox
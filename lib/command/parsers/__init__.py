@@ -1,8 +1,11 @@
 from .base import *
 from .base_int_pos import *
+from .binary import *
 from .bookmark import *
 from .color import *
 from .coords import *
+from .export import *
+from .force import *
 from .intersect import *
 from .list import *
 from .metric import *
@@ -13,4 +16,6 @@ from .scale import *
 from .speed import *
 from .thickness import *
 from .time_limit import *
+from .top import *
 from .transparent import *
+from .workers import *
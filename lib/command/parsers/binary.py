@@ -0,0 +1,10 @@
+from .base import BaseParser
+
+
+class BinaryParser(BaseParser):
+    def __init__(self):
+        super(BinaryParser, self).__init__(
+            name=None,
+            mapping={"binary": True},
+            default=False
+        )
@@ -0,0 +1,13 @@
+from .base import BaseParser
+from lib.enums import ExportMode
+
+
+class ExportParser(BaseParser):
+    def __init__(self):
+        super(ExportParser, self).__init__(
+            name="mode",
+            mapping={"image": ExportMode.IMAGE,
+                     "video": ExportMode.VIDEO,
+                     "frames": ExportMode.FRAMES},
+            default=ExportMode.IMAGE
+        )
@@ -0,0 +1,10 @@
+from .base import BaseParser
+
+
+class ForceParser(BaseParser):
+    def __init__(self):
+        super(ForceParser, self).__init__(
+            name=None,
+            mapping={"force": True},
+            default=False
+        )
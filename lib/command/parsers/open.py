@@ -1,4 +1,5 @@
 from .base import BaseParser
+from ..option import Option
 from lib.enums import OpenMode
 
 
@@ -9,6 +10,14 @@ class OpenParser(BaseParser):
             mapping={"normal": OpenMode.NORMAL,
                      "fast": OpenMode.FAST,
                      "draw": OpenMode.DRAW,
-                     "bookmark": OpenMode.BOOKMARK},
+                     "bookmark": OpenMode.BOOKMARK,
+                     "survey": OpenMode.SURVEY},
             default=OpenMode.NORMAL
         )
+
+    def __call__(self, option: Option) -> OpenMode:
+        # Unwrapped modes take no value, so that e.g. "-s=3" is not taken for survey
+        if (option.value is not None and
+                option.name != self._name and option.name != self._name[0]):
+            raise IndexError("no suitable conversion")
+        return super(OpenParser, self).__call__(option)
@@ -0,0 +1,11 @@
+from .base_int_pos import BaseIntPosParser
+from lib.utils import SEARCH_TOP
+
+
+class TopParser(BaseIntPosParser):
+    def __init__(self):
+        super(TopParser, self).__init__(
+            name="top",
+            default=SEARCH_TOP,
+            shortened=False
+        )
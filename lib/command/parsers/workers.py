@@ -0,0 +1,10 @@
+from .base_int_pos import BaseIntPosParser
+
+
+class WorkersParser(BaseIntPosParser):
+    def __init__(self):
+        super(WorkersParser, self).__init__(
+            name="workers",
+            default=None,
+            shortened=True
+        )
@@ -1,6 +1,7 @@
 from .bookmark_mode import *
 from .command_names import *
 from .editor_state import *
+from .export_mode import *
 from .list_mode import *
 from .magnet_state import *
 from .open_mode import *
@@ -12,5 +12,7 @@ class CommandNames(Enum):
     list =     ["list", "ls"]
     bookmark = ["bookmark", "bm"]
     remove =   ["remove", "rm"]
+    convert =  ["convert", "conv"]
     export =   ["export", "exp"]
+    search =   ["search", "find"]
     open =     ["open"]
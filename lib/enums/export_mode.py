@@ -0,0 +1,14 @@
+from enum import Enum
+
+
+class ExportMode(Enum):
+    """
+    Export mode enum.
+
+    See manuals/export.man for more details.
+
+    """
+
+    IMAGE  = 0  #: Export a PNG image (the default).
+    VIDEO  = 1  #: Export bookmark playback to an MP4 video.
+    FRAMES = 2  #: Export bookmark playback to a PNG frame sequence.
@@ -13,3 +13,4 @@ class OpenMode(Enum):
     FAST     = 1  #: Perform nearest point walk without animations.
     DRAW     = 2  #: Draw lines using pixels of the same color.
     BOOKMARK = 3  #: Display bookmark contents.
+    SURVEY   = 4  #: Perform nearest point walks from every pixel and save their statistics.
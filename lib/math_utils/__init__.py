@@ -1,5 +1,9 @@
+from .color_index import *
 from .line2d import Line2D
 from .optimize_strokes import *
 from .point2d import *
+from .point_grid import *
 from .segments_intersect import *
+from .shape_distance import *
 from .walk import *
+from .vectorized_walk import *
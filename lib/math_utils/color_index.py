@@ -0,0 +1,96 @@
+import numpy as np
+
+from typing import Iterator
+
+from .point2d import Point2D
+
+
+class ColorIndex:
+    """
+    Image pixel coordinates grouped by color.
+
+    The index is built once with a single sorting pass over the image.
+    Pixels of each color are stored as a contiguous slice of one
+    int16 coordinates array, so a color lookup costs O(k) instead
+    of O(H * W), where k is the number of pixels of that color.
+
+    Within a color pixels keep the row-major order of `np.nonzero`.
+
+    Args:
+        img (np.ndarray): OpenCV image to index.
+
+    """
+
+    def __init__(self, img: np.ndarray):
+        width = img.shape[1]
+        keys = color_key(img.reshape(-1, img.shape[2]))
+        order = np.argsort(keys, kind="stable")  # Stable sort keeps row-major order
+        colors, starts, counts = np.unique(keys[order], return_index=True,
+                                           return_counts=True)
+
+        self._coords = np.stack((order % width, order // width), axis=1).astype(np.int16)
+        self._coords.flags.writeable = False
+        self._buckets = {color: (start, start + count) for color, start, count
+                         in zip(colors.tolist(), starts.tolist(), counts.tolist())}
+
+    def __getitem__(self, color) -> np.ndarray:
+        """
+        Get coordinates of pixels with the given color.
+
+        Args:
+            color (np.ndarray): Color in BGR format.
+
+        Returns:
+            np.ndarray: Read-only (k, 2) int16 array of (x, y) coordinates.
+
+        """
+        start, stop = self._buckets.get(color_key(np.asarray(color)).item(), (0, 0))
+        return self._coords[start:stop]
+
+    def __len__(self) -> int:
+        """
+        Number of distinct colors in the image.
+
+        """
+        return len(self._buckets)
+
+    def colors(self) -> np.ndarray:
+        """
+        Distinct colors of the image.
+
+        Returns:
+            np.ndarray: (n, 3) uint8 array of BGR colors
+                in the order of their keys.
+
+        """
+        keys = np.fromiter(self._buckets.keys(), dtype=np.int32, count=len(self._buckets))
+        return np.stack(((keys >> 16) & 255, (keys >> 8) & 255, keys & 255),
+                        axis=1).astype(np.uint8)
+
+    def select(self, color) -> Iterator[Point2D]:
+        """
+        Get coordinates of pixels with the given color.
+
+        Args:
+            color (np.ndarray): Color in BGR format.
+
+        Returns:
+            (:obj:`Iterator` of :obj:`Point2D`): Coordinates iterator.
+
+        """
+        return map(Point2D, map(tuple, self[color].tolist()))
+
+
+def color_key(colors: np.ndarray) -> np.ndarray:
+    """
+    Pack BGR colors into integer keys.
+
+    Args:
+        colors (np.ndarray): Array of colors, the last axis is BGR.
+
+    Returns:
+        np.ndarray: Integer keys.
+
+    """
+    colors = colors.astype(np.int32)
+    return (colors[..., 0] << 16) | (colors[..., 1] << 8) | colors[..., 2]
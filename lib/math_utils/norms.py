@@ -6,7 +6,7 @@ def l1_norm(x, y):
 
 
 def l2_norm(x, y):
-    return (x ** 2 + y ** 2) ** (1 / 2)
+    return np.sqrt(x ** 2 + y ** 2)
 
 
 def linf_norm(x, y):
@@ -0,0 +1,246 @@
+import numpy as np
+
+from typing import Iterator, Optional
+
+from . import norms
+from .point2d import Point2D
+
+#: Average number of points per cell for automatic cell size selection.
+POINTS_PER_CELL = 2
+
+
+class PointGrid:
+    """
+    Uniform grid spatial index over a set of integer points.
+
+    Supports nearest neighbor, k nearest neighbors (in order) and radius
+    queries under norms from `norms` module. Points can be removed
+    from the index, queries only return the remaining points.
+
+    Ties are resolved in favor of the point that comes first in `points`,
+    which matches `np.argmin` over the whole set.
+
+    Args:
+        points (np.ndarray): (n, 2) integer array of (x, y) coordinates.
+        cell_size (int): Grid cell size in pixels. Defaults to None.
+            If set to None the size is chosen to fit `POINTS_PER_CELL`
+            points per cell on average.
+
+    """
+
+    def __init__(self, points: np.ndarray, cell_size: int = None):
+        self._points = points.astype(np.int64)
+        if cell_size is None:
+            extent = np.ptp(self._points, axis=0) + 1 if len(points) > 0 else (1, 1)
+            cell_size = np.sqrt(extent[0] * extent[1] * POINTS_PER_CELL / max(len(points), 1))
+        self._cell_size = max(1, int(cell_size))
+
+        self._alive = np.ones(len(points), dtype=bool)
+        self._n_alive = len(points)
+        self._point_cells = self._points // self._cell_size
+        self._cells = dict()
+        if len(points) > 0:
+            order = np.lexsort((self._point_cells[:, 1], self._point_cells[:, 0]))
+            cells, starts = np.unique(self._point_cells[order], axis=0, return_index=True)
+            for cell, indices in zip(map(tuple, cells.tolist()),
+                                     np.split(order, starts[1:])):
+                self._cells[cell] = np.sort(indices)
+            self._cell_min = cells.min(axis=0).tolist()
+            self._cell_max = cells.max(axis=0).tolist()
+        self._cell_counts = {cell: len(indices) for cell, indices in self._cells.items()}
+
+    def __len__(self) -> int:
+        """
+        Number of points remaining in the index.
+
+        """
+        return self._n_alive
+
+    def __contains__(self, i: int) -> bool:
+        return bool(self._alive[i])
+
+    def remove(self, i: int):
+        """
+        Remove a point from the index.
+
+        Args:
+            i (int): Point index in `points`.
+
+        """
+        if not self._alive[i]:
+            return
+        self._alive[i] = False
+        self._n_alive -= 1
+        cell = tuple(self._point_cells[i].tolist())
+        self._cell_counts[cell] -= 1
+        if self._cell_counts[cell] == 0:
+            del self._cell_counts[cell]
+            del self._cells[cell]
+
+    def nearest(self, p: Point2D, norm=norms.l2_norm) -> Optional[int]:
+        """
+        Find the nearest point.
+
+        Args:
+            p (Point2D): Query point.
+            norm: Norm to measure the distance with. Defaults to norms.l2_norm.
+
+        Returns:
+            :obj:`int`, optional: Point index, None if the index is empty.
+
+        """
+        return next(self.nearest_in_order(p, norm), None)
+
+    def k_nearest(self, p: Point2D, k: int, norm=norms.l2_norm) -> list:
+        """
+        Find `k` nearest points.
+
+        Args:
+            p (Point2D): Query point.
+            k (int): Number of points to find.
+            norm: Norm to measure the distance with. Defaults to norms.l2_norm.
+
+        Returns:
+            :obj:`list` of :obj:`int`: Point indices ordered by distance.
+
+        """
+        result = []
+        for i in self.nearest_in_order(p, norm):
+            if len(result) >= k:
+                break
+            result.append(i)
+        return result
+
+    def nearest_in_order(self, p: Point2D, norm=norms.l2_norm) -> Iterator[int]:
+        """
+        Iterate over the remaining points ordered by distance.
+
+        Cells are visited in rings of growing size around the query point,
+        a point is yielded once no point in the unvisited rings can be closer.
+        See `_rings` for sparse grids.
+
+        Args:
+            p (Point2D): Query point.
+            norm: Norm to measure the distance with. Defaults to norms.l2_norm.
+
+        Returns:
+            (:obj:`Iterator` of :obj:`int`): Point indices ordered by distance.
+
+        """
+        if len(self._cells) == 0:
+            return
+        cx, cy = p.x // self._cell_size, p.y // self._cell_size
+        max_ring = max(cx - self._cell_min[0], self._cell_max[0] - cx,
+                       cy - self._cell_min[1], self._cell_max[1] - cy, 0)
+
+        indices = np.empty(0, dtype=np.int64)
+        keys = np.empty(0)
+        for ring, new in self._rings(cx, cy, max_ring):
+            # Lower bound of distances to the points in the outer rings
+            bound = ring * self._cell_size + 1
+
+            indices = np.concatenate((indices, new))
+            keys = np.concatenate((keys, self._norm(p, new, norm)))
+            ready = ~(keys >= bound)
+            order = np.lexsort((indices[ready], keys[ready]))
+            for i in indices[ready][order].tolist():
+                if self._alive[i]:
+                    yield i
+            indices, keys = indices[~ready], keys[~ready]
+
+        order = np.lexsort((indices, keys))
+        for i in indices[order].tolist():
+            if self._alive[i]:
+                yield i
+
+    def radius(self, p: Point2D, radius: float, norm=norms.l2_norm) -> np.ndarray:
+        """
+        Find all points within a given distance.
+
+        Args:
+            p (Point2D): Query point.
+            radius (float): Maximum distance.
+            norm: Norm to measure the distance with. Defaults to norms.l2_norm.
+
+        Returns:
+            np.ndarray: Point indices in ascending order.
+
+        """
+        x_from, y_from = int((p.x - radius) // self._cell_size), int((p.y - radius) // self._cell_size)
+        x_to, y_to = int((p.x + radius) // self._cell_size), int((p.y + radius) // self._cell_size)
+        indices = [self._cells[x, y] for x in range(x_from, x_to + 1)
+                   for y in range(y_from, y_to + 1) if (x, y) in self._cells]
+        if len(indices) == 0:
+            return np.empty(0, dtype=np.int64)
+        indices = np.concatenate(indices)
+        indices = indices[self._alive[indices]]
+        return np.sort(indices[self._norm(p, indices, norm) <= radius])
+
+    def _rings(self, cx: int, cy: int, max_ring: int) -> Iterator[tuple]:
+        """
+        Iterate over the remaining points in rings of cells around a cell.
+
+        Rings are enumerated cell by cell while they are small. Once
+        the rings cover more cells than there are occupied cells,
+        the occupied cells of the remaining rings are sorted by ring
+        instead, so the number of visited empty cells is bounded.
+
+        Args:
+            cx (int): Center cell x coordinate.
+            cy (int): Center cell y coordinate.
+            max_ring (int): Last ring number.
+
+        Returns:
+            (:obj:`Iterator` of :obj:`tuple`): Ring number and point indices
+                of non-empty rings in ascending order of ring numbers.
+
+        """
+        for ring in range(max_ring + 1):
+            if (2 * ring + 1) ** 2 > len(self._cells):
+                break
+            yield ring, self._ring_points(cx, cy, ring)
+        else:
+            return
+
+        # Sparse grid
+        cells = np.array(list(self._cells.keys()), dtype=np.int64).reshape(-1, 2)
+        cell_indices = list(self._cells.values())
+        rings = np.maximum(np.abs(cells[:, 0] - cx), np.abs(cells[:, 1] - cy))
+        order = np.argsort(rings, kind="stable")
+        order = order[rings[order] >= ring]
+        starts = np.flatnonzero(np.diff(rings[order])) + 1
+        for group in np.split(order, starts):
+            if len(group) == 0:
+                continue
+            indices = np.concatenate([cell_indices[i] for i in group.tolist()])
+            yield rings[group[0]].item(), indices[self._alive[indices]]
+
+    def _ring_points(self, cx: int, cy: int, ring: int) -> np.ndarray:
+        """
+        Get the remaining points in a ring of cells.
+
+        Args:
+            cx (int): Center cell x coordinate.
+            cy (int): Center cell y coordinate.
+            ring (int): Ring number, the Chebyshev distance between cells.
+
+        Returns:
+            np.ndarray: Point indices.
+
+        """
+        if ring == 0:
+            cells = [(cx, cy)]
+        else:
+            x_from, x_to = max(cx - ring, self._cell_min[0]), min(cx + ring, self._cell_max[0])
+            y_from, y_to = max(cy - ring + 1, self._cell_min[1]), min(cy + ring - 1, self._cell_max[1])
+            cells = [(x, y) for y in (cy - ring, cy + ring) for x in range(x_from, x_to + 1)] + \
+                    [(x, y) for x in (cx - ring, cx + ring) for y in range(y_from, y_to + 1)]
+        indices = [self._cells[cell] for cell in cells if cell in self._cells]
+        if len(indices) == 0:
+            return np.empty(0, dtype=np.int64)
+        indices = np.concatenate(indices)
+        return indices[self._alive[indices]]
+
+    def _norm(self, p: Point2D, indices: np.ndarray, norm) -> np.ndarray:
+        points = self._points[indices]
+        return norm(p.x - points[:, 0], p.y - points[:, 1])
@@ -1,3 +1,5 @@
+import numpy as np
+
 from .point2d import Point2D
 
 
@@ -35,3 +37,77 @@ def segments_intersect(p1: Point2D, p2: Point2D,
           0 < (q - p) @ r / (r @ s) < 1):  # Segments intersect
         return True
     return False
+
+
+def segments_intersect_many(p: Point2D, q: Point2D,
+                            seg_starts: np.ndarray,
+                            seg_ends: np.ndarray) -> np.ndarray:
+    """
+    Determine whether a line segment intersects other segments internally.
+
+    Vectorized version of `segments_intersect(seg_start, seg_end, p, q)`
+    that tests all the segments in one call. Collinear overlaps count,
+    end point intersection doesn't count.
+
+    Args:
+        p (Point2D): Segment starting point.
+        q (Point2D): Segment final point.
+        seg_starts (np.ndarray): (n, 2) integer array of other
+            segments starting points.
+        seg_ends (np.ndarray): (n, 2) integer array of other
+            segments final points.
+
+    Returns:
+        np.ndarray: Boolean array, True where line segments intersect.
+
+    """
+    seg_starts = seg_starts.astype(np.int64, copy=False)
+    r_x = seg_ends[:, 0] - seg_starts[:, 0]
+    r_y = seg_ends[:, 1] - seg_starts[:, 1]
+    s_x = q.x - p.x
+    s_y = q.y - p.y
+    qp_x = p.x - seg_starts[:, 0]
+    qp_y = p.y - seg_starts[:, 1]
+
+    r_s = r_x * s_y - r_y * s_x
+    qp_r = qp_x * r_y - qp_y * r_x
+    qp_s = qp_x * s_y - qp_y * s_x
+    parallel = r_s == 0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Segments are collinear
+        r_r = r_x * r_x + r_y * r_y
+        t_0 = (qp_x * r_x + qp_y * r_y) / r_r
+        t_1 = t_0 + (s_x * r_x + s_y * r_y) / r_r
+        overlap = ~((np.maximum(t_0, t_1) <= 0) | (np.minimum(t_0, t_1) >= 1))
+
+        # Segments intersect
+        t = qp_s / r_s
+        u = qp_r / r_s
+        cross = (0 < t) & (t < 1) & (0 < u) & (u < 1)
+
+    return np.where(parallel, (qp_r == 0) & overlap, cross)
+
+
+def count_self_intersections(path: np.ndarray) -> int:
+    """
+    Count internal intersections between line segments of a path.
+
+    Every segment is tested against all the previous ones
+    with `segments_intersect_many`, so adjacent segments intersect
+    only if they overlap.
+
+    Args:
+        path (np.ndarray): (n, 2) integer array of path points.
+
+    Returns:
+        int: Number of intersecting segment pairs.
+
+    """
+    path = path.astype(np.int64, copy=False)
+    count = 0
+    for i in range(1, len(path) - 1):
+        count += int(segments_intersect_many(Point2D(*path[i].tolist()),
+                                             Point2D(*path[i + 1].tolist()),
+                                             path[:i], path[1:i + 1]).sum())
+    return count
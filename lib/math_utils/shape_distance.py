@@ -0,0 +1,93 @@
+import numpy as np
+
+#: Number of rows of the pairwise distance matrix computed at once.
+HAUSDORFF_CHUNK_SIZE = 1024
+
+
+def sample_strokes(coords: np.ndarray, offsets: np.ndarray, n: int) -> np.ndarray:
+    """
+    Sample points uniformly along strokes.
+
+    Strokes are treated as one curve with gaps between the strokes,
+    so that the samples are spread by the arc length regardless
+    of the number of stroke vertices.
+
+    Args:
+        coords (np.ndarray): (m, 2) array of (x, y) coordinates.
+        offsets (np.ndarray): (k + 1) integer array of stroke offsets,
+            stroke `i` consists of points `coords[offsets[i]:offsets[i + 1]]`.
+        n (int): Number of samples.
+
+    Returns:
+        np.ndarray: (n, 2) float array of samples, stroke vertices
+            as is if the strokes have zero length.
+
+    """
+    coords = np.asarray(coords, dtype=np.float64)
+    offsets = np.asarray(offsets, dtype=np.int64)
+
+    # Segments inside strokes, the last point of a stroke does not start a segment
+    starts = np.ones(len(coords), dtype=bool)
+    starts[offsets[1:] - 1] = False
+    starts = np.flatnonzero(starts)
+    p1 = coords[starts]
+    p2 = coords[starts + 1]
+    lengths = np.hypot(*(p2 - p1).T)
+    total = lengths.sum()
+    if total == 0:
+        return coords
+
+    ends = np.cumsum(lengths)
+    positions = np.linspace(0, total, n)
+    i = np.minimum(np.searchsorted(ends, positions), len(ends) - 1)
+    t = 1 - (ends[i] - positions) / np.where(lengths[i] > 0, lengths[i], 1)
+    return p1[i] + (p2[i] - p1[i]) * np.clip(t, 0, 1)[:, None]
+
+
+def normalize_shape(points: np.ndarray) -> np.ndarray:
+    """
+    Move shape bounding box center to the origin and scale
+    the larger side of the box to 1.
+
+    Args:
+        points (np.ndarray): (n, 2) array of (x, y) coordinates.
+
+    Returns:
+        np.ndarray: (n, 2) float array of normalized coordinates.
+            A single point is moved to the origin.
+
+    """
+    points = np.asarray(points, dtype=np.float64)
+    low = points.min(axis=0)
+    high = points.max(axis=0)
+    extent = (high - low).max()
+    return (points - (low + high) / 2) / (extent if extent > 0 else 1)
+
+
+def hausdorff_distance(a: np.ndarray, b: np.ndarray) -> float:
+    """
+    Symmetric Hausdorff distance between two point sets.
+
+    The largest distance from a point of one set to the closest
+    point of the other set. Pairwise distances are computed once
+    for both directions, `HAUSDORFF_CHUNK_SIZE` rows at a time.
+
+    Args:
+        a (np.ndarray): (n, 2) array of points.
+        b (np.ndarray): (m, 2) array of points.
+
+    Returns:
+        float: Hausdorff distance.
+
+    """
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    norms_b = (b * b).sum(axis=1)
+    dist2_a = 0.0                             # Squared distance from `a` to `b`
+    dist2_b = np.full(len(b), np.inf)         # Squared distances from `b` points to `a`
+    for i in range(0, len(a), HAUSDORFF_CHUNK_SIZE):
+        chunk = a[i:i + HAUSDORFF_CHUNK_SIZE]
+        dist2 = (chunk * chunk).sum(axis=1)[:, None] + norms_b - 2 * chunk @ b.T
+        dist2_a = max(dist2_a, dist2.min(axis=1).max())
+        np.minimum(dist2_b, dist2.min(axis=0), out=dist2_b)
+    return float(np.sqrt(max(dist2_a, dist2_b.max(), 0)))
@@ -0,0 +1,287 @@
+import numpy as np
+
+from time import perf_counter_ns
+from typing import Optional
+
+from . import metrics
+from .color_index import ColorIndex
+from .point2d import Point2D
+from .point_grid import PointGrid
+from .segments_intersect import segments_intersect_many
+
+#: Number of closest candidates checked for intersections at once.
+CHUNK_SIZE = 16
+#: Minimum number of points to use a spatial index with norm induced metrics.
+GRID_MIN_POINTS = 1024
+
+
+class VectorizedWalk:
+    """
+    Nearest point walk engine operating on NumPy arrays.
+
+    Candidate points are kept in an (n, 2) integer array together
+    with a boolean mask of points that are not visited yet. Distances
+    for a step are measured with a single vectorized metric call.
+
+    If intersections are not allowed, candidates are checked in chunks
+    of `CHUNK_SIZE` closest points, each candidate is tested against
+    all the visited segments at once.
+
+    With norm induced metrics large point sets are queried through
+    a `PointGrid` spatial index, so that a step only looks at the
+    points around the current one.
+
+    The engine produces exactly the same path as `walk`: ties are
+    resolved in favor of the point that comes first in `points`.
+
+    Args:
+        points (np.ndarray): (n, 2) integer array of (x, y) coordinates.
+        p_start (Point2D): Starting point for the walk. Must be one of `points`.
+        metric (metrics.BaseMetric): Metric to measure the distance
+            between points. Defaults to metrics.L2Metric.
+        allow_intersections (bool): Whether to allow line
+            self-intersections. Defaults to False.
+
+    Raises:
+        IndexError: If `p_start` is not one of `points`.
+
+    """
+
+    def __init__(self, points: np.ndarray, p_start: Point2D,
+                 metric: metrics.BaseMetric = metrics.L2Metric(),
+                 allow_intersections: bool = False):
+        self._points = points.astype(np.int64)
+        self._metric = metric
+        self._allow_intersections = allow_intersections
+
+        start = np.flatnonzero((self._points[:, 0] == p_start.x) &
+                               (self._points[:, 1] == p_start.y))
+        if len(start) == 0:
+            raise IndexError(f"starting point {p_start} is not a candidate")
+
+        self._alive = np.ones(len(self._points), dtype=bool)
+        self._alive[start[0]] = False
+        self._path = [p_start]
+        self._path_xy = np.empty_like(self._points)  # Visited points coordinates
+        self._path_xy[0] = p_start.tuple
+        self._finished = len(self._points) == 1
+
+        self._grid = None
+        if (isinstance(metric, metrics.NormInducedMetric) and
+                len(self._points) >= GRID_MIN_POINTS):
+            self._grid = PointGrid(self._points)
+            self._grid.remove(start[0])
+
+    def step(self) -> bool:
+        """
+        Visit the next point.
+
+        Returns:
+            bool: False if the walk is complete.
+
+        """
+        if self._finished:
+            return False
+
+        p_current = self._path[-1]
+        if self._grid is not None:
+            candidates = self._grid.nearest_in_order(p_current, self._metric.norm)
+            if not self._allow_intersections:
+                candidates = (i for i in candidates if not self._intersects(p_current, i))
+            i_closest = next(candidates, None)
+        else:
+            keys = self._metric.many(p_current, self._points)
+            if self._metric.mode == "max":
+                keys = -keys
+            # Undefined values (cos metric at the center point) are never the closest
+            if keys.dtype.kind == "f":
+                keys[np.isnan(keys)] = np.inf
+
+            if self._allow_intersections:
+                alive = np.flatnonzero(self._alive)
+                i_closest = alive[np.argmin(keys[alive])]
+            else:
+                i_closest = self._closest_not_intersecting(p_current, keys)
+
+        if i_closest is None:
+            self._finished = True
+            return False
+
+        self._alive[i_closest] = False
+        if self._grid is not None:
+            self._grid.remove(i_closest)
+        self._path.append(self._point(i_closest))
+        self._path_xy[len(self._path) - 1] = self._points[i_closest]
+        self._finished = not self._alive.any()
+        return not self._finished
+
+    def run(self, time_limit: int = 500, partial: bool = False) -> list:
+        """
+        Visit points until the walk is complete.
+
+        A partial walk can be resumed by calling `run` again.
+
+        Args:
+            time_limit (int): Time limit for the computations in ms.
+                Defaults to 500 ms.
+            partial (bool): Whether to return the points visited so far
+                when the time limit is exceeded. Check `truncated` to see
+                if the walk is complete. Defaults to False.
+
+        Returns:
+            :obj:`list` of :obj:`Point2D`: A sequence of points visited
+                in the walk.
+
+        Raises:
+            TimeoutError: If the walk is not complete in `time_limit` ms
+                and `partial` is False.
+
+        """
+        start_time = perf_counter_ns() // 1000000
+        while not self._finished:
+            if perf_counter_ns() // 1000000 - start_time > time_limit:
+                if partial:
+                    break
+                raise TimeoutError(f"time limit of {time_limit} ms exceeded")
+            self.step()
+        return self.path
+
+    def _closest_not_intersecting(self, p_current: Point2D,
+                                  keys: np.ndarray) -> Optional[int]:
+        """
+        Find the closest candidate that does not create self-intersections.
+
+        Args:
+            p_current (Point2D): Current point.
+            keys (np.ndarray): Candidate keys, lower values are closer.
+
+        Returns:
+            :obj:`int`, optional: Candidate index, None if every
+                candidate creates a self-intersection.
+
+        """
+        candidates = np.flatnonzero(self._alive)
+        keys = keys[candidates]
+        while len(candidates) > 0:
+            # Take the closest chunk including all the ties of its farthest point
+            if len(candidates) > CHUNK_SIZE:
+                kth = np.partition(keys, CHUNK_SIZE - 1)[CHUNK_SIZE - 1]
+                chunk = ~(keys > kth)
+            else:
+                chunk = np.ones(len(candidates), dtype=bool)
+
+            # Sort by key, resolve ties by candidate order
+            chunk_candidates = candidates[chunk]
+            order = np.lexsort((chunk_candidates, keys[chunk]))
+            for i in chunk_candidates[order].tolist():
+                if not self._intersects(p_current, i):
+                    return i
+
+            candidates = candidates[~chunk]
+            keys = keys[~chunk]
+        return None
+
+    def _intersects(self, p_current: Point2D, i: int) -> bool:
+        """
+        Check whether a segment to a candidate intersects the visited path.
+
+        Args:
+            p_current (Point2D): Current point.
+            i (int): Candidate index.
+
+        Returns:
+            bool: True if the segment creates a self-intersection.
+
+        """
+        n_visited = len(self._path)
+        return segments_intersect_many(p_current, self._point(i),
+                                       self._path_xy[:n_visited - 1],
+                                       self._path_xy[1:n_visited]).any()
+
+    def _point(self, i: int) -> Point2D:
+        return Point2D(*self._points[i].tolist())
+
+    @property
+    def path(self) -> list:
+        """
+        Points visited so far.
+
+        """
+        return list(self._path)
+
+    @property
+    def finished(self) -> bool:
+        """
+        True if the walk is complete.
+
+        """
+        return self._finished
+
+    @property
+    def truncated(self) -> bool:
+        """
+        True if the walk is not complete and can be resumed.
+
+        """
+        return not self._finished
+
+
+def start_walk(img: np.ndarray, p_start: Point2D,
+               metric: metrics.BaseMetric = metrics.L2Metric(),
+               allow_intersections: bool = False,
+               index: ColorIndex = None) -> VectorizedWalk:
+    """
+    Prepare nearest point walk using image pixels of the same color.
+
+    Use `VectorizedWalk.run` to perform the walk.
+
+    Args:
+        img (np.ndarray): OpenCV image to select pixels from.
+        p_start (Point2D): Starting point for the walk.
+        metric (metrics.BaseMetric): Metric to measure the distance
+            between points. Defaults to metrics.L2Metric.
+        allow_intersections (bool): Whether to allow line
+            self-intersections. Defaults to False.
+        index (ColorIndex): Color index of `img` used to select pixels.
+            Defaults to None. If set to None the whole image is scanned.
+
+    Returns:
+        VectorizedWalk: Walk engine.
+
+    """
+    color = img[p_start.y, p_start.x]
+    if index is not None:
+        points = index[color]
+    else:
+        points = np.stack(np.nonzero(np.all(img == color, axis=2))[::-1], axis=1)
+    return VectorizedWalk(points, p_start, metric, allow_intersections)
+
+
+def vectorized_walk(img: np.ndarray, p_start: Point2D,
+                    metric: metrics.BaseMetric = metrics.L2Metric(),
+                    allow_intersections: bool = False,
+                    time_limit: int = 500,
+                    index: ColorIndex = None) -> list:
+    """
+    Perform nearest point walk using image pixels of the same color.
+
+    Vectorized counterpart of `walk` with the same results.
+
+    Args:
+        img (np.ndarray): OpenCV image to select pixels from.
+        p_start (Point2D): Starting point for the walk.
+        metric (metrics.BaseMetric): Metric to measure the distance
+            between points. Defaults to metrics.L2Metric.
+        allow_intersections (bool): Whether to allow line
+            self-intersections. Defaults to False.
+        time_limit (int): Time limit for the computations in ms.
+            Defaults to 500 ms.
+        index (ColorIndex): Color index of `img` used to select pixels.
+            Defaults to None. If set to None the whole image is scanned.
+
+    Returns:
+        :obj:`list` of :obj:`Point2D`: A sequence of points visited
+            in the walk.
+
+    """
+    return start_walk(img, p_start, metric, allow_intersections, index).run(time_limit)
@@ -4,6 +4,7 @@ from time import perf_counter_ns
 from typing import Iterator
 
 from . import metrics
+from .color_index import ColorIndex
 from .point2d import Point2D
 from .segments_intersect import segments_intersect
 
@@ -11,7 +12,8 @@ from .segments_intersect import segments_intersect
 def walk(img: np.ndarray, p_start: Point2D,
          metric: metrics.BaseMetric = metrics.L2Metric(),
          allow_intersections: bool = False,
-         time_limit: int = 500) -> list:
+         time_limit: int = 500,
+         index: ColorIndex = None) -> list:
     """
     Perform nearest point walk using image pixels of the same color.
 
@@ -24,6 +26,8 @@ def walk(img: np.ndarray, p_start: Point2D,
             self-intersections. Defaults to False.
         time_limit (int): Time limit for the computations in ms.
             Defaults to 500 ms.
+        index (ColorIndex): Color index of `img` used to select pixels.
+            Defaults to None. If set to None the whole image is scanned.
 
     Returns:
         :obj:`list` of :obj:`Point2D`: A sequence of points visited
@@ -34,8 +38,9 @@ def walk(img: np.ndarray, p_start: Point2D,
     color = img[p_start.y, p_start.x]
 
     visited = [p_start]
-    remaining = set(select_color(img, color))
-    remaining.remove(p_start)
+    # Keep pixels in selection order, so ties are resolved deterministically
+    remaining = dict.fromkeys(select_color(img, color, index))
+    del remaining[p_start]
 
     while len(remaining) > 0:
         if perf_counter_ns() // 1000000 - start_time > time_limit:
@@ -60,22 +65,27 @@ def walk(img: np.ndarray, p_start: Point2D,
             else:
                 break
 
-        remaining.remove(p_closest)
+        del remaining[p_closest]
         visited.append(p_closest)
 
     return visited
 
 
-def select_color(img: np.ndarray, color: np.ndarray) -> Iterator[Point2D]:
+def select_color(img: np.ndarray, color: np.ndarray,
+                 index: ColorIndex = None) -> Iterator[Point2D]:
     """
     Get coordinates of pixels with the same color.
 
     Args:
         img (np.ndarray): OpenCV image.
         color (np.ndarray): Color to select.
+        index (ColorIndex): Color index of `img`. Defaults to None.
+            If set to None the whole image is scanned.
 
     Returns:
         (:obj:`Iterator` of :obj:`Point2D`): Coordinates iterator.
 
     """
+    if index is not None:
+        return index.select(color)
     return map(Point2D, zip(*np.nonzero(np.all(img == color, axis=2))[::-1]))
@@ -1,6 +1,8 @@
 from .bookmark import bookmark
+from .convert import convert
 from .export import export
 from .help import help
 from .list import list
 from .open import open
 from .remove import remove
+from .search import search
@@ -1,12 +1,17 @@
 import numpy as np
 
-from lib.animation import BaseAnimation, ParallelAnimation, RectanglePositionAnimation, \
-    LineAnimation, LinePositionAnimation, LineThicknessAnimation, \
+from typing import Sequence
+
+from lib.animation import BaseAnimation, ParallelAnimation, SequenceAnimation, \
+    RectanglePositionAnimation, LineAnimation, LinePositionAnimation, \
+    LineThicknessAnimation, BatchRectangleAnimation, BatchLineAnimation, \
     RepeatMode, EasingFunc
 from lib.math_utils import metrics, Point2D
 
 
 fps = 60                      #: Animations frame rate.
+#: Time in ms to wait between the consecutive strokes in bookmark playback.
+stroke_interval = 250
 
 scale: int = None             #: Image scaling param.
 line_thickness: int = None    #: Line thickness.
@@ -16,6 +21,74 @@ img: np.ndarray = None        #: Current original image.
 l2_metric = metrics.L2Metric()
 
 
+def setup(image: np.ndarray, image_scale: int):
+    """
+    Set image and scaling used by the animations.
+
+    Args:
+        image (np.ndarray): Original image.
+        image_scale (int): Image scaling param.
+
+    """
+    global scale, line_thickness, border_thickness, img
+    scale = image_scale
+    line_thickness = scale + scale // 5
+    border_thickness = scale - scale * 3 // 5
+    img = image
+
+
+def bookmark_playback(strokes: Sequence[Sequence[Point2D]], speed: float = 1,
+                      disable_points: bool = False) -> tuple:
+    """
+    Bookmark playback animations.
+
+    Strokes are drawn one by one, each line propagates from its first
+    point to the second one with the speed of `speed` pixels per ms.
+
+    Args:
+        strokes (:obj:`Sequence` of :obj:`Sequence` of :obj:`Point2D`):
+            List of strokes to play.
+        speed (float): Playback speed. Defaults to 1.
+        disable_points (bool): Whether not to highlight points.
+            Defaults to False.
+
+    Returns:
+        BaseAnimation: Lines animation.
+        :obj:`BaseAnimation`, optional: Points animation,
+            None if `disable_points` is set.
+
+    """
+    lines = []
+    points = []
+    line_timestamps = [0]
+    point_timestamps = [0]
+    for path in strokes:
+        for i in range(1, len(path)):
+            duration = l2_metric(path[i - 1], path[i]) / speed
+            lines.append(line_propagate(path[i - 1], path[i], duration))
+            points.append(point_appear(path[i - 1]))
+            line_timestamps.append(line_timestamps[-1] + duration)
+            point_timestamps.append(point_timestamps[-1] + duration)
+        points.append(point_appear(path[-1]))
+        line_timestamps[-1] = line_timestamps[-1] + stroke_interval / max(speed, 1)
+        point_timestamps.append(line_timestamps[-1])
+    lines_animation = SequenceAnimation(
+        lines,
+        line_timestamps,
+        fps=fps,
+        repeat=RepeatMode.STICK
+    )
+    points_animation = None
+    if not disable_points:
+        points_animation = SequenceAnimation(
+            points,
+            point_timestamps,
+            fps=fps,
+            repeat=RepeatMode.STICK
+        )
+    return lines_animation, points_animation
+
+
 def point_appear(p: Point2D, stretch: int = 3, duration: int = 250,
                  reverse: bool = False) -> BaseAnimation:
     """
@@ -107,6 +180,98 @@ def point_pulse(p: Point2D, stretch_from: int = 3, stretch_to: float = 4,
     )
 
 
+def points_appear(points: Sequence[Point2D], stretch: int = 3, duration: int = 250,
+                  reverse: bool = False) -> BatchRectangleAnimation:
+    """
+    Image pixels enlarge animation.
+
+    Batch version of `point_appear`. Figures 2i and 2i+1 are the pixel
+    rectangle and the border of point i, see `points_restart`.
+
+    Args:
+        points (:obj:`Sequence` of :obj:`Point2D`): Rectangle centers.
+        stretch (int): Number of pixels to extend in each direction.
+            Defaults to 3. Rectangle size is `stretch` * 2 + 1.
+        duration (int): Animation duration in ms.
+            Defaults to 250 ms.
+        reverse (bool): Whether to reverse the animation.
+            Defaults to False.
+
+    Returns:
+        BatchRectangleAnimation: Points appear animation.
+
+    """
+    animation = _points(points, 0, stretch, duration,
+                        RepeatMode.STICK, EasingFunc.PULSEOUT)
+    if reverse:
+        animation.repeat = RepeatMode.ONEOFF
+        animation.reverse()
+    return animation
+
+
+def points_pulse(points: Sequence[Point2D], stretch_from: int = 3, stretch_to: float = 4,
+                 duration: int = 125) -> BatchRectangleAnimation:
+    """
+    Enlarged image pixels pulse animation.
+
+    Batch version of `point_pulse`. Figures 2i and 2i+1 are the pixel
+    rectangle and the border of point i, see `points_restart`.
+
+    Args:
+        points (:obj:`Sequence` of :obj:`Point2D`): Rectangle centers.
+        stretch_from (int): Starting rectangle size param.
+            Defaults to 3. Rectangle size is `stretch_from` * 2 + 1.
+        stretch_to (int): Intermediate rectangle size param.
+            Defaults to 4. Rectangle size is `stretch_to` * 2 + 1.
+        duration (int): Animation duration in ms.
+            Defaults to 125 ms.
+
+    Returns:
+        BatchRectangleAnimation: Points pulse animation.
+
+    """
+    return _points(points, stretch_from, stretch_to, duration,
+                   RepeatMode.SWING, EasingFunc.OUT)
+
+
+def points_restart(animation: BatchRectangleAnimation, indices: Sequence[int]):
+    """
+    Restart animations of some points.
+
+    Args:
+        animation (BatchRectangleAnimation): Points animation created
+            by `points_appear` or `points_pulse`.
+        indices (:obj:`Sequence` of :obj:`int`): Indices of points.
+
+    """
+    animation.restart([2 * i + j for i in indices for j in range(2)])
+
+
+def _points(points: Sequence[Point2D], stretch_from: float, stretch_to: float,
+            duration: int, repeat: RepeatMode, easing: EasingFunc) -> BatchRectangleAnimation:
+    # Every pixel rectangle is followed by its border, as in `point_appear`
+    coords = np.array([p.tuple for p in points], dtype=int).reshape(-1, 1, 2)
+    offset = np.array([0, 1]).reshape(1, 2, 1)
+    border = np.array([-(border_thickness // 2), border_thickness // 2]).reshape(1, 2, 1)
+    start = (coords + offset + np.array([-1, 1]).reshape(1, 2, 1) * stretch_from) * scale
+    finish = (coords + offset + np.array([-1, 1]).reshape(1, 2, 1) * stretch_to) * scale
+    n = len(coords)
+    thickness = np.full(2 * n, border_thickness)
+    thickness[::2] = -1
+    colors = np.stack((img[coords[:, 0, 1], coords[:, 0, 0]],
+                       np.full((n, 3), 255, dtype=img.dtype)), axis=1).reshape(-1, 3)
+    return BatchRectangleAnimation(
+        {"position": np.stack((start, start + border), axis=1).reshape(-1, 2, 2),
+         "color": colors,
+         "thickness": thickness},
+        {"position": np.stack((finish, finish + border), axis=1).reshape(-1, 2, 2)},
+        duration=duration,
+        fps=fps,
+        repeat=repeat,
+        easing=easing
+    )
+
+
 def line_propagate(p1: Point2D, p2: Point2D, duration: int = None,
                    reverse: bool = False) -> BaseAnimation:
     """
@@ -195,3 +360,66 @@ def line_instant(p1: Point2D, p2: Point2D) -> BaseAnimation:
         step=1,
         repeat=RepeatMode.STICK
     )
+
+
+def lines_appear(path: Sequence[Point2D], duration: int = 250,
+                 reverse: bool = False) -> BatchLineAnimation:
+    """
+    Path lines appear animation.
+
+    Batch version of `line_appear` for all segments of a path.
+
+    Args:
+        path (:obj:`Sequence` of :obj:`Point2D`): Sequence of points.
+        duration (int): Animation duration in ms.
+            Defaults to 250 ms.
+        reverse (bool): Whether to reverse the animation.
+            Defaults to False.
+
+    Returns:
+        BatchLineAnimation: Lines appear animation.
+
+    """
+    animation = BatchLineAnimation(
+        {"position": _segments(path),
+         "color": (0, 0, 0),
+         "thickness": 1},
+        {"thickness": line_thickness},
+        duration=duration,
+        fps=fps,
+        repeat=RepeatMode.STICK,
+        easing=EasingFunc.OUT
+    )
+    if reverse:
+        animation.repeat = RepeatMode.ONEOFF
+        animation.reverse()
+    return animation
+
+
+def lines_instant(path: Sequence[Point2D]) -> BatchLineAnimation:
+    """
+    Instanteneous path lines animation.
+
+    Batch version of `line_instant` for all segments of a path.
+
+    Args:
+        path (:obj:`Sequence` of :obj:`Point2D`): Sequence of points.
+
+    Returns:
+        BatchLineAnimation: Lines animation.
+
+    """
+    return BatchLineAnimation(
+        {"position": _segments(path),
+         "color": (0, 0, 0),
+         "thickness": line_thickness}, dict(),
+        duration=0,
+        step=1,
+        repeat=RepeatMode.STICK
+    )
+
+
+def _segments(path: Sequence[Point2D]) -> np.ndarray:
+    # Scaled (N - 1, 2, 2) array of path segments
+    coords = np.array([p.tuple for p in path], dtype=int).reshape(-1, 2) * scale + scale // 2
+    return np.stack((coords[:-1], coords[1:]), axis=1)
@@ -3,7 +3,7 @@ from typing import Sequence
 from lib.utils import get_bookmarks, bookmark_exists, save_bookmark, \
     print_lib, print_exception, print_red, print_cyan
 from lib.math_utils import Point2D, optimize_strokes
-from lib.command import Command, BookmarkParser
+from lib.command import Command, BookmarkParser, BinaryParser
 from lib.enums import BookmarkMode
 
 
@@ -20,8 +20,8 @@ def bookmark(response: Command, imgname: str,
 
     """
     try:
-        (mode, ), args = response.parse_options(
-            parsers=[BookmarkParser()],
+        (mode, binary), args = response.parse_options(
+            parsers=[BookmarkParser(), BinaryParser()],
         )
         bmkname = args[0]
     except ValueError as e:
@@ -41,7 +41,7 @@ def bookmark(response: Command, imgname: str,
         strokes = optimize_strokes(strokes)
 
     try:
-        save_bookmark(bmkname, imgname, strokes)
+        save_bookmark(bmkname, imgname, strokes, binary)
         print_lib(get_bookmarks(reload=True), "bookmark", suff="b")
     except BaseException as e:
         print_red(f"Cannot save \"{bmkname}\"!")
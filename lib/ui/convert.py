@@ -0,0 +1,55 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from time import perf_counter
+from tqdm import tqdm
+
+from lib.utils import get_images, image_converted, convert_image, \
+    print_exception, print_red, print_cyan
+from lib.command import Command, ForceParser, WorkersParser
+
+
+def convert(response: Command):
+    """
+    Convert images library command interface.
+
+    Args:
+        response (Command): User command.
+
+    """
+    try:
+        (force, workers), _ = response.parse_options(
+            parsers=[ForceParser(), WorkersParser()],
+            n_args=0
+        )
+    except ValueError as e:
+        print_exception(e)
+        return
+
+    imgnames = [name for name in get_images(reload=True)
+                if force or not image_converted(name)]
+    if len(imgnames) == 0:
+        print_cyan("All images are up to date.")
+        return
+
+    failed = []
+    start_time = perf_counter()
+    with ProcessPoolExecutor(workers) as executor:
+        futures = {executor.submit(_convert, name): name for name in imgnames}
+        for future in tqdm(as_completed(futures), total=len(futures),
+                           desc="Converting", unit="img"):
+            try:
+                future.result()
+            except BaseException as e:
+                failed.append((futures[future], e))
+    elapsed = perf_counter() - start_time
+
+    for name, e in failed:
+        print_red(f"Cannot convert \"{name}\":")
+        print_exception(e)
+    n_converted = len(imgnames) - len(failed)
+    print(f"Succesfully converted {n_converted} images in {elapsed:.1f} s "
+          f"({n_converted / elapsed:.1f} images/s).")
+
+
+def _convert(imgname: str):
+    # Runs in a worker process, the converted image is not sent back
+    convert_image(imgname)
@@ -1,10 +1,26 @@
+import os
+import cv2
+import shutil
+
+from time import perf_counter
 from typing import Sequence
+from tqdm import tqdm
 
+from . import animations as A
+from lib.animation import AnimationManager, OffscreenSink, VirtualClock
 from lib.math_utils import Point2D
-from lib.utils import exported_image_exists, export_image, \
-    print_exception, print_red, print_cyan
-from lib.command import Command, ScaleParser, ColorParser, \
-    ThicknessParser, TransparentParser
+from lib.utils import exported_image_exists, exported_video_exists, export_image, \
+    export_dir, open_image, FrameWriter, print_exception, print_red, print_cyan
+from lib.enums import ExportMode
+from lib.command import Command, ExportParser, ScaleParser, ColorParser, \
+    ThicknessParser, TransparentParser, SpeedParser, PointsParser
+
+#: Default image scaling of exported images.
+image_scale = 5
+#: Default image scaling of exported videos.
+video_scale = 2
+#: Time in ms to display the final frame at the end of a video.
+video_hold_time = 1000
 
 
 def export(response: Command, imgname: str,
@@ -20,10 +36,12 @@ def export(response: Command, imgname: str,
 
     """
     try:
-        (scale, color, thickness,
-         transparent), args = response.parse_options(
-            parsers=[ScaleParser(shortened=True, default=5), ColorParser(),
-                     ThicknessParser(), TransparentParser()],
+        (mode, scale, color, thickness, transparent,
+         speed, disable_points), args, toggled = response.parse_options(
+            parsers=[ExportParser(), ScaleParser(shortened=True), ColorParser(),
+                     ThicknessParser(), TransparentParser(),
+                     SpeedParser(), PointsParser()],
+            return_toggled=True
         )
         filename = args[0]
     except ValueError as e:
@@ -33,16 +51,110 @@ def export(response: Command, imgname: str,
         print_red("Filename missing!")
         return
 
-    if exported_image_exists(filename):
-        print_cyan(f"Exported image \"{filename}\" already exists!")
+    if mode != ExportMode.IMAGE and any(toggled[2:5]):
+        print_red("Color, thickness and transparency can only be set for images!")
+        return
+
+    if mode == ExportMode.IMAGE:
+        exists = exported_image_exists(filename)
+    else:
+        exists = exported_video_exists(filename, frames=mode == ExportMode.FRAMES)
+    if exists:
+        print_cyan(f"Exported {mode.name.lower()} \"{filename}\" already exists!")
         print("Overwrite? Y/N: ", end="")
         if input().lower() != "y":
             return
 
     try:
-        export_image(filename, imgname, strokes,
-                     scale, color, thickness, transparent)
+        if mode == ExportMode.IMAGE:
+            export_image(filename, imgname, strokes,
+                         image_scale if scale is None else scale,
+                         color, thickness, transparent)
+        else:
+            start_time = perf_counter()
+            n_frames = export_video(filename, imgname, strokes,
+                                    mode == ExportMode.FRAMES,
+                                    video_scale if scale is None else scale,
+                                    speed, disable_points)
+            elapsed = perf_counter() - start_time
+            print(f"Rendered {n_frames} frames in {elapsed:.1f} s "
+                  f"({n_frames / elapsed:.1f} frames/s).")
         print(f"Succesfully exported \"{filename}\".")
     except BaseException as e:
         print_red(f"Cannot export \"{filename}\"!")
         print_exception(e)
+
+
+def export_video(filename: str, imgname: str,
+                 strokes: Sequence[Sequence[Point2D]],
+                 frames: bool = False, scale: int = 2,
+                 speed: float = 1, disable_points: bool = False) -> int:
+    """
+    Export bookmark playback to a video.
+
+    The playback is rendered on a virtual clock at `animations.fps`,
+    frame times do not depend on the rendering speed. Frames are encoded
+    in background while the next ones are rendered.
+
+    Args:
+        filename (str): Export video name.
+        imgname (str): Background image name.
+        strokes (:obj:`Sequence` of :obj:`Sequence` of :obj:`Point2D`):
+            List of strokes to play.
+        frames (bool): Whether to export a PNG frame sequence
+            instead of an MP4 video. Defaults to False.
+        scale (int): Image scaling param. Defaults to 2.
+        speed (float): Playback speed. Defaults to 1.
+        disable_points (bool): Whether not to highlight points.
+            Defaults to False.
+
+    Returns:
+        int: Number of exported frames.
+
+    """
+    _, img = open_image(imgname)
+    A.setup(img, scale)
+
+    # Scaled image
+    img_show = cv2.resize(img, dsize=(img.shape[1] * scale,
+                                      img.shape[0] * scale),
+                          interpolation=cv2.INTER_NEAREST)
+
+    clock = VirtualClock()
+    manager = AnimationManager(None, img_show, OffscreenSink(), clock)
+    lines, points = A.bookmark_playback(strokes, speed, disable_points)
+    manager["lines"] = lines
+    duration = lines.duration
+    if points is not None:
+        manager.add("points", points, zindex=1)
+        duration = max(duration, points.duration)
+
+    if not os.path.isdir(export_dir):
+        os.mkdir(export_dir)
+    if frames:
+        path = export_dir + filename
+        if os.path.isdir(path):
+            shutil.rmtree(path)  # Remove frames of the overwritten sequence
+    else:
+        path = export_dir + filename + ".mp4"
+
+    writer = FrameWriter(path, A.fps, frames)
+    n_hold = video_hold_time * A.fps // 1000
+    with tqdm(total=-(-duration * A.fps // 1000) + 1 + n_hold,
+              desc="Rendering", unit="frame") as progress:
+        try:
+            i = 0
+            while True:
+                manager.refresh()
+                writer.write(manager.frame)
+                progress.update()
+                if manager.next_frame_time() is None:  # Playback finished
+                    break
+                i += 1
+                clock.tick(i * 1000 // A.fps - clock())
+            for _ in range(n_hold):
+                writer.write(manager.frame)
+                progress.update()
+        finally:
+            writer.close()
+    return writer.count
@@ -1,23 +1,35 @@
 import cv2
 import numpy as np
 
+from collections import Counter, deque
+from itertools import count
 from time import perf_counter_ns
 from typing import Optional, Sequence
 
 from . import animations as A
-from lib.animation import AnimationManager, ParallelAnimation, SequenceAnimation, RepeatMode
-from lib.utils import monitor_info, open_image, open_bookmark, print_exception, print_red
-from lib.math_utils import Point2D, line2d, metrics, walk, select_color
+from .survey import survey
+from lib.animation import AnimationManager, RepeatMode
+from lib.utils import monitor_info, open_image, open_bookmark, print_exception, print_red, \
+    WalkCache, WalkWorker
+from lib.math_utils import Point2D, ColorIndex, PointGrid, line2d, metrics, start_walk, \
+    select_color
 from lib.enums import OpenMode, EditorState, MagnetState
 from lib.command import Command, OpenParser, MetricParser, CoordsParser, IntersectParser, \
-    SpeedParser, PointsParser, ScaleParser, TimeLimitParser
+    SpeedParser, PointsParser, ScaleParser, TimeLimitParser, WorkersParser
 
 #: Time in ms to wait for the mouse to move before displaying a selection.
 still_wait_time = 500
-#: Time in ms to wait between the consecutive strokes in bookmark mode.
-stroke_interval = 250
 #: Distance in original image pixels for the magnet to activate.
 magnet_dist = 12
+#: Time in ms between the updates of a walk that exceeded the time limit.
+walk_update_time = 8
+#: Maximum time in ms to wait for input. Mouse events are queued
+#: while waiting and handled after the wait.
+input_wait_time = 1000 // A.fps
+#: Minimum time in ms between handled mouse moves. Moves queued
+#: in between are coalesced to the latest pointer position,
+#: except for line drawing where every move is handled.
+mouse_move_interval = 1000 // A.fps
 
 imgname: str = None                #: Opened image filename without the file extension.
 mode: OpenMode = None              #: Open mode.
@@ -25,19 +37,28 @@ metric: metrics.BaseMetric = None  #: Metric to use in the nearest point walk.
 allow_intersections: bool = None   #: Allow line self-intersections in the nearest point walk.
 time_limit: int = None             #: Time limit for the nearest point walk computation.
 img: np.ndarray = None             #: Current original image.
+index: ColorIndex = None           #: Pixels of the current image grouped by color.
 img_show: np.ndarray = None        #: Scaled image.
 scale: int = None                  #: Image scaling param.
 manager: AnimationManager = None   #: OpenCV animation manager.
+worker: WalkWorker = None          #: Background nearest point walk computation.
+cache: WalkCache = None            #: Complete nearest point walks of the current image.
 #: Current point, used to detect mouse movement and as the last point of the current stroke in draw mode.
 current_point: Point2D = None
 start_time: int = None             #: Starting time, used in waiting for the mouse to move.
 state: EditorState = None          #: Editor state.
 mstate: MagnetState = None         #: Magnet state.
 vertices: list = None              #: Selected pixels coordinates in draw mode.
+vertex_indices: dict = None        #: Indices of selected pixels in `vertices`.
+vertex_grid: PointGrid = None      #: Spatial index of `vertices` with the cell size of `magnet_dist`.
 strokes: list = None               #: List of strokes. A stroke is a sequence of points.
 undone_strokes: list = None        #: List of undone strokes. Cleared when a new stroke is added.
+edges: Counter = None              #: Number of occurrences of every undirected line segment in `strokes`.
+mouse_events: deque = None         #: Mouse events waiting to be handled, as (event, x, y) tuples.
+last_move_time: int = None         #: Time in ms of the last handled mouse move.
 
 l2_metric = metrics.L2Metric()
+batch_ids = count()  #: Unique keys of batch animations.
 
 
 def open(response: Command) -> Optional[tuple]:
@@ -54,19 +75,22 @@ def open(response: Command) -> Optional[tuple]:
 
     """
     global imgname, mode, metric, allow_intersections, time_limit, \
-        img, img_show, scale, manager, current_point, start_time, \
-        state, mstate, vertices, strokes, undone_strokes
+        img, index, img_show, scale, manager, current_point, start_time, \
+        state, mstate, vertices, strokes, undone_strokes, worker, cache, edges, \
+        mouse_events, last_move_time
 
     # Parse command options
     try:
         (mode, metric, current_point, allow_intersections, speed,
-         disable_points, scale, time_limit), args, toggled = response.parse_options(
+         disable_points, scale, time_limit, workers), args, toggled = response.parse_options(
             parsers=[OpenParser(), MetricParser(), CoordsParser(), IntersectParser(),
-                     SpeedParser(), PointsParser(), ScaleParser(), TimeLimitParser()],
+                     SpeedParser(), PointsParser(), ScaleParser(), TimeLimitParser(),
+                     WorkersParser()],
             return_toggled=True
         )
         filename = args[0]
         open_mode_toggled = toggled[0]
+        time_limit_toggled = toggled[7]
     except ValueError as e:
         print_exception(e)
         return None
@@ -83,12 +107,16 @@ def open(response: Command) -> Optional[tuple]:
             if mode == OpenMode.BOOKMARK:
                 print_exception(e)
                 return None
+            strokes = []
         except BaseException as e:
             print_red(f"Bookmark \"{filename}\" corrupted:")
             print_exception(e)
             return None
     else:
         strokes = []
+    edges = Counter()
+    for path in strokes:
+        add_edges(path)
 
     # Load image
     try:
@@ -96,11 +124,20 @@ def open(response: Command) -> Optional[tuple]:
     except FileNotFoundError as e:
         print_exception(e)
         return None
+    index = ColorIndex(img)
+    cache = WalkCache(imgname)
+    cache.load()
 
     # Cosine similarity metric requires center point coordinates
     if metric.name == "cos":
         metric.p_center = Point2D(img.shape[1], img.shape[0]) // 2
 
+    # Walks from every starting point without the editor
+    if mode == OpenMode.SURVEY:
+        survey(imgname, img, index, current_point, metric, allow_intersections,
+               time_limit if time_limit_toggled else None, workers)
+        return None
+
     # Scale UI according to monitor resolution
     max_scale = max(1, min(monitor_info.work_h // img.shape[0],
                            monitor_info.work_w // img.shape[1]))
@@ -108,10 +145,7 @@ def open(response: Command) -> Optional[tuple]:
         scale = max_scale
     else:
         scale = min(scale, max_scale)
-    A.scale = scale
-    A.line_thickness = scale + scale // 5
-    A.border_thickness = scale - scale * 3 // 5
-    A.img = img
+    A.setup(img, scale)
 
     # Scaled image
     img_show = cv2.resize(img, dsize=(img.shape[1] * scale,
@@ -120,10 +154,13 @@ def open(response: Command) -> Optional[tuple]:
 
     # OpenCV animation manager
     manager = AnimationManager(imgname, img_show)
+    worker = WalkWorker(walk_update_time)
 
     # Default values
     start_time = None
     state = EditorState.INIT
+    mouse_events = deque()
+    last_move_time = 0
 
     # Manual coords option
     if current_point is None:
@@ -141,34 +178,10 @@ def open(response: Command) -> Optional[tuple]:
     # Bookmark animation
     if mode == OpenMode.BOOKMARK:
         try:
-            lines = []
-            points = []
-            line_timestamps = [0]
-            point_timestamps = [0]
-            for path in strokes:
-                for i in range(1, len(path)):
-                    duration = l2_metric(path[i - 1], path[i]) / speed
-                    lines.append(A.line_propagate(path[i - 1], path[i], duration))
-                    points.append(A.point_appear(path[i - 1]))
-                    line_timestamps.append(line_timestamps[-1] + duration)
-                    point_timestamps.append(point_timestamps[-1] + duration)
-                points.append(A.point_appear(path[-1]))
-                line_timestamps[-1] = line_timestamps[-1] + stroke_interval / max(speed, 1)
-                point_timestamps.append(line_timestamps[-1])
-            manager["lines"] = SequenceAnimation(
-                lines,
-                line_timestamps,
-                fps=A.fps,
-                repeat=RepeatMode.STICK
-            )
-            if not disable_points:
-                manager["points"] = SequenceAnimation(
-                    points,
-                    point_timestamps,
-                    fps=A.fps,
-                    repeat=RepeatMode.STICK
-                )
-                manager.set_zindex("points", 1)
+            lines, points = A.bookmark_playback(strokes, speed, disable_points)
+            manager["lines"] = lines
+            if points is not None:
+                manager.add("points", points, zindex=1)
         except BaseException as e:
             print_red(f"Bookmark corrupted:")
             print_exception(e)
@@ -179,7 +192,8 @@ def open(response: Command) -> Optional[tuple]:
 
     # Main editor loop
     while cv2.getWindowProperty(imgname, cv2.WND_PROP_VISIBLE) > 0:
-        key = cv2.waitKey(1) & 0xFF                 # Wait for a keypress
+        key = cv2.waitKey(wait_time()) & 0xFF       # Wait for a keypress or the next frame
+        handle_mouse_events(flush=key != 255)       # Mouse events come before the keypress
 
         if key == 27:                               # Break when 'Esc' is pressed
             break
@@ -187,29 +201,23 @@ def open(response: Command) -> Optional[tuple]:
             if len(strokes) > 0:
                 path = strokes.pop()
                 undone_strokes.append(path)
-                for i in range(1, len(path)):
-                    manager[f"line_{path[i - 1]}_{path[i]}"] = A.line_appear(path[i - 1],
-                                                                             path[i],
-                                                                             reverse=True)
-                    manager[f"point_{path[i - 1]}"].reset()
-                manager[f"point_{path[-1]}"].reset()
+                remove_edges(path)
+                if ("stroke", len(strokes)) in manager:  # Lines are removed after 'D'
+                    manager["stroke", len(strokes)].disable()
+                manager.add(next(batch_ids), A.lines_appear(path, reverse=True), group="lines")
+                points_reset(path)
         elif mode == OpenMode.DRAW and key == 121:  # Redo when 'Y' is pressed
             if len(undone_strokes) > 0:
                 path = undone_strokes.pop()
                 strokes.append(path)
-                for i in range(1, len(path)):
-                    manager[f"line_{path[i - 1]}_{path[i]}"] = A.line_appear(path[i - 1],
-                                                                             path[i])
-                    manager[f"point_{path[i - 1]}"].reset()
-                manager[f"point_{path[-1]}"].reset()
+                add_edges(path)
+                stroke_lines(len(strokes) - 1, appear=True)
+                points_reset(path)
         elif mode == OpenMode.DRAW and key == 100:  # Deselect when 'D' is pressed
             state = EditorState.INIT
             manager.clear()
             for path in strokes:
-                for i in range(1, len(path)):
-                    manager[f"lineth_{path[i - 1]}_{path[i]}"] = A.line_appear(path[i - 1],
-                                                                               path[i],
-                                                                               reverse=True)
+                manager.add(next(batch_ids), A.lines_appear(path, reverse=True), group="lines")
             points_disappear(vertices)
 
         # Show selection if the mouse pointer has not moved for `still_wait_time` ms
@@ -217,17 +225,98 @@ def open(response: Command) -> Optional[tuple]:
                 perf_counter_ns() // 1000000 - start_time >= still_wait_time):
             select_normal()
 
+        # Display the walk computed in background
+        result = worker.poll()
+        if result is not None:
+            path, truncated = result
+            if not truncated:
+                cache.put(path, metric, allow_intersections)
+            show_walk(path)
+
         manager.refresh()    # Redraw animations if needed
 
     cv2.destroyAllWindows()  # Close the OpenCV window
+    worker.close()
+    cache.save()
 
     # Return the results of editing if any
     return (imgname, strokes) if len(strokes) > 0 else None
 
 
+def wait_time() -> int:
+    """
+    Time to wait for input until the editor loop has work to do.
+
+    Returns:
+        int: Time in ms, at least 1 ms.
+
+    """
+    time = perf_counter_ns() // 1000000
+    deadlines = [time + input_wait_time]
+    frame_time = manager.next_frame_time()
+    if frame_time is not None:
+        deadlines.append(frame_time)
+    if state == EditorState.AWAIT:
+        deadlines.append(start_time + still_wait_time)
+    if worker.busy:
+        deadlines.append(time + walk_update_time)
+    if len(mouse_events) > 0:
+        deadlines.append(last_move_time + mouse_move_interval)
+    return max(min(deadlines) - time, 1)
+
+
 def mouse_callback(event: int, x: int, y: int,
                    flags, param):
     """
+    Mouse event callback.
+
+    Events are queued to be handled in the editor loop.
+
+    Args:
+        event (int): OpenCV mouse event id.
+        x (int): Mouse x coordinate.
+        y (int): Mouse y coordinate.
+
+    """
+    mouse_events.append((event, x, y))
+
+
+def handle_mouse_events(flush: bool = False):
+    """
+    Handle queued mouse events in order.
+
+    Consecutive mouse moves are coalesced to the latest one, unless
+    a line is drawn: the magnet needs every pointer position, otherwise
+    vertices passed between the moves are skipped. A mouse move at the end
+    of the queue is delayed until `mouse_move_interval` ms have passed
+    since the last handled move.
+
+    Args:
+        flush (bool): Whether to handle all events without delay.
+            Defaults to False.
+
+    """
+    global last_move_time
+
+    while len(mouse_events) > 0:
+        event, x, y = mouse_events[0]
+        if event == cv2.EVENT_MOUSEMOVE:
+            # The state is checked for every move, preceding events may change it
+            if state != EditorState.DRAW_DRAG:
+                while len(mouse_events) > 1 and mouse_events[1][0] == cv2.EVENT_MOUSEMOVE:
+                    mouse_events.popleft()
+                event, x, y = mouse_events[0]
+            time = perf_counter_ns() // 1000000
+            if (not flush and len(mouse_events) == 1 and
+                    time - last_move_time < mouse_move_interval):
+                break
+            last_move_time = time
+        mouse_events.popleft()
+        handle_mouse_event(event, x, y)
+
+
+def handle_mouse_event(event: int, x: int, y: int):
+    """
     Mouse event handler.
 
     Args:
@@ -236,7 +325,7 @@ def mouse_callback(event: int, x: int, y: int,
         y (int): Mouse y coordinate.
 
     """
-    global mode, manager, current_point, start_time, state, mstate, strokes, undone_strokes
+    global mode, manager, current_point, start_time, state, mstate, strokes, undone_strokes, edges
 
     if mode != OpenMode.BOOKMARK and event == cv2.EVENT_MOUSEMOVE:  # Mouse move
         mouse_point = Point2D(x, y) // scale
@@ -248,16 +337,16 @@ def mouse_callback(event: int, x: int, y: int,
                     if dist <= magnet_dist and semiplane < 0:
                         mstate = MagnetState.REMOVE
                 if mstate == MagnetState.STANDBY:  # Add a new point to the current stroke
-                    for p in vertices:
+                    for i in vertex_grid.radius(mouse_point, magnet_dist).tolist():
+                        p = vertices[i]
                         if p == current_point:
                             continue
-                        dist = l2_metric(p, mouse_point)
                         semiplane = line2d.normal(current_point, p)(mouse_point)
-                        if (dist <= magnet_dist and semiplane < 0 and
-                                not line_exists(p, current_point)):
+                        if semiplane < 0 and not line_exists(p, current_point):
                             strokes[-1].append(p)
-                            manager[f"line_{current_point}_{p}"] = A.line_instant(current_point, p)
-                            manager[f"point_{p}"].reset()
+                            add_edges([current_point, p])
+                            stroke_lines(len(strokes) - 1)
+                            points_reset([p])
                             current_point = p
                             break
             elif mstate == MagnetState.REMOVE:     # Remove the last point from the current stroke
@@ -268,8 +357,9 @@ def mouse_callback(event: int, x: int, y: int,
                 elif semiplane > 0:
                     mstate = MagnetState.STANDBY
                     strokes[-1].pop()
-                    manager[f"line_{strokes[-1][-1]}_{current_point}"].disable()
-                    manager[f"point_{current_point}"].reset()
+                    remove_edges([strokes[-1][-1], current_point])
+                    stroke_lines(len(strokes) - 1)
+                    points_reset([current_point])
                     current_point = strokes[-1][-1]
             manager["drag_line"] = A.line_instant(current_point, mouse_point)
         elif (state == EditorState.INIT or state == EditorState.AWAIT or
@@ -277,6 +367,7 @@ def mouse_callback(event: int, x: int, y: int,
             if mode == OpenMode.NORMAL or mode == OpenMode.DRAW:  # Hide current selection and wait
                 if state == EditorState.SELECT:
                     reverse_animations()
+                    worker.cancel()
                 current_point = mouse_point
                 start_time = perf_counter_ns() // 1000000
                 state = EditorState.AWAIT
@@ -289,6 +380,7 @@ def mouse_callback(event: int, x: int, y: int,
                 state = EditorState.DRAW_STANDBY
                 strokes = []
                 undone_strokes = []
+                edges = Counter()
                 points_pulse(vertices)
             elif state == EditorState.DRAW_DRAG:  # Complete current stroke
                 state = EditorState.DRAW_STANDBY
@@ -306,22 +398,24 @@ def mouse_callback(event: int, x: int, y: int,
             manager.clear()
             select_normal()
             state = EditorState.DRAW_STANDBY
-            for path in strokes:
-                for i in range(1, len(path)):
-                    manager[f"line_{path[i - 1]}_{path[i]}"] = A.line_instant(path[i - 1], path[i])
+            for i in range(len(strokes)):
+                stroke_lines(i)
             points_pulse(vertices)
         elif state == EditorState.LOCK:  # Unlock selection
             if mode == OpenMode.NORMAL:
-                points_appear(strokes[0])
+                if len(strokes) > 0:
+                    points_appear(strokes[0])
                 reverse_animations()
             elif mode == OpenMode.FAST:
                 manager.clear()
             strokes = []
             state = EditorState.INIT
+            worker.cancel()
         elif mode == OpenMode.NORMAL:    # Lock selection in normal mode
             if state == EditorState.SELECT:
                 state = EditorState.LOCK
-                points_pulse(strokes[0])
+                if len(strokes) > 0:
+                    points_pulse(strokes[0])
             else:
                 select_normal()
                 state = EditorState.LOCK
@@ -330,10 +424,10 @@ def mouse_callback(event: int, x: int, y: int,
     elif (state == EditorState.DRAW_STANDBY and
           event == cv2.EVENT_LBUTTONDOWN):  # Mouse left button down, start a new stroke in draw mode
         mouse_point = Point2D(x, y) // scale
-        current_point = vertices[np.argmin([l2_metric(p, mouse_point) for p in vertices])]
+        current_point = vertices[vertex_grid.nearest(mouse_point)]
         strokes.append([current_point])
         manager["drag_line"] = A.line_instant(current_point, mouse_point)
-        manager[f"point_{current_point}"].reset()
+        points_reset([current_point])
         mstate = MagnetState.STANDBY
         state = EditorState.DRAW_DRAG
 
@@ -343,22 +437,99 @@ def select_fast():
     Show selection without animations.
 
     """
-    global manager, strokes
+    request_walk()
+
 
+def request_walk() -> bool:
+    """
+    Start nearest point walk from the current point.
+
+    A cached walk is displayed at once, otherwise the walk
+    is computed in background.
+
+    Returns:
+        bool: False if the walk can not be started.
+
+    """
+    global strokes
+
+    strokes = []
+    path = cache.get(current_point, metric, allow_intersections)
+    if path is not None:
+        worker.cancel()
+        show_walk(path)
+        return True
     try:
-        path = walk(img, current_point, metric, allow_intersections, time_limit)
-    except (TimeoutError, IndexError) as e:
+        worker.submit(start_walk(img, current_point, metric, allow_intersections, index),
+                      time_limit)
+    except IndexError as e:
+        worker.cancel()
         print_exception(e)
-        return
+        return False
+    return True
+
+
+def path_instant(path: Sequence[Point2D]):
+    """
+    Display a path without animations.
+
+    Args:
+        path (:obj:`Sequence` of :obj:`Point2D`):
+            Sequence of points.
+
+    """
+    global manager
+
+    if len(path) > 1:
+        manager["path"] = A.lines_instant(path)
+    elif "path" in manager:
+        manager["path"].disable()
+
+
+def stroke_lines(i: int, appear: bool = False):
+    """
+    Display lines of a stroke in draw mode.
+
+    Replaces the previous lines of the stroke.
+
+    Args:
+        i (int): Stroke index in `strokes`.
+        appear (bool): Whether to animate the lines appearance.
+            Defaults to False.
+
+    """
+    global manager
+
+    path = strokes[i]
+    if len(path) > 1:
+        manager["stroke", i] = A.lines_appear(path) if appear else A.lines_instant(path)
+    elif ("stroke", i) in manager:
+        manager["stroke", i].disable()
+
+
+def show_walk(path: Sequence[Point2D]):
+    """
+    Display new points of the walk computed in background.
+
+    Args:
+        path (:obj:`Sequence` of :obj:`Point2D`):
+            A sequence of points visited in the walk so far.
+
+    """
+    global strokes
+
+    n_visited = len(strokes[0]) if len(strokes) > 0 else 0
     strokes = [path]
-    lines = []
-    for i in range(1, len(path)):
-        lines.append(A.line_instant(path[i - 1], path[i]))
-    manager["path"] = ParallelAnimation(
-        lines,
-        step=1,
-        repeat=RepeatMode.STICK
-    )
+    if mode == OpenMode.NORMAL:
+        if len(path) > max(n_visited, 1):
+            manager.add(next(batch_ids), A.lines_appear(path[max(n_visited, 1) - 1:]),
+                        group="lines")
+        if state == EditorState.LOCK:  # Points computed after the lock pulse like the locked ones
+            points_pulse(path[n_visited:], replace=False)
+        else:
+            points_appear(path[n_visited:])
+    elif mode == OpenMode.FAST:
+        path_instant(path)
 
 
 def line_exists(p1: Point2D, p2: Point2D) -> bool:
@@ -373,12 +544,36 @@ def line_exists(p1: Point2D, p2: Point2D) -> bool:
         bool: True if a line segment exists.
 
     """
-    for path in strokes:
-        for i in range(1, len(path)):
-            if ((path[i - 1] == p1 and path[i] == p2) or
-                    (path[i - 1] == p2 and path[i] == p1)):
-                return True
-    return False
+    return frozenset((p1, p2)) in edges
+
+
+def add_edges(path: Sequence[Point2D]):
+    """
+    Add line segments of a path to the existing ones.
+
+    Args:
+        path (:obj:`Sequence` of :obj:`Point2D`):
+            Sequence of points.
+
+    """
+    for i in range(1, len(path)):
+        edges[frozenset((path[i - 1], path[i]))] += 1
+
+
+def remove_edges(path: Sequence[Point2D]):
+    """
+    Remove line segments of a path from the existing ones.
+
+    Args:
+        path (:obj:`Sequence` of :obj:`Point2D`):
+            Sequence of points.
+
+    """
+    for i in range(1, len(path)):
+        edge = frozenset((path[i - 1], path[i]))
+        edges[edge] -= 1
+        if edges[edge] == 0:
+            del edges[edge]
 
 
 def select_normal():
@@ -386,24 +581,19 @@ def select_normal():
     Show selection with animations.
 
     """
-    global manager, state, mstate, vertices, strokes, undone_strokes
+    global manager, state, mstate, vertices, vertex_indices, vertex_grid, strokes, undone_strokes
 
     state = EditorState.SELECT
     if mode == OpenMode.NORMAL:
-        try:
-            path = walk(img, current_point, metric, allow_intersections, time_limit)
-        except (TimeoutError, IndexError) as e:
+        if not request_walk():
             state = EditorState.INIT
-            print_exception(e)
-            return
-        strokes = [path]
-        for i in range(1, len(path)):
-            manager[f"lineth_{path[i - 1]}_{path[i]}"] = A.line_appear(path[i - 1], path[i])
-        points_appear(path)
     elif mode == OpenMode.DRAW:
         mstate = MagnetState.STANDBY
         undone_strokes = []
-        vertices = list(select_color(img, img[current_point.y, current_point.x]))
+        vertices = list(select_color(img, img[current_point.y, current_point.x], index))
+        vertex_indices = {p: i for i, p in enumerate(vertices)}
+        vertex_grid = PointGrid(np.array([p.tuple for p in vertices], dtype=np.int64).reshape(-1, 2),
+                                cell_size=magnet_dist)
         points_appear(vertices)
 
 
@@ -415,7 +605,8 @@ def reverse_animations():
     global manager
 
     for key, animation in manager.items():
-        if key.startswith("point") or key.startswith("lineth"):
+        group = manager.get_group(key)
+        if group == "points" or group == "lines":
             animation.repeat = RepeatMode.ONEOFF
             animation.reverse()
         else:
@@ -433,9 +624,8 @@ def points_appear(points: Sequence[Point2D]):
     """
     global manager
 
-    for p in points:
-        manager[f"point_{p}"] = A.point_appear(p)
-        manager.set_zindex(f"point_{p}", 1)
+    if len(points) > 0:
+        manager.add(next(batch_ids), A.points_appear(points), zindex=1, group="points")
 
 
 def points_disappear(points: Sequence[Point2D]):
@@ -449,15 +639,36 @@ def points_disappear(points: Sequence[Point2D]):
     """
     global manager
 
-    for p in points:
-        manager[f"point_{p}"] = A.point_appear(p, reverse=True)
-        manager.set_zindex(f"point_{p}", 1)
+    if len(points) > 0:
+        manager.add(next(batch_ids), A.points_appear(points, reverse=True),
+                    zindex=1, group="points")
 
 
-def points_pulse(points: Sequence[Point2D]):
+def points_pulse(points: Sequence[Point2D], replace: bool = True):
     """
     Enlarged pixels pulse.
 
+    Args:
+        points (:obj:`Sequence` of :obj:`Point2D`):
+            Selected pixels coordinates.
+        replace (bool): Whether to replace the other point animations.
+            Defaults to True. The replacing pulse can be restarted
+            with `points_reset`.
+
+    """
+    global manager
+
+    if replace:
+        manager.clear("points")
+        manager.add("points", A.points_pulse(points), zindex=1, group="points")
+    elif len(points) > 0:
+        manager.add(next(batch_ids), A.points_pulse(points), zindex=1, group="points")
+
+
+def points_reset(points: Sequence[Point2D]):
+    """
+    Pulse selected pixels again in draw mode.
+
     Args:
         points (:obj:`Sequence` of :obj:`Point2D`):
             Selected pixels coordinates.
@@ -465,6 +676,6 @@ def points_pulse(points: Sequence[Point2D]):
     """
     global manager
 
-    for p in points:
-        manager[f"point_{p}"] = A.point_pulse(p)
-        manager.set_zindex(f"point_{p}", 1)
+    if "points" in manager:
+        A.points_restart(manager["points"], [vertex_indices[p] for p in points
+                                             if p in vertex_indices])
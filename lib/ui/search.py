@@ -0,0 +1,103 @@
+from time import perf_counter
+from tqdm import tqdm
+
+from lib.utils import get_bookmarks, get_bookmark_name, bookmark_exists, open_bookmark_arrays, \
+    save_bookmark, search_library, WalkSearch, SEARCH_TIME_LIMIT, \
+    print_lib, print_exception, print_red, print_cyan
+from lib.command import Command, MetricParser, IntersectParser, TimeLimitParser, \
+    TopParser, WorkersParser, ForceParser
+
+
+def search(response: Command):
+    """
+    Search images library command interface.
+
+    Finds the walks most similar in shape to the bookmark strokes
+    in all the images and saves them as bookmarks.
+
+    Args:
+        response (Command): User command.
+
+    """
+    try:
+        (metric, allow_intersections, time_limit,
+         top, workers, force), args, toggled = response.parse_options(
+            parsers=[MetricParser(), IntersectParser(), TimeLimitParser(),
+                     TopParser(), WorkersParser(), ForceParser()],
+            return_toggled=True
+        )
+        bmkname = get_bookmark_name(args[0])
+    except ValueError as e:
+        print_exception(e)
+        return
+    except IndexError:
+        print_red("Bookmark name missing!")
+        return
+    if not toggled[2]:
+        time_limit = SEARCH_TIME_LIMIT
+
+    try:
+        _, offsets, coords = open_bookmark_arrays(bmkname)
+    except FileNotFoundError as e:
+        print_exception(e)
+        return
+    except BaseException as e:
+        print_red(f"Bookmark \"{bmkname}\" corrupted:")
+        print_exception(e)
+        return
+    if len(coords) < 2:
+        print_red(f"Bookmark \"{bmkname}\" has no shape to search for!")
+        return
+
+    walk_search = WalkSearch(bmkname, offsets, coords, metric,
+                             allow_intersections, time_limit, top)
+    if force:
+        walk_search.reset()
+    elif walk_search.load():
+        print_cyan(f"Resuming search, {len(walk_search)} images already processed.")
+
+    library = walk_search.pending(search_library(reload=True))
+    start_time = perf_counter()
+    try:
+        with tqdm(total=len(library), desc="Searching", unit="img") as progress:
+            failed = walk_search.run(library, workers, lambda _: progress.update())
+    except KeyboardInterrupt:
+        print_cyan(f"Search interrupted, {len(walk_search)} images processed. "
+                   f"Run the command again to resume.")
+        return
+    elapsed = perf_counter() - start_time
+
+    for name, e in failed:
+        print_red(f"Cannot search in \"{name}\":")
+        print_exception(e)
+    n_searched = len(library) - len(failed)
+    if n_searched > 0:
+        print(f"Succesfully searched {n_searched} images in {elapsed:.1f} s "
+              f"({elapsed / n_searched:.1f} s/image).")
+
+    results = walk_search.results
+    if len(results) == 0:
+        print_cyan("No matches found.")
+        return
+
+    images = walk_search.images
+    names = [f"{bmkname}_match{i + 1}" for i in range(len(results))]
+    for i, record in enumerate(results):
+        truncated = " (truncated)" if record["truncated"] else ""
+        print(f"{names[i]}: {images[record['image']]} -c={record['x']},{record['y']}, "
+              f"distance {record['distance']:.3f}{truncated}")
+
+    if any(map(bookmark_exists, names)):
+        print_cyan(f"Bookmarks \"{bmkname}_match*\" already exist!")
+        print("Overwrite? Y/N: ", end="")
+        if input().lower() != "y":
+            return
+
+    for name, record in zip(names, results):
+        try:
+            imgname, path = walk_search.match(record)
+            save_bookmark(name, imgname, [path])
+        except BaseException as e:
+            print_red(f"Cannot save \"{name}\"!")
+            print_exception(e)
+    print_lib(get_bookmarks(reload=True), "bookmark", suff="b")
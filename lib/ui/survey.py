@@ -0,0 +1,56 @@
+import numpy as np
+
+from time import perf_counter
+from tqdm import tqdm
+
+from lib.math_utils import Point2D, ColorIndex, metrics
+from lib.utils import survey_starts, survey_walks, save_survey, survey_path, \
+    print_exception, print_red
+
+
+def survey(imgname: str, img: np.ndarray, index: ColorIndex,
+           p_color: Point2D, metric: metrics.BaseMetric,
+           allow_intersections: bool, time_limit: int = None,
+           workers: int = None):
+    """
+    Survey open mode interface.
+
+    Performs nearest point walks from every pixel of the image
+    and saves their statistics next to the converted image.
+
+    Args:
+        imgname (str): Image name without the file extension.
+        img (np.ndarray): Converted image.
+        index (ColorIndex): Color index of `img`.
+        p_color (:obj:`Point2D`, optional): Pixel with the color of
+            the starting points. If set to None every pixel is surveyed.
+        metric (metrics.BaseMetric): Metric to use in the walks.
+        allow_intersections (bool): Whether to allow line self-intersections.
+        time_limit (int): Time limit for a single walk in ms.
+            Defaults to None. If set to None walks are not limited.
+        workers (int): Number of worker processes. Defaults to None.
+            If set to None the number of CPUs is used.
+
+    """
+    try:
+        color = None if p_color is None else img[p_color.y, p_color.x]
+    except IndexError:
+        print_red(f"Point {p_color} is outside the image!")
+        return
+    starts = survey_starts(img, color, index)
+
+    start_time = perf_counter()
+    try:
+        with tqdm(total=len(starts), desc="Surveying", unit="walk") as progress:
+            results = survey_walks(img, starts, metric, allow_intersections,
+                                   time_limit, workers, progress.update)
+        save_survey(imgname, results, metric, allow_intersections, color)
+    except BaseException as e:
+        print_red(f"Cannot survey \"{imgname}\"!")
+        print_exception(e)
+        return
+    elapsed = perf_counter() - start_time
+
+    print(f"Succesfully surveyed {len(results)} starting points in {elapsed:.1f} s "
+          f"({len(results) / elapsed:.1f} walks/s).")
+    print(f"Results saved to \"{survey_path(imgname, color)}\".")
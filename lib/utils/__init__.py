@@ -1,6 +1,11 @@
 from .bookmark import *
 from .export_image import *
+from .frame_writer import *
 from .get_manual import *
 from .open_image import *
 from .print_utils import *
 from .round_image import *
+from .walk_cache import *
+from .walk_search import *
+from .walk_survey import *
+from .walk_worker import *
@@ -1,11 +1,21 @@
 import io
 import os
+import struct
+import numpy as np
 
 from typing import Sequence
 
 from lib.math_utils import Point2D
 
 
+#: Binary bookmark file signature.
+BINARY_SIGNATURE = b"\x89BMK"
+#: Binary bookmark format version.
+BINARY_VERSION = 1
+#: Binary bookmark header: signature, version, image name length in bytes,
+#: number of strokes, number of points.
+_header = struct.Struct("<4sHHII")
+
 bookmarks_dir = "data/__bookmarks__/"
 _bookmarks = None
 
@@ -70,6 +80,9 @@ def open_bookmark(filename: str) -> tuple:
     """
     Read bookmark content.
 
+    Both text and binary bookmark formats are supported,
+    the format is detected by the file signature.
+
     Args:
         filename (str): Bookmark name or index.
 
@@ -85,7 +98,14 @@ def open_bookmark(filename: str) -> tuple:
     bmkname = get_bookmark_name(filename)
 
     if bookmark_exists(bmkname):
-        file = io.open(bookmarks_dir + bmkname + ".bmk", mode="r")
+        path = bookmarks_dir + bmkname + ".bmk"
+        if _is_binary(path):
+            imgname, offsets, coords = _read_binary(path)
+            points = list(map(Point2D, map(tuple, coords.tolist())))
+            strokes = [points[start:stop] for start, stop
+                       in zip(offsets[:-1].tolist(), offsets[1:].tolist())]
+            return imgname, strokes
+        file = io.open(path, mode="r")
         lines = file.readlines()
         file.close()
         imgname = lines[0][:-1]
@@ -95,18 +115,78 @@ def open_bookmark(filename: str) -> tuple:
     raise FileNotFoundError(f"bookmark \"{bmkname}\" not found")
 
 
+def open_bookmark_arrays(filename: str) -> tuple:
+    """
+    Read bookmark content as NumPy arrays.
+
+    Binary bookmarks are memory-mapped, so that the strokes are
+    loaded from disk lazily on access. Stroke `i` consists of points
+    `coords[offsets[i]:offsets[i + 1]]`.
+
+    Args:
+        filename (str): Bookmark name or index.
+
+    Returns:
+        str: Bookmark image name.
+        np.ndarray: (n + 1) integer array of stroke offsets.
+        np.ndarray: Read-only (m, 2) int16 array of (x, y) coordinates.
+
+    Raises:
+        FileNotFoundError: If a bookmark with a given name or
+            index does not exist.
+
+    """
+    bmkname = get_bookmark_name(filename)
+
+    if bookmark_exists(bmkname):
+        path = bookmarks_dir + bmkname + ".bmk"
+        if _is_binary(path):
+            return _read_binary(path)
+        file = io.open(path, mode="r")
+        lines = file.readlines()
+        file.close()
+        strokes = [np.array(line.replace(" ", ",").split(sep=","),
+                            dtype=np.int16).reshape(-1, 2) for line in lines[1:]]
+        offsets = np.cumsum([0] + [len(stroke) for stroke in strokes])
+        coords = np.concatenate(strokes) if len(strokes) > 0 else np.empty((0, 2), np.int16)
+        coords.flags.writeable = False
+        return lines[0][:-1], offsets, coords
+    raise FileNotFoundError(f"bookmark \"{bmkname}\" not found")
+
+
 def save_bookmark(bmkname: str, imgname: str,
-                  strokes: Sequence[Sequence[Point2D]]):
+                  strokes: Sequence[Sequence[Point2D]],
+                  binary: bool = False):
     """
     Save bookmark to disk.
 
+    Binary format layout: `_header`, image name in UTF-8 padded with zeros
+    to 4 bytes, uint32 stroke offsets, int16 (x, y) coordinates.
+    All numbers are little-endian.
+
     Args:
         bmkname (str): Bookmark name.
         imgname (str): Bookmark image name.
         strokes (:obj:`Sequence` of :obj:`Sequence` of :obj:`Point2D`):
             List of strokes to save.
+        binary (bool): Whether to use the binary format.
+            Defaults to False.
 
     """
+    if binary:
+        name = imgname.encode("utf-8")
+        offsets = np.cumsum([0] + [len(stroke) for stroke in strokes], dtype="<u4")
+        coords = np.array([p.tuple for stroke in strokes for p in stroke], dtype="<i2")
+        file = io.open(bookmarks_dir + bmkname + ".bmk", mode="wb")
+        file.write(_header.pack(BINARY_SIGNATURE, BINARY_VERSION, len(name),
+                                len(strokes), offsets[-1]))
+        file.write(name + bytes(-len(name) % 4))
+        file.write(offsets.tobytes())
+        file.write(coords.tobytes())
+        file.flush()
+        file.close()
+        return
+
     file = io.open(bookmarks_dir + bmkname + ".bmk", mode="w")
     file.write(imgname + "\n")
     file.writelines([" ".join([str(p) for p in stroke]) + "\n"
@@ -128,3 +208,45 @@ def remove_bookmark(bmkname: str):
 
     """
     os.remove(bookmarks_dir + bmkname + ".bmk")
+
+
+def _is_binary(path: str) -> bool:
+    file = io.open(path, mode="rb")
+    signature = file.read(len(BINARY_SIGNATURE))
+    file.close()
+    return signature == BINARY_SIGNATURE
+
+
+def _read_binary(path: str) -> tuple:
+    """
+    Memory-map binary bookmark.
+
+    Args:
+        path (str): Bookmark file path.
+
+    Returns:
+        str: Bookmark image name.
+        np.ndarray: (n + 1) uint32 array of stroke offsets.
+        np.ndarray: Read-only (m, 2) int16 array of (x, y) coordinates.
+
+    Raises:
+        ValueError: If the format version is not supported.
+
+    """
+    file = io.open(path, mode="rb")
+    _, version, name_length, n_strokes, n_points = _header.unpack(file.read(_header.size))
+    if version != BINARY_VERSION:
+        file.close()
+        raise ValueError(f"binary bookmark version {version} is not supported")
+    imgname = file.read(name_length).decode("utf-8")
+    file.close()
+
+    offset = _header.size + name_length + -name_length % 4
+    offsets = np.memmap(path, dtype="<u4", mode="r", offset=offset, shape=(n_strokes + 1, ))
+    offset += offsets.nbytes
+    if n_points == 0:  # Empty memory maps are not supported
+        coords = np.empty((0, 2), dtype=np.int16)
+        coords.flags.writeable = False
+        return imgname, offsets, coords
+    coords = np.memmap(path, dtype="<i2", mode="r", offset=offset, shape=(n_points, 2))
+    return imgname, offsets, coords
@@ -27,6 +27,24 @@ def exported_image_exists(filename: str) -> bool:
     return os.path.isfile(export_dir + filename + ".png")
 
 
+def exported_video_exists(filename: str, frames: bool = False) -> bool:
+    """
+    Check if an exported video already exists on disk.
+
+    Args:
+        filename (str): Export video name.
+        frames (bool): Whether to check for a PNG frame sequence
+            instead of a video file. Defaults to False.
+
+    Returns:
+        bool: True if a video exists.
+
+    """
+    if frames:
+        return os.path.isdir(export_dir + filename)
+    return os.path.isfile(export_dir + filename + ".mp4")
+
+
 def export_image(filename: str, imgname: str,
                  strokes: Sequence[Sequence[Point2D]],
                  scale: int = 5,
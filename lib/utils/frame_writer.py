@@ -0,0 +1,108 @@
+import os
+import cv2
+import queue
+import threading
+import numpy as np
+
+
+#: Default number of frames waiting to be encoded.
+MAX_QUEUED_FRAMES = 8
+
+
+class FrameWriter:
+    """
+    Background thread encoding frames to a video file or a PNG sequence.
+
+    Frames are passed to the thread through a bounded queue, so they are
+    encoded while the next ones are rendered. `write` blocks when the queue
+    is full, which keeps memory usage flat regardless of the video length.
+
+    Args:
+        path (str): Video file path, or a directory for the PNG sequence.
+        fps (int): Video frame rate.
+        frames (bool): Whether to write a PNG frame sequence instead of
+            a video. Defaults to False.
+        max_queued (int): Queue size. Defaults to `MAX_QUEUED_FRAMES`.
+
+    """
+
+    def __init__(self, path: str, fps: int, frames: bool = False,
+                 max_queued: int = MAX_QUEUED_FRAMES):
+        self._path = path
+        self._fps = fps
+        self._frames = frames
+        self._queue = queue.Queue(maxsize=max_queued)
+        self._writer = None
+        self._count = 0
+        self._error = None
+
+        if frames and not os.path.isdir(path):
+            os.mkdir(path)
+
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def write(self, frame: np.ndarray):
+        """
+        Queue a frame for encoding.
+
+        Args:
+            frame (np.ndarray): OpenCV image (BGR). It is copied,
+                so the caller can reuse it.
+
+        Raises:
+            RuntimeError: If encoding of the previous frames failed.
+
+        """
+        if self._error is not None:
+            raise RuntimeError("frame encoding failed") from self._error
+        self._queue.put(frame.copy())
+
+    def close(self):
+        """
+        Encode the queued frames and finalize the output.
+
+        Raises:
+            RuntimeError: If encoding failed.
+
+        """
+        self._queue.put(None)
+        self._thread.join()
+        if self._writer is not None:
+            self._writer.release()
+        if self._error is not None:
+            raise RuntimeError("frame encoding failed") from self._error
+
+    @property
+    def count(self) -> int:
+        """
+        Number of encoded frames.
+
+        """
+        return self._count
+
+    def _loop(self):
+        while True:
+            frame = self._queue.get()
+            if frame is None:
+                return
+            if self._error is not None:
+                continue  # Drain the queue to unblock the caller
+            try:
+                self._encode(frame)
+                self._count += 1
+            except BaseException as e:
+                self._error = e
+
+    def _encode(self, frame: np.ndarray):
+        if self._frames:
+            filename = os.path.join(self._path, f"{self._count:06d}.png")
+            if not cv2.imwrite(filename, frame, [cv2.IMWRITE_PNG_COMPRESSION, 1]):
+                raise OSError(f"cannot write \"{filename}\"")
+            return
+        if self._writer is None:
+            self._writer = cv2.VideoWriter(self._path, cv2.VideoWriter_fourcc(*"mp4v"),
+                                           self._fps, (frame.shape[1], frame.shape[0]))
+            if not self._writer.isOpened():
+                raise OSError(f"cannot open video writer for \"{self._path}\"")
+        self._writer.write(frame)
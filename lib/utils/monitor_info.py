@@ -15,7 +15,14 @@ try:
 except BaseException:
     pass
 
-monitor_info = get_monitors()[0]
-screen_w, screen_h = monitor_info.width, monitor_info.height
+#: Screen size assumed when no display is available.
+default_w, default_h = 1920, 1080
+
+try:
+    monitor_info = get_monitors()[0]
+    screen_w, screen_h = monitor_info.width, monitor_info.height
+except BaseException:  # Headless machine
+    monitor_info = None
+    screen_w, screen_h = default_w, default_h
 work_w = screen_w - 4   #: Approximate working area width.
 work_h = screen_h - 60  #: Approximate working area height.
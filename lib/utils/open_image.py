@@ -83,18 +83,64 @@ def open_image(filename: str) -> tuple:
         return base, cv2.imread(converted_path)
 
     # Search for a base name in the library
-    img_path = images_dir + imgname
-    if not os.path.isfile(img_path):
+    if not os.path.isfile(images_dir + imgname):
         for name in images:
             base, ext = split_extension(name)
             if base == imgname:
-                img_path += ext
+                imgname = name
                 break
         else:
             raise FileNotFoundError(f"image \"{imgname}\" not found")
 
     # Convert image to 4096 babelia color format
     print("Opening file for the first time, please wait...")
-    img = round_image(cv2.imread(img_path))
-    cv2.imwrite(converted_path, img)
-    return base, img
+    return base, convert_image(imgname)
+
+
+def convert_image(imgname: str) -> np.ndarray:
+    """
+    Convert library image to 4096 babelia color format and save it.
+
+    The converted image is written to a temporary file first and then
+    moved in place, so an interrupted conversion never leaves
+    a partially written image behind.
+
+    Args:
+        imgname (str): Image filename with the extension.
+
+    Returns:
+        np.ndarray: Converted image (BGR).
+
+    Raises:
+        FileNotFoundError: If the image cannot be read.
+
+    """
+    img = cv2.imread(images_dir + imgname)
+    if img is None:
+        raise FileNotFoundError(f"cannot read image \"{imgname}\"")
+    img = round_image(img)
+
+    if not os.path.isdir(converted_dir):
+        os.mkdir(converted_dir)
+    converted_path = converted_dir + split_extension(imgname)[0] + ".png"
+    _, buffer = cv2.imencode(".png", img)
+    buffer.tofile(converted_path + ".tmp")
+    os.replace(converted_path + ".tmp", converted_path)
+    return img
+
+
+def image_converted(imgname: str) -> bool:
+    """
+    Check whether a converted version of the library image is up to date.
+
+    Args:
+        imgname (str): Image filename with the extension.
+
+    Returns:
+        bool: True if the converted image exists and is not older
+            than the original one.
+
+    """
+    converted_path = converted_dir + split_extension(imgname)[0] + ".png"
+    return (os.path.isfile(converted_path) and
+            os.path.getmtime(converted_path) >= os.path.getmtime(images_dir + imgname))
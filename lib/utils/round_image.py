@@ -1,6 +1,4 @@
-import cv2
 import numpy as np
-from tqdm import tqdm
 
 NUM_CHANNEL_COLORS = 16               #: Number of colors per channel
 NUM_COLORS = NUM_CHANNEL_COLORS ** 3  #: Total number of colors
@@ -10,6 +8,12 @@ def round_image(img: np.ndarray) -> np.ndarray:
     """
     Convert image to 4096 babelia color format.
 
+    Each pixel is replaced with the closest `palette` color. The palette
+    is a uniform grid of `NUM_CHANNEL_COLORS` levels per channel, so the
+    squared distance is a sum of independent channel terms and the closest
+    color is found per channel with `channel_lut`. Ties are resolved
+    the same way as argmin over the whole palette.
+
     Args:
         img (np.ndarray): OpenCV image (BGR).
 
@@ -17,13 +21,7 @@ def round_image(img: np.ndarray) -> np.ndarray:
         np.ndarray: Converted image (BGR).
 
     """
-    img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB).astype(int)
-    for y in tqdm(range(img.shape[0]),
-                  desc="Converting"):
-        for x in range(img.shape[1]):
-            dsts = ((img[y, x] - palette) ** 2).sum(axis=1)
-            img[y, x] = palette[np.argmin(dsts)]
-    return cv2.cvtColor(img.astype(np.uint8), cv2.COLOR_RGB2BGR)
+    return channel_lut[img[..., :3]]
 
 
 def number_to_color(number: np.ndarray) -> np.ndarray:
@@ -47,3 +45,7 @@ def number_to_color(number: np.ndarray) -> np.ndarray:
 
 
 palette = number_to_color(np.arange(0, NUM_COLORS, dtype=int))
+
+levels = np.unique(palette)  #: Palette levels of a single channel.
+#: Closest palette level for every 8-bit channel value.
+channel_lut = levels[np.argmin((np.arange(256)[:, None] - levels) ** 2, axis=1)].astype(np.uint8)
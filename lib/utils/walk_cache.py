@@ -0,0 +1,162 @@
+import os
+import numpy as np
+
+from collections import OrderedDict
+from typing import Optional, Sequence
+
+from .open_image import converted_dir
+from lib.math_utils import Point2D, metrics
+
+
+#: Default memory cap of a walk cache in bytes.
+MAX_CACHE_BYTES = 16 * 1024 * 1024
+#: Estimated memory overhead of a cache entry in bytes.
+ENTRY_OVERHEAD = 200
+
+walks_dir = "data/__walks__/"
+
+
+class WalkCache:
+    """
+    LRU cache of complete nearest point walks of an image.
+
+    A walk is deterministic for a given image, starting point, metric
+    and intersection flag, so it is computed only once. Paths are stored
+    as int16 coordinate arrays. The least recently used paths are evicted
+    when the memory cap is exceeded.
+
+    The cache is persisted to `walks_dir` and is dropped on load if
+    the converted image has changed since the cache was saved.
+
+    Args:
+        imgname (str): Image name without the file extension.
+        max_bytes (int): Memory cap in bytes. Defaults to `MAX_CACHE_BYTES`.
+
+    """
+
+    def __init__(self, imgname: str, max_bytes: int = MAX_CACHE_BYTES):
+        self._imgname = imgname
+        self._max_bytes = max_bytes
+        self._paths = OrderedDict()
+        self._bytes = 0
+        self._modified = False
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def get(self, p_start: Point2D, metric: metrics.BaseMetric,
+            allow_intersections: bool) -> Optional[list]:
+        """
+        Get a cached walk.
+
+        Args:
+            p_start (Point2D): Starting point for the walk.
+            metric (metrics.BaseMetric): Metric used in the walk.
+            allow_intersections (bool): Whether line self-intersections
+                are allowed in the walk.
+
+        Returns:
+            :obj:`list` of :obj:`Point2D`, optional: A sequence of points
+                visited in the walk, None if the walk is not cached.
+
+        """
+        key = (p_start.x, p_start.y, metric_key(metric), allow_intersections)
+        coords = self._paths.get(key)
+        if coords is None:
+            return None
+        self._paths.move_to_end(key)
+        return [Point2D(x, y) for x, y in coords.tolist()]
+
+    def put(self, path: Sequence[Point2D], metric: metrics.BaseMetric,
+            allow_intersections: bool):
+        """
+        Add a complete walk to the cache.
+
+        Args:
+            path (:obj:`Sequence` of :obj:`Point2D`): A sequence of points
+                visited in the walk, the first point is the starting one.
+            metric (metrics.BaseMetric): Metric used in the walk.
+            allow_intersections (bool): Whether line self-intersections
+                are allowed in the walk.
+
+        """
+        key = (path[0].x, path[0].y, metric_key(metric), allow_intersections)
+        self._add(key, np.array([p.tuple for p in path], dtype=np.int16))
+        self._modified = True
+
+    def load(self):
+        """
+        Load the cache from disk if it is up to date.
+
+        """
+        path = walks_dir + self._imgname + ".npz"
+        if not os.path.isfile(path):
+            return
+        with np.load(path) as data:
+            if data["image_mtime"].item() != _image_mtime(self._imgname):
+                return
+            coords = np.split(data["coords"], data["offsets"][1:-1])
+            for x, y, metric, intersections, path in zip(data["starts"][:, 0].tolist(),
+                                                         data["starts"][:, 1].tolist(),
+                                                         data["metrics"].tolist(),
+                                                         data["intersections"].tolist(),
+                                                         coords):
+                self._add((x, y, metric, intersections), path)
+
+    def save(self):
+        """
+        Save the cache to disk if it was modified.
+
+        The file is replaced atomically.
+
+        """
+        if not self._modified:
+            return
+        if not os.path.isdir(walks_dir):
+            os.mkdir(walks_dir)
+
+        keys = list(self._paths.keys())
+        coords = list(self._paths.values())
+        path = walks_dir + self._imgname + ".npz"
+        with open(path + ".tmp", mode="wb") as file:
+            np.savez(file,
+                     image_mtime=_image_mtime(self._imgname),
+                     starts=np.array([key[:2] for key in keys], dtype=np.int16).reshape(-1, 2),
+                     metrics=np.array([key[2] for key in keys], dtype=str),
+                     intersections=np.array([key[3] for key in keys], dtype=bool),
+                     offsets=np.cumsum([0] + [len(c) for c in coords]),
+                     coords=np.concatenate(coords) if len(coords) > 0 else np.empty((0, 2), np.int16))
+        os.replace(path + ".tmp", path)
+        self._modified = False
+
+    def _add(self, key: tuple, coords: np.ndarray):
+        if key in self._paths:
+            self._bytes -= self._paths.pop(key).nbytes + ENTRY_OVERHEAD
+        self._paths[key] = coords
+        self._bytes += coords.nbytes + ENTRY_OVERHEAD
+
+        # Evict least recently used walks
+        while self._bytes > self._max_bytes and len(self._paths) > 0:
+            _, evicted = self._paths.popitem(last=False)
+            self._bytes -= evicted.nbytes + ENTRY_OVERHEAD
+
+
+def metric_key(metric: metrics.BaseMetric) -> str:
+    """
+    Get a string that identifies metric results.
+
+    Args:
+        metric (metrics.BaseMetric): Metric.
+
+    Returns:
+        str: Metric name, with center coordinates for cosine similarity.
+
+    """
+    if isinstance(metric, metrics.CosMetric):
+        return f"{metric.name}_{metric.p_center}"
+    return metric.name
+
+
+def _image_mtime(imgname: str) -> int:
+    path = converted_dir + imgname + ".png"
+    return os.stat(path).st_mtime_ns if os.path.isfile(path) else 0
@@ -0,0 +1,384 @@
+import os
+import cv2
+import multiprocessing
+import numpy as np
+
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from multiprocessing.synchronize import Event
+from time import perf_counter
+from typing import Callable, Optional, Sequence
+
+from .open_image import images_dir, converted_dir, get_images, split_extension, \
+    image_converted, convert_image
+from .walk_cache import metric_key
+from lib.math_utils import Point2D, ColorIndex, metrics, start_walk, \
+    sample_strokes, normalize_shape, hausdorff_distance
+
+
+#: Number of points sampled along a query and a walk to compare their shapes.
+SEARCH_SAMPLES = 128
+#: Default number of best matches to keep.
+SEARCH_TOP = 10
+#: Default time limit for a single walk in ms.
+SEARCH_TIME_LIMIT = 50
+#: Default number of starting points per color.
+SEARCH_STARTS = 1
+#: Minimum time in seconds between progress saves.
+SEARCH_SAVE_INTERVAL = 30
+#: Number of images queued per worker process.
+SEARCH_QUEUE_SIZE = 2
+
+#: Search match record.
+SEARCH_DTYPE = np.dtype([
+    ("image", np.int32),         # Index of the image in `WalkSearch.images`
+    ("color", np.uint8, (3, )),  # Walk color in BGR format
+    ("x", np.int16),             # Starting point coordinates
+    ("y", np.int16),
+    ("n_points", np.int32),      # Number of visited points
+    ("distance", np.float32),    # Hausdorff distance between normalized shapes
+    ("truncated", bool)          # True if the time limit was exceeded
+])
+
+searches_dir = "data/__searches__/"
+
+# Worker process state
+_params = None
+_stop = None
+
+
+class WalkSearch:
+    """
+    Resumable search for nearest point walks matching a query shape
+    across the images library.
+
+    Every image is processed in a worker process: a walk is performed
+    for every color of the image from `starts` pixels of the color
+    spread evenly in the row-major order. Walks and the query are sampled
+    with `SEARCH_SAMPLES` points along the arc length, normalized to the
+    unit bounding box and compared with the Hausdorff distance. Only
+    the `top` closest matches are kept.
+
+    Images are streamed through the worker pool, at most
+    `SEARCH_QUEUE_SIZE` images per worker are queued at once. Progress
+    is saved to `searches_dir` periodically, so an interrupted search
+    continues from the processed images.
+
+    Args:
+        name (str): Search name, the progress is saved under this name.
+        offsets (np.ndarray): (k + 1) integer array of query stroke offsets.
+        coords (np.ndarray): (m, 2) integer array of query (x, y) coordinates.
+        metric (metrics.BaseMetric): Metric to use in the walks.
+            Defaults to metrics.L2Metric.
+        allow_intersections (bool): Whether to allow line
+            self-intersections. Defaults to False.
+        time_limit (int): Time limit for a single walk in ms. Longer walks
+            are compared by the points visited in time.
+            Defaults to `SEARCH_TIME_LIMIT`.
+        top (int): Number of best matches to keep. Defaults to `SEARCH_TOP`.
+        starts (int): Number of starting points per color.
+            Defaults to `SEARCH_STARTS`.
+
+    """
+
+    def __init__(self, name: str, offsets: np.ndarray, coords: np.ndarray,
+                 metric: metrics.BaseMetric = metrics.L2Metric(),
+                 allow_intersections: bool = False,
+                 time_limit: int = SEARCH_TIME_LIMIT,
+                 top: int = SEARCH_TOP, starts: int = SEARCH_STARTS):
+        self._name = name
+        self._query = normalize_shape(sample_strokes(coords, offsets, SEARCH_SAMPLES))
+        self._metric = metric
+        self._allow_intersections = allow_intersections
+        self._time_limit = time_limit
+        self._top = top
+        self._starts = starts
+
+        self._images = []                                   # Processed image names
+        self._processed = set()                             # Processed image names for lookups
+        self._results = np.empty(0, dtype=SEARCH_DTYPE)     # Best matches by distance
+        self._modified = False
+
+    def __len__(self) -> int:
+        """
+        Number of processed images.
+
+        """
+        return len(self._images)
+
+    @property
+    def images(self) -> list:
+        """
+        Names of the processed images in the order of processing.
+
+        """
+        return list(self._images)
+
+    @property
+    def results(self) -> np.ndarray:
+        """
+        `SEARCH_DTYPE` records of the best matches sorted by distance.
+
+        """
+        return self._results.copy()
+
+    def pending(self, library: Sequence[tuple]) -> list:
+        """
+        Filter out processed images.
+
+        Args:
+            library (:obj:`Sequence` of :obj:`tuple`): Images to search
+                in, see `search_library`.
+
+        Returns:
+            :obj:`list` of :obj:`tuple`: Images that are not processed yet.
+
+        """
+        return [image for image in library if image[0] not in self._processed]
+
+    def run(self, library: Sequence[tuple], workers: int = None,
+            callback: Callable = None) -> list:
+        """
+        Search in the images that are not processed yet.
+
+        Progress is saved every `SEARCH_SAVE_INTERVAL` seconds and when
+        the search stops, including an interruption by an exception.
+        On interruption the images being processed are abandoned.
+
+        Args:
+            library (:obj:`Sequence` of :obj:`tuple`): Images to search
+                in, see `search_library`.
+            workers (int): Number of worker processes. Defaults to None.
+                If set to None the number of CPUs is used.
+            callback (Callable): Function called with the image name
+                after every processed or failed image. Defaults to None.
+
+        Returns:
+            :obj:`list` of :obj:`tuple`: (image name, exception) of
+                the images that could not be processed.
+
+        """
+        pending = iter(self.pending(library))
+        n_queued = SEARCH_QUEUE_SIZE * (os.cpu_count() if workers is None else workers)
+        failed = []
+        futures = dict()
+        stop = multiprocessing.Event()
+        executor = ProcessPoolExecutor(workers, initializer=_init_worker,
+                                       initargs=(self._query, self._metric,
+                                                 self._allow_intersections,
+                                                 self._time_limit, self._top,
+                                                 self._starts, stop))
+        saved_time = perf_counter()
+        try:
+            while True:
+                # Keep the queue full, the library is never submitted at once
+                for imgname, filename in pending:
+                    futures[executor.submit(_search_image, imgname, filename)] = imgname
+                    if len(futures) >= n_queued:
+                        break
+                if len(futures) == 0:
+                    break
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    imgname = futures.pop(future)
+                    try:
+                        self._add(imgname, future.result())
+                    except BaseException as e:
+                        failed.append((imgname, e))
+                    if callback is not None:
+                        callback(imgname)
+
+                if perf_counter() - saved_time > SEARCH_SAVE_INTERVAL:
+                    self.save()
+                    saved_time = perf_counter()
+        except BaseException:
+            stop.set()  # Queued images cannot be cancelled, workers skip them
+            raise
+        finally:
+            executor.shutdown(cancel_futures=True)
+            self.save()
+        return failed
+
+    def match(self, record: np.void) -> tuple:
+        """
+        Repeat the walk of a match.
+
+        Args:
+            record (np.void): `SEARCH_DTYPE` record from `results`.
+
+        Returns:
+            str: Image name.
+            :obj:`list` of :obj:`Point2D`: A sequence of points visited
+                in the walk.
+
+        """
+        imgname = self._images[record["image"]]
+        img = cv2.imread(converted_dir + imgname + ".png")
+        if img is None:
+            raise FileNotFoundError(f"image \"{imgname}\" not found")
+        _center_metric(self._metric, img)
+
+        # The walk is deterministic, the visited points are the same as in the search
+        walker = start_walk(img, Point2D(record["x"].item(), record["y"].item()),
+                            self._metric, self._allow_intersections)
+        for _ in range(record["n_points"] - 1):
+            if walker.finished:
+                break
+            walker.step()
+        return imgname, walker.path
+
+    def load(self) -> bool:
+        """
+        Load progress from disk if it was saved with the same query
+        and search params.
+
+        Returns:
+            bool: True if the progress was loaded.
+
+        """
+        path = self.path
+        if not os.path.isfile(path):
+            return False
+        with np.load(path) as data:
+            if (not np.array_equal(data["query"], self._query) or
+                    data["params"].tolist() != self._settings()):
+                return False
+            self._images = data["images"].tolist()
+            self._results = data["results"]
+        self._processed = set(self._images)
+        self._modified = False
+        return True
+
+    def save(self):
+        """
+        Save progress to disk if it was modified.
+
+        The file is replaced atomically.
+
+        """
+        if not self._modified:
+            return
+        if not os.path.isdir(searches_dir):
+            os.mkdir(searches_dir)
+
+        path = self.path
+        with open(path + ".tmp", mode="wb") as file:
+            np.savez_compressed(file,
+                                query=self._query,
+                                params=np.array(self._settings(), dtype=str),
+                                images=np.array(self._images, dtype=str),
+                                results=self._results)
+        os.replace(path + ".tmp", path)
+        self._modified = False
+
+    def reset(self):
+        """
+        Forget the progress, the saved progress is overwritten on the next save.
+
+        """
+        self._images = []
+        self._processed = set()
+        self._results = np.empty(0, dtype=SEARCH_DTYPE)
+        self._modified = True
+
+    @property
+    def path(self) -> str:
+        """
+        Progress filename.
+
+        """
+        return searches_dir + self._name + ".npz"
+
+    def _settings(self) -> list:
+        return [metric_key(self._metric), str(self._allow_intersections),
+                str(self._time_limit), str(self._top), str(self._starts)]
+
+    def _add(self, imgname: str, records: np.ndarray):
+        """
+        Merge matches of a processed image into the best matches.
+
+        Args:
+            imgname (str): Image name.
+            records (np.ndarray): `SEARCH_DTYPE` records of the image.
+
+        """
+        records["image"] = len(self._images)
+        self._images.append(imgname)
+        self._processed.add(imgname)
+        results = np.concatenate((self._results, records))
+        self._results = results[np.argsort(results["distance"], kind="stable")[:self._top]]
+        self._modified = True
+
+
+def search_library(reload: bool = False) -> list:
+    """
+    Get images to search in.
+
+    The library images and the converted images without the originals
+    are searched. Images with the same name without the file extension
+    share the converted image, so only the first of them is searched.
+
+    Args:
+        reload (bool): Whether to reload images library from disk.
+            Defaults to False.
+
+    Returns:
+        :obj:`list` of :obj:`tuple`: (image name, filename) sorted by
+            the image name. The filename is None if there is
+            no original image.
+
+    """
+    library = dict()
+    for filename in get_images(reload):
+        library.setdefault(split_extension(filename)[0], filename)
+    if os.path.isdir(converted_dir):
+        for name in os.listdir(converted_dir):
+            if name.lower().endswith(".png"):
+                library.setdefault(name[:-4], None)
+    return sorted(library.items())
+
+
+def _center_metric(metric: metrics.BaseMetric, img: np.ndarray):
+    # Cosine similarity metric requires center point coordinates
+    if metric.name == "cos":
+        metric.p_center = Point2D(img.shape[1], img.shape[0]) // 2
+
+
+def _init_worker(query: np.ndarray, metric: metrics.BaseMetric,
+                 allow_intersections: bool, time_limit: int,
+                 top: int, starts: int, stop: Event):
+    # Runs once in every worker process
+    global _params, _stop
+    _params = (query, metric, allow_intersections, time_limit, top, starts)
+    _stop = stop
+
+
+def _search_image(imgname: str, filename: Optional[str]) -> np.ndarray:
+    # Runs in a worker process, only the best matches of the image are sent back
+    query, metric, allow_intersections, time_limit, top, starts = _params
+    if filename is not None and os.path.isfile(images_dir + filename) \
+            and not image_converted(filename):
+        img = convert_image(filename)
+    else:
+        img = cv2.imread(converted_dir + imgname + ".png")
+        if img is None:
+            raise FileNotFoundError(f"cannot read image \"{imgname}\"")
+    _center_metric(metric, img)
+    index = ColorIndex(img)
+
+    records = []
+    for color in index.colors():
+        if _stop.is_set():
+            raise InterruptedError("search stopped")
+        coords = index[color]
+        if len(coords) < 2:
+            continue  # A single point has no shape
+        for x, y in coords[np.unique(np.linspace(0, len(coords) - 1, starts).astype(int))].tolist():
+            walker = start_walk(img, Point2D(x, y), metric, allow_intersections, index)
+            path = np.array([p.tuple for p in walker.run(time_limit, partial=True)])
+            shape = normalize_shape(sample_strokes(path, [0, len(path)], SEARCH_SAMPLES))
+            records.append((-1, color, x, y, len(path),
+                            hausdorff_distance(query, shape), walker.truncated))
+
+    records = np.array(records, dtype=SEARCH_DTYPE)
+    return records[np.argsort(records["distance"], kind="stable")[:top]]
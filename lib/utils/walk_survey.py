@@ -0,0 +1,180 @@
+import os
+import numpy as np
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from time import perf_counter_ns
+from typing import Callable, Optional
+
+from .open_image import converted_dir
+from .walk_cache import metric_key
+from lib.math_utils import Point2D, ColorIndex, metrics, start_walk, count_self_intersections
+
+
+#: Number of starting points sent to a worker process at once.
+SURVEY_CHUNK_SIZE = 64
+
+#: Survey record of a single starting point.
+SURVEY_DTYPE = np.dtype([
+    ("x", np.int16),              # Starting point coordinates
+    ("y", np.int16),
+    ("n_points", np.int32),       # Number of visited points
+    ("length", np.float32),       # Total L2 length of the path
+    ("intersections", np.int32),  # Number of self-intersections
+    ("time", np.float32),         # Walk computation time in ms
+    ("truncated", bool)           # True if the time limit was exceeded
+])
+
+# Worker process state
+_img = None
+_index = None
+_params = None
+
+
+def survey_starts(img: np.ndarray, color: np.ndarray = None,
+                  index: ColorIndex = None) -> np.ndarray:
+    """
+    Get starting points for a survey.
+
+    Args:
+        img (np.ndarray): OpenCV image.
+        color (np.ndarray): Color of the starting points. Defaults to None.
+            If set to None every pixel of the image is a starting point.
+        index (ColorIndex): Color index of `img`. Defaults to None.
+            If set to None the whole image is scanned.
+
+    Returns:
+        np.ndarray: (n, 2) integer array of (x, y) coordinates
+            in row-major order.
+
+    """
+    if color is None:
+        y, x = np.indices(img.shape[:2])
+        return np.stack((x.ravel(), y.ravel()), axis=1).astype(np.int16)
+    if index is not None:
+        return np.array(index[color])
+    return np.stack(np.nonzero(np.all(img == color, axis=2))[::-1], axis=1).astype(np.int16)
+
+
+def survey_walks(img: np.ndarray, starts: np.ndarray,
+                 metric: metrics.BaseMetric = metrics.L2Metric(),
+                 allow_intersections: bool = False,
+                 time_limit: int = None, workers: int = None,
+                 callback: Callable = None) -> np.ndarray:
+    """
+    Perform nearest point walks from many starting points in parallel.
+
+    Starting points are split into chunks of `SURVEY_CHUNK_SIZE`
+    and walked in a process pool. The image is sent to every worker
+    process once.
+
+    Args:
+        img (np.ndarray): OpenCV image to select pixels from.
+        starts (np.ndarray): (n, 2) integer array of starting points.
+        metric (metrics.BaseMetric): Metric to measure the distance
+            between points. Defaults to metrics.L2Metric.
+        allow_intersections (bool): Whether to allow line
+            self-intersections. Defaults to False.
+        time_limit (int): Time limit for a single walk in ms.
+            Defaults to None. If set to None walks are not limited.
+        workers (int): Number of worker processes. Defaults to None.
+            If set to None the number of CPUs is used.
+        callback (Callable): Function called with the number of
+            surveyed points after every chunk. Defaults to None.
+
+    Returns:
+        np.ndarray: `SURVEY_DTYPE` records in the order of `starts`.
+
+    """
+    chunks = [starts[i:i + SURVEY_CHUNK_SIZE]
+              for i in range(0, len(starts), SURVEY_CHUNK_SIZE)]
+    results = [None] * len(chunks)
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=(img, metric, allow_intersections, time_limit)) as executor:
+        futures = {executor.submit(_survey_chunk, chunk): i for i, chunk in enumerate(chunks)}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            if callback is not None:
+                callback(len(results[futures[future]]))
+    if len(results) == 0:
+        return np.empty(0, dtype=SURVEY_DTYPE)
+    return np.concatenate(results)
+
+
+def save_survey(imgname: str, survey: np.ndarray,
+                metric: metrics.BaseMetric, allow_intersections: bool,
+                color: np.ndarray = None):
+    """
+    Save survey results next to the converted image.
+
+    Surveys of a single color are saved separately from the survey
+    of every pixel, see `survey_path`. The file is replaced atomically.
+
+    Args:
+        imgname (str): Image name without the file extension.
+        survey (np.ndarray): `SURVEY_DTYPE` records.
+        metric (metrics.BaseMetric): Metric used in the walks.
+        allow_intersections (bool): Whether line self-intersections
+            were allowed in the walks.
+        color (np.ndarray): Color of the starting points in BGR format.
+            Defaults to None. If set to None every pixel was surveyed.
+
+    """
+    path = survey_path(imgname, color)
+    with open(path + ".tmp", mode="wb") as file:
+        np.savez_compressed(file,
+                            image_mtime=_image_mtime(imgname),
+                            metric=metric_key(metric),
+                            intersections=allow_intersections,
+                            survey=survey)
+    os.replace(path + ".tmp", path)
+
+
+def survey_path(imgname: str, color: np.ndarray = None) -> str:
+    """
+    Get survey results filename.
+
+    Args:
+        imgname (str): Image name without the file extension.
+        color (np.ndarray): Color of the starting points in BGR format.
+            Defaults to None. If set to None every pixel is surveyed.
+
+    Returns:
+        str: Path next to the converted image, the color is appended
+            as "R_G_B" to the name of a single color survey.
+
+    """
+    if color is None:
+        return converted_dir + imgname + ".survey.npz"
+    b, g, r = np.asarray(color).tolist()
+    return converted_dir + imgname + f".survey.{r}_{g}_{b}.npz"
+
+
+def _image_mtime(imgname: str) -> int:
+    path = converted_dir + imgname + ".png"
+    return os.stat(path).st_mtime_ns if os.path.isfile(path) else 0
+
+
+def _init_worker(img: np.ndarray, metric: metrics.BaseMetric,
+                 allow_intersections: bool, time_limit: Optional[int]):
+    # Runs once in every worker process
+    global _img, _index, _params
+    _img = img
+    _index = ColorIndex(img)
+    _params = (metric, allow_intersections, np.inf if time_limit is None else time_limit)
+
+
+def _survey_chunk(starts: np.ndarray) -> np.ndarray:
+    # Runs in a worker process
+    metric, allow_intersections, time_limit = _params
+    records = np.zeros(len(starts), dtype=SURVEY_DTYPE)
+    for i, (x, y) in enumerate(starts.tolist()):
+        start_time = perf_counter_ns()
+        walker = start_walk(_img, Point2D(x, y), metric, allow_intersections, _index)
+        path = walker.run(time_limit, partial=True)
+        elapsed = (perf_counter_ns() - start_time) / 1000000
+
+        coords = np.array([p.tuple for p in path], dtype=np.int64)
+        length = np.hypot(*np.diff(coords, axis=0).T).sum()
+        records[i] = (x, y, len(path), length, count_self_intersections(coords),
+                      elapsed, walker.truncated)
+    return records
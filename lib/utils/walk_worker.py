@@ -0,0 +1,124 @@
+import threading
+
+from time import perf_counter_ns
+from typing import Optional
+
+from lib.math_utils import VectorizedWalk
+
+
+class WalkWorker:
+    """
+    Background thread performing nearest point walks.
+
+    Only the most recent request is processed: submitting a new walk
+    cancels the stale one. The walk is computed in slices of `slice_time` ms.
+    The first result is published when the walk is complete or its time
+    limit is exceeded, then the truncated path is published after every
+    slice until the walk is complete. Results are collected with `poll`.
+
+    Args:
+        slice_time (int): Time in ms between cancellation checks
+            and result updates. Defaults to 8 ms.
+
+    """
+
+    def __init__(self, slice_time: int = 8):
+        self._slice_time = slice_time
+        self._condition = threading.Condition()
+        self._generation = 0   # Incremented on every submit and cancel
+        self._request = None   # (generation, walker, time_limit)
+        self._result = None    # (generation, path, truncated)
+        self._busy = False
+        self._closed = False
+
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def submit(self, walker: VectorizedWalk, time_limit: int = 500):
+        """
+        Start a walk in background, cancel the current one if any.
+
+        Args:
+            walker (VectorizedWalk): Walk engine. It must not be used
+                by the caller after the submission.
+            time_limit (int): Time in ms to wait for the walk to complete
+                before publishing a truncated result. Defaults to 500 ms.
+
+        """
+        with self._condition:
+            self._generation += 1
+            self._request = (self._generation, walker, time_limit)
+            self._result = None
+            self._busy = True
+            self._condition.notify()
+
+    def cancel(self):
+        """
+        Cancel the current walk and drop its results.
+
+        """
+        with self._condition:
+            self._generation += 1
+            self._request = None
+            self._result = None
+            self._busy = False
+
+    def poll(self) -> Optional[tuple]:
+        """
+        Get the latest result of the current walk.
+
+        Each result is returned once.
+
+        Returns:
+            :obj:`tuple`, optional: None if no new result is ready, otherwise
+                :obj:`list` of :obj:`Point2D`: A sequence of points visited in the walk.
+                bool: True if the walk is not complete yet.
+
+        """
+        with self._condition:
+            result, self._result = self._result, None
+        if result is None:
+            return None
+        return result[1:]
+
+    def close(self):
+        """
+        Cancel the current walk and stop the thread.
+
+        """
+        with self._condition:
+            self._closed = True
+            self._request = None
+            self._condition.notify()
+        self._thread.join()
+
+    @property
+    def busy(self) -> bool:
+        """
+        True if the current walk is not complete yet.
+
+        """
+        return self._busy
+
+    def _loop(self):
+        while True:
+            with self._condition:
+                while self._request is None and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                generation, walker, time_limit = self._request
+                self._request = None
+
+            start_time = perf_counter_ns() // 1000000
+            while True:
+                path = walker.run(self._slice_time, partial=True)
+                elapsed = perf_counter_ns() // 1000000 - start_time
+                with self._condition:
+                    if generation != self._generation:  # Cancelled
+                        break
+                    if walker.finished or elapsed >= time_limit:
+                        self._result = (generation, path, walker.truncated)
+                    if walker.finished:
+                        self._busy = False
+                        break
@@ -0,0 +1,116 @@
+import random
+import numpy as np
+
+from lib.animation import AnimationManager, OffscreenSink, VirtualClock, RepeatMode, \
+    RectanglePositionAnimation, LineThicknessAnimation, BatchRectangleAnimation
+from lib.math_utils import Point2D
+
+WIDTH, HEIGHT = 160, 120
+
+
+def point(p: Point2D, reverse: bool = False) -> RectanglePositionAnimation:
+    animation = RectanglePositionAnimation(
+        start=(p, p + 1), finish=(p - 6, p + 7),
+        color=(0, 0, 255), thickness=-1,
+        duration=100, fps=60, repeat=RepeatMode.STICK
+    )
+    if reverse:
+        animation.repeat = RepeatMode.ONEOFF
+        animation.reverse()
+    return animation
+
+
+def line(p1: Point2D, p2: Point2D) -> LineThicknessAnimation:
+    return LineThicknessAnimation(
+        start=1, finish=5, position=(p1, p2), color=(255, 0, 0),
+        duration=150, fps=60, repeat=RepeatMode.STICK
+    )
+
+
+def reference(manager: AnimationManager, background: np.ndarray) -> np.ndarray:
+    # Full redraw in z-order, within one z-index baked animations go first
+    frame = background.copy()
+    keys = sorted(manager.keys(), key=lambda key: (manager.get_zindex(key),
+                                                   key not in manager._baked,
+                                                   manager._order[key]))
+    for key in keys:
+        manager[key].redraw(frame)
+    return frame
+
+
+def test_active_below_baked():
+    background = np.full((HEIGHT, WIDTH, 3), 128, dtype=np.uint8)
+    clock = VirtualClock()
+    sink = OffscreenSink(maxlen=1)
+    manager = AnimationManager(None, background, sink, clock)
+
+    manager.add("point", point(Point2D(50, 50)), zindex=1)
+    for _ in range(20):
+        clock.tick(16)
+        manager.refresh()
+    assert "point" in manager._baked
+
+    manager.add("line", line(Point2D(30, 50), Point2D(70, 50)), zindex=0)
+    for _ in range(20):
+        clock.tick(16)
+        if manager.refresh():
+            assert np.array_equal(sink.frames[-1][1], reference(manager, background))
+
+
+def test_random_against_full_redraw():
+    background = np.full((HEIGHT, WIDTH, 3), 128, dtype=np.uint8)
+    for seed in range(40):
+        rnd = random.Random(seed)
+        points = [Point2D(rnd.randrange(WIDTH), rnd.randrange(HEIGHT)) for _ in range(20)]
+        clock = VirtualClock()
+        sink = OffscreenSink(maxlen=1)
+        manager = AnimationManager(None, background, sink, clock)
+
+        for _ in range(200):
+            clock.tick(rnd.choice([1, 7, 16, 40]))
+            r = rnd.random()
+            p, q = rnd.choice(points), rnd.choice(points)
+            if r < 0.25:
+                manager.add(("point", p), point(p, rnd.random() < 0.3), zindex=1)
+            elif r < 0.5:
+                manager.add(("line", p, q), line(p, q), zindex=rnd.choice([0, 0, 2]))
+            elif r < 0.6 and len(manager) > 0:
+                rnd.choice(list(manager.values())).reverse()
+            elif r < 0.65 and len(manager) > 0:
+                rnd.choice(list(manager.values())).reset()
+            elif r < 0.7 and len(manager) > 0:
+                rnd.choice(list(manager.values())).disable()
+            elif r < 0.75 and len(manager) > 0:
+                manager.set_zindex(rnd.choice(list(manager.keys())), rnd.randrange(3))
+            elif r < 0.77:
+                manager.clear()
+            if manager.refresh():
+                assert np.array_equal(sink.frames[-1][1], reference(manager, background)), seed
+
+
+def test_batch_restart_against_full_redraw():
+    background = np.full((HEIGHT, WIDTH, 3), 128, dtype=np.uint8)
+    rnd = random.Random(0)
+    n = 60
+    coords = np.array([[rnd.randrange(WIDTH), rnd.randrange(HEIGHT)] for _ in range(n)])
+    thickness = np.full(2 * n, 2)
+    thickness[::2] = -1
+    colors = np.array([[rnd.randrange(256) for _ in range(3)] for _ in range(2 * n)])
+    points = BatchRectangleAnimation(
+        {"position": np.stack((coords, coords + 1), axis=1).repeat(2, axis=0),
+         "color": colors, "thickness": thickness},
+        {"position": np.stack((coords - 5, coords + 6), axis=1).repeat(2, axis=0)},
+        duration=100, fps=60, repeat=RepeatMode.SWING
+    )
+    clock = VirtualClock()
+    sink = OffscreenSink(maxlen=1)
+    manager = AnimationManager(None, background, sink, clock)
+    manager.add("line", line(Point2D(10, 60), Point2D(150, 60)), zindex=0)
+    manager.add("points", points, zindex=1)
+
+    for _ in range(300):
+        clock.tick(rnd.choice([1, 7, 16, 40]))
+        if rnd.random() < 0.1:
+            points.restart(rnd.sample(range(2 * n), 3))
+        if manager.refresh():
+            assert np.array_equal(sink.frames[-1][1], reference(manager, background))
@@ -0,0 +1,21 @@
+import pytest
+
+from lib.command import Command, OpenParser, ScaleParser
+from lib.enums import OpenMode
+
+
+def parse(line: str) -> list:
+    values, _ = Command(line).parse_options(parsers=[OpenParser(), ScaleParser()])
+    return values
+
+
+def test_survey_mode():
+    assert parse("open 0 -s") == [OpenMode.SURVEY, None]
+    assert parse("open 0 --survey") == [OpenMode.SURVEY, None]
+    assert parse("open 0 --mode=survey") == [OpenMode.SURVEY, None]
+
+
+def test_mode_with_value_rejected():
+    with pytest.raises(ValueError):
+        parse("open 0 -s=3")
+    assert parse("open 0 --scale=3") == [OpenMode.NORMAL, 3]
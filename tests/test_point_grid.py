@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from lib.math_utils import Point2D, PointGrid, norms
+
+NORMS = [norms.l1_norm, norms.l2_norm, norms.linf_norm]
+
+
+def brute_force(points: np.ndarray, alive: np.ndarray, p: Point2D, norm) -> list:
+    indices = np.flatnonzero(alive)
+    keys = norm(p.x - points[indices, 0], p.y - points[indices, 1])
+    return indices[np.lexsort((indices, keys))].tolist()
+
+
+@pytest.mark.parametrize("norm", NORMS, ids=lambda norm: norm.__name__)
+@pytest.mark.parametrize("clustered", [False, True], ids=["uniform", "clustered"])
+def test_against_brute_force(norm, clustered):
+    rng = np.random.default_rng(0)
+    if clustered:
+        # A few dense clusters far apart, most of the rings are empty
+        centers = rng.integers(0, 2000, size=(4, 2))
+        points = centers[rng.integers(4, size=600)] + rng.integers(0, 12, size=(600, 2))
+    else:
+        points = rng.integers(0, 60, size=(600, 2))  # Duplicates and ties included
+    grid = PointGrid(points, cell_size=4 if clustered else None)
+    alive = np.ones(len(points), dtype=bool)
+
+    for i in rng.permutation(len(points))[:550].tolist():
+        if rng.random() < 0.2:
+            p = Point2D(*rng.integers(-50, 2100, size=2).tolist())
+            assert list(grid.nearest_in_order(p, norm)) == brute_force(points, alive, p, norm)
+            assert grid.k_nearest(p, 5, norm) == brute_force(points, alive, p, norm)[:5]
+            expected = np.flatnonzero(alive & (norm(p.x - points[:, 0], p.y - points[:, 1]) <= 30))
+            assert np.array_equal(grid.radius(p, 30, norm), expected)
+        grid.remove(i)
+        alive[i] = False
+        assert len(grid) == alive.sum()
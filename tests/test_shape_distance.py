@@ -0,0 +1,44 @@
+import numpy as np
+
+from lib.math_utils import sample_strokes, normalize_shape, hausdorff_distance
+
+
+def test_hausdorff_against_brute_force():
+    rng = np.random.default_rng(0)
+    for n, m in [(1, 1), (1, 7), (128, 128), (3000, 50)]:
+        a = rng.random((n, 2))
+        b = rng.random((m, 2))
+        dist = np.sqrt(((a[:, None] - b[None]) ** 2).sum(axis=2))
+        expected = max(dist.min(axis=1).max(), dist.min(axis=0).max())
+        assert np.isclose(hausdorff_distance(a, b), expected)
+        assert np.isclose(hausdorff_distance(b, a), expected)
+
+
+def test_hausdorff_same_set():
+    a = np.array([[0, 0], [3, 4], [5, 1]])
+    assert hausdorff_distance(a, a[::-1]) == 0
+
+
+def test_normalize_shape():
+    points = normalize_shape(np.array([[10, 20], [50, 30], [30, 25]]))
+    assert np.allclose(points.min(axis=0), [-0.5, -0.125])
+    assert np.allclose(points.max(axis=0), [0.5, 0.125])
+    assert np.allclose(normalize_shape(np.array([[7, 7]])), [[0, 0]])
+
+
+def test_sample_strokes_single_stroke():
+    samples = sample_strokes(np.array([[0, 0], [10, 0], [10, 10]]), [0, 3], 5)
+    assert np.allclose(samples, [[0, 0], [5, 0], [10, 0], [10, 5], [10, 10]])
+
+
+def test_sample_strokes_skips_gaps():
+    # Two strokes of length 10 with a gap of 100 between them
+    coords = np.array([[0, 0], [10, 0], [110, 0], [120, 0]])
+    samples = sample_strokes(coords, [0, 2, 4], 6)
+    assert not np.any((samples[:, 0] > 10) & (samples[:, 0] < 110))
+    assert np.allclose(samples[[0, -1]], [[0, 0], [120, 0]])
+
+
+def test_sample_strokes_zero_length():
+    coords = np.array([[3, 4], [3, 4]])
+    assert np.allclose(sample_strokes(coords, [0, 1, 2], 8), coords)
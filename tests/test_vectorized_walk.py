@@ -0,0 +1,28 @@
+import warnings
+import numpy as np
+import pytest
+
+from lib.math_utils import Point2D, metrics, walk, vectorized_walk
+
+WIDTH, HEIGHT = 24, 16
+
+
+@pytest.mark.parametrize("allow_intersections", [False, True])
+@pytest.mark.parametrize("metric", [metrics.L1Metric(), metrics.L2Metric(),
+                                    metrics.LInfMetric(), metrics.CosMetric()],
+                         ids=lambda metric: metric.name)
+def test_same_as_walk(metric, allow_intersections):
+    rng = np.random.default_rng(0)
+    p_center = Point2D(WIDTH, HEIGHT) // 2
+    metric.p_center = p_center
+    for i in range(10):
+        img = (rng.integers(3, size=(HEIGHT, WIDTH, 1)) * 85).astype(np.uint8).repeat(3, axis=2)
+        p_start = Point2D(*rng.integers((WIDTH, HEIGHT)).tolist())
+        if i % 2 == 0:
+            # Cosine similarity with the center point is undefined
+            img[p_center.y, p_center.x] = img[p_start.y, p_start.x]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            expected = walk(img, p_start, metric, allow_intersections, time_limit=np.inf)
+            assert vectorized_walk(img, p_start, metric, allow_intersections,
+                                   time_limit=np.inf) == expected
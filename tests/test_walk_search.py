@@ -0,0 +1,85 @@
+import cv2
+import importlib
+import numpy as np
+import pytest
+
+from lib.math_utils import Point2D, ColorIndex, metrics, start_walk
+from lib.utils import WalkSearch, search_library
+
+# Modules are shadowed by functions of the same name in `lib.utils`
+open_image = importlib.import_module("lib.utils.open_image")
+walk_search = importlib.import_module("lib.utils.walk_search")
+
+WIDTH, HEIGHT = 32, 24
+PALETTE = np.array([[0, 0, 0], [17, 85, 255], [255, 255, 255], [68, 136, 34]], dtype=np.uint8)
+
+
+@pytest.fixture
+def library(tmp_path, monkeypatch):
+    images_dir = str(tmp_path) + "/"
+    converted_dir = images_dir + "__converted__/"
+    monkeypatch.setattr(open_image, "images_dir", images_dir)
+    monkeypatch.setattr(open_image, "converted_dir", converted_dir)
+    monkeypatch.setattr(walk_search, "images_dir", images_dir)
+    monkeypatch.setattr(walk_search, "converted_dir", converted_dir)
+    monkeypatch.setattr(walk_search, "searches_dir", images_dir + "__searches__/")
+
+    rng = np.random.default_rng(0)
+    (tmp_path / "__converted__").mkdir()
+    images = dict()
+    for i in range(3):
+        img = PALETTE[rng.integers(len(PALETTE), size=(HEIGHT, WIDTH))]
+        cv2.imwrite(converted_dir + f"image{i}.png", img)
+        images[f"image{i}"] = img
+    return images
+
+
+def query_walk(img: np.ndarray, metric: metrics.BaseMetric) -> list:
+    # Walk from the first pixel of a color, the same one the search starts from
+    metric = type(metric)()
+    if metric.name == "cos":
+        metric.p_center = Point2D(img.shape[1], img.shape[0]) // 2
+    x, y = ColorIndex(img)[PALETTE[1]][0].tolist()
+    return start_walk(img, Point2D(x, y), metric).run(np.inf)
+
+
+@pytest.mark.parametrize("metric", [metrics.L2Metric(), metrics.CosMetric()],
+                         ids=lambda metric: metric.name)
+def test_search_finds_and_replays_walk(library, metric):
+    path = query_walk(library["image1"], metric)
+    coords = np.array([p.tuple for p in path])
+    search = WalkSearch("query", [0, len(coords)], coords, metric,
+                        time_limit=10000, top=3)
+
+    failed = search.run(search_library(reload=True), workers=2)
+    assert failed == []
+    assert len(search) == 3
+
+    best = search.results[0]
+    assert best["distance"] < 1e-6
+    imgname, match = search.match(best)
+    assert imgname == "image1"
+    assert match == path
+
+
+def test_search_resumes(library):
+    path = query_walk(library["image0"], metrics.L2Metric())
+    coords = np.array([p.tuple for p in path])
+    images = search_library(reload=True)
+
+    search = WalkSearch("query", [0, len(coords)], coords, top=5)
+    assert search.run(images[:2], workers=1) == []
+
+    resumed = WalkSearch("query", [0, len(coords)], coords, top=5)
+    assert resumed.load()
+    assert resumed.images == ["image0", "image1"]
+    assert resumed.pending(images) == images[2:]
+    assert np.array_equal(resumed.results, search.results)
+
+    assert resumed.run(images, workers=1) == []
+    assert len(resumed) == 3
+    assert len(resumed.results) == 5
+    assert np.all(np.diff(resumed.results["distance"]) >= 0)
+
+    # Other params start a new search
+    assert not WalkSearch("query", [0, len(coords)], coords, top=4).load()